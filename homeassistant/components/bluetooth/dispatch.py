@@ -0,0 +1,164 @@
+"""Deduplicate and rate limit the advertisements dispatched by the manager."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from .match import AdvertisementSignature, advertisement_signature
+from .models import BluetoothServiceInfoBleak
+
+# Advertisements of an address reported by another scanner with the
+# payload dispatched less than this many seconds ago are dropped
+DEDUP_WINDOW: Final = 2.0
+
+# The number of advertisements of an address dispatched per
+# window before the next ones are deferred to the end of the window
+RATE_LIMIT_WINDOW: Final = 1.0
+RATE_LIMIT_DISPATCHES: Final = 10
+
+
+@dataclass(slots=True)
+class _AddressDispatchState:
+    """The advertisements dispatched and deferred for an address."""
+
+    window_start: float
+    dispatches: int = 0
+    # The last dispatched and the deferred advertisement for each signature
+    last: dict[AdvertisementSignature, BluetoothServiceInfoBleak] = field(
+        default_factory=dict
+    )
+    deferred: dict[AdvertisementSignature, BluetoothServiceInfoBleak] = field(
+        default_factory=dict
+    )
+    flush: asyncio.TimerHandle | None = None
+
+
+def _is_echo(
+    service_info: BluetoothServiceInfoBleak, other: BluetoothServiceInfoBleak
+) -> bool:
+    """Return if an advertisement is another scanner reporting the same payload."""
+    return (
+        service_info.source != other.source
+        and service_info.manufacturer_data == other.manufacturer_data
+        and service_info.service_data == other.service_data
+        and service_info.name == other.name
+    )
+
+
+class AdvertisementDispatchFilter:
+    """Drop duplicate advertisements and rate limit the dispatches per address.
+
+    The manager only drops an advertisement that is the same as the last
+    one of the address, so when many remote scanners report a device that
+    rotates between several frames, the same frames are dispatched over
+    and over again. Advertisements are tracked by address and signature,
+    so the last state of every frame is always dispatched.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_dispatch",
+        "_states",
+        "received",
+        "dispatched",
+        "duplicates",
+        "deferred",
+        "superseded",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        dispatch: Callable[[BluetoothServiceInfoBleak], None],
+    ) -> None:
+        """Init the filter."""
+        self._loop = loop
+        self._dispatch = dispatch
+        self._states: dict[str, _AddressDispatchState] = {}
+        self.received = 0
+        self.dispatched = 0
+        self.duplicates = 0
+        self.deferred = 0
+        self.superseded = 0
+
+    def async_process(self, service_info: BluetoothServiceInfoBleak) -> None:
+        """Dispatch, defer or drop an advertisement."""
+        self.received += 1
+        now = service_info.time
+        address = service_info.address
+        signature = advertisement_signature(service_info)
+        if (state := self._states.get(address)) is None:
+            state = self._states[address] = _AddressDispatchState(now)
+        elif (
+            last := state.last.get(signature)
+        ) is not None and now - last.time < DEDUP_WINDOW:
+            if _is_echo(service_info, last):
+                self.duplicates += 1
+                # The last dispatched advertisement is current again
+                if state.deferred.pop(signature, None) is not None:
+                    self.superseded += 1
+                return
+        if now - state.window_start >= RATE_LIMIT_WINDOW and state.flush is None:
+            state.window_start = now
+            state.dispatches = 0
+        if state.dispatches < RATE_LIMIT_DISPATCHES:
+            state.dispatches += 1
+            self._async_dispatch(state, signature, service_info)
+            return
+        self.deferred += 1
+        if state.deferred.get(signature) is not None:
+            self.superseded += 1
+        state.deferred[signature] = service_info
+        if state.flush is None:
+            state.flush = self._loop.call_later(
+                max(state.window_start + RATE_LIMIT_WINDOW - now, 0),
+                self._async_flush,
+                state,
+            )
+
+    def _async_dispatch(
+        self,
+        state: _AddressDispatchState,
+        signature: AdvertisementSignature,
+        service_info: BluetoothServiceInfoBleak,
+    ) -> None:
+        """Dispatch an advertisement."""
+        state.last[signature] = service_info
+        self.dispatched += 1
+        self._dispatch(service_info)
+
+    def _async_flush(self, state: _AddressDispatchState) -> None:
+        """Dispatch the advertisements deferred until the end of the window."""
+        state.flush = None
+        state.window_start += RATE_LIMIT_WINDOW
+        deferred = state.deferred
+        state.deferred = {}
+        state.dispatches = len(deferred)
+        for signature, service_info in deferred.items():
+            self._async_dispatch(state, signature, service_info)
+
+    def async_clear_address(self, address: str) -> None:
+        """Forget an address that disappeared."""
+        if (state := self._states.pop(address, None)) is not None and state.flush:
+            state.flush.cancel()
+
+    def async_stop(self) -> None:
+        """Cancel the deferred dispatches."""
+        for state in self._states.values():
+            if state.flush:
+                state.flush.cancel()
+        self._states.clear()
+
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the counters of the filter."""
+        return {
+            "addresses": len(self._states),
+            "received": self.received,
+            "dispatched": self.dispatched,
+            "duplicates": self.duplicates,
+            "deferred": self.deferred,
+            "superseded": self.superseded,
+        }
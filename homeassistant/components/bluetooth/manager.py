@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -21,6 +22,7 @@ from homeassistant.core import (
 )
 from homeassistant.helpers import discovery_flow
 
+from .dispatch import AdvertisementDispatchFilter
 from .match import (
     ADDRESS,
     CALLBACK,
@@ -46,6 +48,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "storage",
         "_integration_matcher",
         "_callback_index",
+        "_dispatch_filter",
         "_cancel_logging_listener",
     )
 
@@ -62,6 +65,9 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self.storage = storage
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
+        self._dispatch_filter = AdvertisementDispatchFilter(
+            hass.loop, self._async_dispatch_service_info
+        )
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
@@ -94,6 +100,12 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._async_trigger_matching_discovery(service_info)
 
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        self._dispatch_filter.async_process(service_info)
+
+    def _async_dispatch_service_info(
+        self, service_info: BluetoothServiceInfoBleak
+    ) -> None:
+        """Dispatch an advertisement to the callbacks and discovery."""
         matched_domains = self._integration_matcher.match_domains(service_info)
         if self._debug:
             _LOGGER.debug(
@@ -121,6 +133,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
+        self._dispatch_filter.async_clear_address(address)
         for flow in self.hass.config_entries.flow.async_progress_by_init_data_type(
             BluetoothServiceInfoBleak,
             lambda service_info: bool(service_info.address == address),
@@ -192,11 +205,22 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         """Stop the Bluetooth integration at shutdown."""
         _LOGGER.debug("Stopping bluetooth manager")
         self._async_save_scanner_histories()
+        self._dispatch_filter.async_stop()
         super().async_stop()
         if self._cancel_logging_listener:
             self._cancel_logging_listener()
             self._cancel_logging_listener = None
 
+    async def async_diagnostics(self) -> dict[str, Any]:
+        """Diagnostics for the manager."""
+        diagnostics = await super().async_diagnostics()
+        diagnostics["dispatch_filter"] = self._dispatch_filter.async_diagnostics()
+        diagnostics["matcher_cache"] = {
+            "integrations": self._integration_matcher.async_diagnostics(),
+            "callbacks": self._callback_index.async_diagnostics(),
+        }
+        return diagnostics
+
     def _async_save_scanner_histories(self) -> None:
         """Save the scanner histories."""
         for scanner in itertools.chain(
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 
 MAX_REMEMBER_ADDRESSES: Final = 2048
+MAX_CACHED_SIGNATURES: Final = 1024
 
 CALLBACK: Final = "callback"
 DOMAIN: Final = "domain"
@@ -33,6 +34,11 @@ MANUFACTURER_DATA_START: Final = "manufacturer_data_start"
 
 LOCAL_NAME_MIN_MATCH_LENGTH = 3
 
+# manufacturer ids, service data uuids, service uuids, connectable
+type AdvertisementSignature = tuple[
+    tuple[int, ...], tuple[str, ...], tuple[str, ...], bool
+]
+
 
 class BluetoothCallbackMatcherOptional(TypedDict, total=False):
     """Matcher for the bluetooth integration for callback optional fields."""
@@ -116,6 +122,10 @@ class IntegrationMatcher:
         self._matched.pop(address, None)
         self._matched_connectable.pop(address, None)
 
+    def async_diagnostics(self) -> dict[str, int]:
+        """Return the counters of the matcher cache."""
+        return self._index.async_diagnostics()
+
     def match_domains(self, service_info: BluetoothServiceInfoBleak) -> set[str]:
         """Return the domains that are matched."""
         device = service_info.device
@@ -169,6 +179,9 @@ class BluetoothMatcherIndexBase[
         "service_uuid_set",
         "service_data_uuid_set",
         "manufacturer_id_set",
+        "_candidates",
+        "cache_hits",
+        "cache_misses",
     )
 
     def __init__(self) -> None:
@@ -180,6 +193,12 @@ class BluetoothMatcherIndexBase[
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
+        # The matchers in the buckets of the ids of each advertisement signature
+        self._candidates: LRU[AdvertisementSignature, list[_T]] = LRU(
+            MAX_CACHED_SIGNATURES
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def add(self, matcher: _T) -> bool:
         """Add a matcher to the index.
@@ -245,6 +264,46 @@ class BluetoothMatcherIndexBase[
         self.service_uuid_set = set(self.service_uuid)
         self.service_data_uuid_set = set(self.service_data_uuid)
         self.manufacturer_id_set = set(self.manufacturer_id)
+        self._candidates.clear()
+
+    def async_diagnostics(self) -> dict[str, int]:
+        """Return the counters of the matcher cache."""
+        return {
+            "signatures": len(self._candidates),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+
+    def _candidates_for(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
+        """Return the matchers in the buckets of the ids of the advertisement."""
+        signature = advertisement_signature(service_info)
+        if (candidates := self._candidates.get(signature)) is not None:
+            self.cache_hits += 1
+            return candidates
+        self.cache_misses += 1
+        candidates = [
+            matcher
+            for service_data_uuid in self.service_data_uuid_set.intersection(
+                service_info.service_data
+            )
+            for matcher in self.service_data_uuid[service_data_uuid]
+        ]
+        candidates.extend(
+            matcher
+            for manufacturer_id in self.manufacturer_id_set.intersection(
+                service_info.manufacturer_data
+            )
+            for matcher in self.manufacturer_id[manufacturer_id]
+        )
+        candidates.extend(
+            matcher
+            for service_uuid in self.service_uuid_set.intersection(
+                service_info.service_uuids
+            )
+            for matcher in self.service_uuid[service_uuid]
+        )
+        self._candidates[signature] = candidates
+        return candidates
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
@@ -260,33 +319,14 @@ class BluetoothMatcherIndexBase[
                 if ble_device_matches(matcher, service_info)
             )
 
-        if self.service_data_uuid_set and service_info.service_data:
-            matches.extend(
-                matcher
-                for service_data_uuid in self.service_data_uuid_set.intersection(
-                    service_info.service_data
-                )
-                for matcher in self.service_data_uuid[service_data_uuid]
-                if ble_device_matches(matcher, service_info)
-            )
-
-        if self.manufacturer_id_set and service_info.manufacturer_data:
-            matches.extend(
-                matcher
-                for manufacturer_id in self.manufacturer_id_set.intersection(
-                    service_info.manufacturer_data
-                )
-                for matcher in self.manufacturer_id[manufacturer_id]
-                if ble_device_matches(matcher, service_info)
-            )
-
-        if self.service_uuid_set and service_info.service_uuids:
+        if (
+            (self.service_data_uuid_set and service_info.service_data)
+            or (self.manufacturer_id_set and service_info.manufacturer_data)
+            or (self.service_uuid_set and service_info.service_uuids)
+        ):
             matches.extend(
                 matcher
-                for service_uuid in self.service_uuid_set.intersection(
-                    service_info.service_uuids
-                )
-                for matcher in self.service_uuid[service_uuid]
+                for matcher in self._candidates_for(service_info)
                 if ble_device_matches(matcher, service_info)
             )
 
@@ -368,6 +408,18 @@ class BluetoothCallbackMatcherIndex(
         return matches
 
 
+def advertisement_signature(
+    service_info: BluetoothServiceInfoBleak,
+) -> AdvertisementSignature:
+    """Return the ids and connectable flag of an advertisement."""
+    return (
+        tuple(service_info.manufacturer_data),
+        tuple(service_info.service_data),
+        tuple(service_info.service_uuids),
+        service_info.connectable,
+    )
+
+
 def _local_name_to_index_key(local_name: str) -> str:
     """Convert a local name to an index.
 
@@ -8,7 +8,6 @@ from dataclasses import dataclass
 from datetime import timedelta
 from fnmatch import translate
 from functools import lru_cache
-import itertools
 import logging
 import re
 from typing import Any, Final
@@ -58,6 +57,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import DHCPMatcher, async_get_dhcp
+from homeassistant.util.glob_index import GlobIndex
 
 from .const import DOMAIN
 
@@ -88,7 +88,7 @@ class DhcpMatchers:
     """Prepared info from dhcp entries."""
 
     registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
+    no_oui_matchers: GlobIndex[DHCPMatcher]
     oui_matchers: dict[str, list[DHCPMatcher]]
 
 
@@ -100,11 +100,11 @@ def async_index_integration_matchers(
     We have three types of matchers:
 
     1. Registered devices
-    2. Devices with no OUI - index by first char of lower() hostname
+    2. Devices with no OUI - index by hostname pattern
     3. Devices with OUI - index by OUI
     """
     registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    no_oui_matchers: GlobIndex[DHCPMatcher] = GlobIndex()
     oui_matchers: dict[str, list[DHCPMatcher]] = {}
     for matcher in integration_matchers:
         domain = matcher["domain"]
@@ -117,8 +117,7 @@ def async_index_integration_matchers(
             continue
 
         if hostname := matcher.get(HOSTNAME):
-            first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
+            no_oui_matchers.add(hostname, matcher)
 
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
@@ -252,15 +251,11 @@ class WatcherBase:
                 ) and entry.domain in registered_devices_domains:
                     matched_domains.add(entry.domain)
 
-        oui = uppercase_mac[:6]
-        lowercase_hostname_first_char = (
-            lowercase_hostname[0] if len(lowercase_hostname) else ""
-        )
-        for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
-            matchers.oui_matchers.get(oui, ()),
-        ):
-            domain = matcher["domain"]
+        for matcher in matchers.no_oui_matchers.match(lowercase_hostname):
+            _LOGGER.debug("Matched %s against %s", data, matcher)
+            matched_domains.add(matcher["domain"])
+
+        for matcher in matchers.oui_matchers.get(uppercase_mac[:6], ()):
             if (
                 matcher_hostname := matcher.get(HOSTNAME)
             ) is not None and not _memorized_fnmatch(
@@ -269,7 +264,7 @@ class WatcherBase:
                 continue
 
             _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+            matched_domains.add(matcher["domain"])
 
         for domain in matched_domains:
             discovery_flow.async_create_flow(
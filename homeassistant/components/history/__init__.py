@@ -12,7 +12,7 @@ import voluptuous as vol
 from homeassistant.components import frontend
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import query_priority, session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
 import homeassistant.helpers.config_validation as cv
@@ -128,6 +128,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                priority=query_priority(start_time, end_time),
             ),
         )
 
@@ -5,3 +5,12 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of states in a chunk of a chunked response
+MAX_STATES_PER_CHUNK = 1024
+
+# The maximum number of chunks read from the database at a time
+MAX_CHUNKS_PER_PAGE = 4
+
+# The seconds a client has to read a chunk before the response is stopped
+CHUNK_SEND_TIMEOUT = 60
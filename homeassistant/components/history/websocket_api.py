@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import downsample, get_instance, history
+from homeassistant.components.recorder.util import query_priority
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -38,27 +40,239 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
-
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    CHUNK_SEND_TIMEOUT,
+    DOMAIN,
+    EVENT_COALESCE_TIME,
+    MAX_CHUNKS_PER_PAGE,
+    MAX_PENDING_HISTORY_STATES,
+    MAX_STATES_PER_CHUNK,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# entity_ids, whether the unchanged states are filtered, no_attributes
+type _LiveStreamKey = tuple[frozenset[str], bool, bool]
+
+HISTORY_LIVE_STREAMS: HassKey[dict[_LiveStreamKey, HistoryLiveStreamFanout]] = HassKey(
+    f"{DOMAIN}_live_streams"
+)
+
+
 @dataclass(slots=True)
 class HistoryLiveStream:
     """Track a history live stream."""
 
-    stream_queue: asyncio.Queue[Event]
     subscriptions: list[CALLBACK_TYPE]
+    subscriber: HistoryLiveStreamSubscriber | None = None
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
+@dataclass(slots=True)
+class HistoryLiveStreamSubscriber:
+    """A history/stream subscription of a shared live stream."""
+
+    connection: ActiveConnection
+    msg_id_as_bytes: bytes
+    cancel: CALLBACK_TYPE
+    # The states that changed before were sent from the database
+    start_timestamp: float = 0
+    # The messages queued until the historical states are sent
+    pending: list[bytes] | None = field(default_factory=list)
+    pending_states: int = 0
+
+    @callback
+    def async_send(self, partial_message: bytes, states: int) -> None:
+        """Send a message serialized without the id, or queue it."""
+        message = b"".join(
+            (partial_message[:-1], b',"id":', self.msg_id_as_bytes, b"}")
+        )
+        if (pending := self.pending) is None:
+            self.connection.send_message(message)
+            return
+        pending.append(message)
+        self.pending_states += states
+        if self.pending_states > MAX_PENDING_HISTORY_STATES:
+            _LOGGER.debug(
+                "Client exceeded max pending messages of %s",
+                MAX_PENDING_HISTORY_STATES,
+            )
+            self.cancel()
+
+    @callback
+    def async_start_live(self) -> None:
+        """Send the queued messages and the next ones as they come."""
+        if (pending := self.pending) is None:
+            return
+        self.pending = None
+        for message in pending:
+            self.connection.send_message(message)
+
+
+class HistoryLiveStreamFanout:
+    """Share the live stream of identical history/stream subscriptions.
+
+    The state changes are filtered and coalesced once, and each
+    message is serialized once and sent to every subscription, the
+    same way the state diff messages of subscribe_entities are.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_key",
+        "_no_attributes",
+        "_subscribers",
+        "_subscriptions",
+        "_events",
+        "_flush_handle",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: _LiveStreamKey,
+        entity_ids: list[str],
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> None:
+        """Init the live stream and subscribe to the state changes."""
+        self._hass = hass
+        self._key = key
+        self._no_attributes = no_attributes
+        self._subscribers: list[HistoryLiveStreamSubscriber] = []
+        self._subscriptions: list[CALLBACK_TYPE] = []
+        self._events: list[Event] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        _async_subscribe_events(
+            hass,
+            self._subscriptions,
+            self._async_add_event,
+            entity_ids,
+            significant_changes_only,
+            minimal_response,
+        )
+
+    @callback
+    def async_add_subscriber(self, subscriber: HistoryLiveStreamSubscriber) -> None:
+        """Add a subscription to the live stream."""
+        self._subscribers.append(subscriber)
+
+    @callback
+    def async_remove_subscriber(self, subscriber: HistoryLiveStreamSubscriber) -> None:
+        """Remove a subscription and stop when it was the last one."""
+        self._subscribers.remove(subscriber)
+        if self._subscribers:
+            return
+        for subscription in self._subscriptions:
+            subscription()
+        self._subscriptions.clear()
+        self._events.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        del self._hass.data[HISTORY_LIVE_STREAMS][self._key]
+
+    @callback
+    def _async_add_event(self, event: Event) -> None:
+        """Queue a state change to be sent or cancel the subscriptions."""
+        events = self._events
+        events.append(event)
+        if len(events) > MAX_PENDING_HISTORY_STATES:
+            _LOGGER.debug(
+                "Client exceeded max pending messages of %s",
+                MAX_PENDING_HISTORY_STATES,
+            )
+            for subscriber in list(self._subscribers):
+                subscriber.cancel()
+            return
+        # Wait for EVENT_COALESCE_TIME so we can group events
+        # together to minimize the number of websocket messages
+        # when the system is overloaded with an event storm
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(
+                EVENT_COALESCE_TIME, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the queued state changes to the subscriptions."""
+        self._flush_handle = None
+        events = self._events
+        self._events = []
+        first_time_fired_timestamp = events[0].time_fired_timestamp
+        shared_message: bytes | None = None
+        for subscriber in list(self._subscribers):
+            if subscriber.start_timestamp < first_time_fired_timestamp:
+                if shared_message is None:
+                    shared_message = self._partial_message(events)
+                subscriber.async_send(shared_message, len(events))
+                continue
+            # The subscription started while the events were
+            # coalesced, and the older events were sent from
+            # the database
+            if subscriber_events := [
+                event
+                for event in events
+                if event.time_fired_timestamp > subscriber.start_timestamp
+            ]:
+                subscriber.async_send(
+                    self._partial_message(subscriber_events), len(subscriber_events)
+                )
+
+    def _partial_message(self, events: list[Event]) -> bytes:
+        """Serialize the state changes without the message id."""
+        return json_bytes(
+            {
+                "type": "event",
+                "event": {
+                    "states": _events_to_compressed_states(events, self._no_attributes)
+                },
+            }
+        )
+
+
+@callback
+def _async_subscribe_live_stream(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancel: CALLBACK_TYPE,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[HistoryLiveStreamSubscriber, CALLBACK_TYPE]:
+    """Subscribe to the shared live stream of the entities and the options."""
+    key: _LiveStreamKey = (
+        frozenset(entity_ids),
+        significant_changes_only or minimal_response,
+        no_attributes,
+    )
+    live_streams = hass.data[HISTORY_LIVE_STREAMS]
+    if (fanout := live_streams.get(key)) is None:
+        fanout = live_streams[key] = HistoryLiveStreamFanout(
+            hass,
+            key,
+            entity_ids,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    subscriber = HistoryLiveStreamSubscriber(connection, str(msg_id).encode(), cancel)
+    fanout.async_add_subscriber(subscriber)
+    return subscriber, partial(fanout.async_remove_subscriber, subscriber)
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
+    hass.data[HISTORY_LIVE_STREAMS] = {}
     websocket_api.async_register_command(hass, ws_get_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
@@ -94,6 +308,200 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_significant_states_page(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    position: history.SignificantStatesPosition | None,
+) -> tuple[list[bytes], history.SignificantStatesPosition | None]:
+    """Fetch a page of history significant_states and convert the chunks to json.
+
+    Every chunk but the last one of the last page is marked as partial.
+    """
+    chunks, position = history.get_significant_states_page(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        MAX_STATES_PER_CHUNK,
+        MAX_CHUNKS_PER_PAGE,
+        position,
+    )
+    if position is None and not chunks:
+        chunks.append({})
+    last_idx = len(chunks) - 1
+    return [
+        json_bytes(
+            messages.event_message(
+                msg_id,
+                {"states": states}
+                if position is None and idx == last_idx
+                else {"states": states, "partial": True},
+            )
+        )
+        for idx, states in enumerate(chunks)
+    ], position
+
+
+async def _async_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Send history significant_states in chunks as the pages are read.
+
+    The next page is read by the recorder while the chunks of a page
+    are sent, so at most two pages are in memory and the database is
+    not kept waiting for the client to read the chunks.
+    """
+    read_page = partial(
+        get_instance(hass).async_add_executor_job,
+        _ws_get_significant_states_page,
+        hass,
+        msg_id,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        priority=query_priority(start_time, end_time),
+    )
+    chunks, position = await read_page(None)
+    while position is not None:
+        next_page = read_page(position)
+        if not await _async_send_states_chunks(connection, msg_id, chunks):
+            next_page.cancel()
+            return
+        chunks, position = await next_page
+    await _async_send_states_chunks(connection, msg_id, chunks)
+
+
+async def _async_send_states_chunks(
+    connection: ActiveConnection, msg_id: int, chunks: list[bytes]
+) -> bool:
+    """Send chunks of states, each once the client read the previous chunks.
+
+    Returns False if the client unsubscribed, disconnected or did
+    not read a chunk in time, which is sent to the client as an error.
+    """
+    try:
+        for chunk in chunks:
+            async with asyncio.timeout(CHUNK_SEND_TIMEOUT):
+                if not await connection.async_send_stream_message(msg_id, chunk):
+                    return False
+    except TimeoutError:
+        _LOGGER.debug(
+            "Client did not read the history of %s in %s seconds, stopping",
+            msg_id,
+            CHUNK_SEND_TIMEOUT,
+        )
+        connection.send_error(
+            msg_id,
+            websocket_api.ERR_TIMEOUT,
+            f"The history was not read in {CHUNK_SEND_TIMEOUT} seconds",
+        )
+        return False
+    return True
+
+
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    resolution: str,
+    include_start_time_state: bool,
+) -> bytes:
+    """Fetch downsampled states and convert them to json in the executor."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            downsample.get_downsampled_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                resolution,
+                include_start_time_state,
+            ),
+        )
+    )
+
+
+def _ws_get_states_for_max_points(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch at most max_points states per entity and convert them to json.
+
+    The recorded states are returned when they fit, otherwise
+    the downsampled states are returned.
+    """
+    if downsample.states_fit_in_max_points(
+        hass, start_time, end_time, entity_ids, max_points
+    ):
+        return _ws_get_significant_states(
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    return _ws_get_downsampled_states(
+        hass,
+        msg_id,
+        start_time,
+        end_time,
+        entity_ids,
+        downsample.resolution_for_max_points(
+            start_time, end_time or dt_util.utcnow(), max_points
+        ),
+        include_start_time_state,
+    )
+
+
+@callback
+def _async_send_empty_states(connection: ActiveConnection, msg: dict[str, Any]) -> None:
+    """Send an empty history during period response."""
+    if not msg.get("chunked"):
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_event(msg["id"], {"states": {}})
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,6 +512,12 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("resolution", "downsample"): vol.In(
+            downsample.DOWNSAMPLE_RESOLUTIONS
+        ),
+        vol.Exclusive("max_points", "downsample"): vol.All(int, vol.Range(min=1)),
+        # Downsampled states are returned in one message
+        vol.Exclusive("chunked", "downsample"): bool,
     }
 )
 @websocket_api.async_response
@@ -130,7 +544,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_states(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,12 +564,75 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_states(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if "max_points" in msg:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_states_for_max_points,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                msg["max_points"],
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                priority=query_priority(start_time, end_time),
+            )
+        )
+        return
+
+    if (resolution := msg.get("resolution")) is not None:
+        # Long-range graphs read the downsampled states
+        # instead of every state that was recorded
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                resolution,
+                include_start_time_state,
+                priority=query_priority(start_time, end_time),
+            )
+        )
+        return
+
+    if msg.get("chunked"):
+        # The result is sent first, followed by the states in
+        # event messages as they are read from the database.
+        # The client can unsubscribe to stop the response.
+        msg_id: int = msg["id"]
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await _async_send_significant_states_chunks(
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                # The states recorded while the pages are
+                # read are not added to the response
+                end_time or dt_util.utcnow(),
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -168,6 +645,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            priority=query_priority(start_time, end_time),
         )
     )
 
@@ -292,6 +770,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        priority=query_priority(start_time, end_time),
     )
     if payload:
         connection.send_message(payload)
@@ -323,42 +802,6 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    no_attributes: bool,
-) -> None:
-    """Stream events from the queue."""
-    subscriptions_setup_complete_timestamp = (
-        subscriptions_setup_complete_time.timestamp()
-    )
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
-            )
-
-
 @callback
 def _async_subscribe_events(
     hass: HomeAssistant,
@@ -474,10 +917,7 @@ async def ws_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
-    live_stream = HistoryLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    live_stream = HistoryLiveStream(subscriptions=subscriptions)
 
     @callback
     def _unsub(*_utc_time: Any) -> None:
@@ -485,8 +925,6 @@ async def ws_stream(
         for subscription in subscriptions:
             subscription()
         subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
@@ -498,27 +936,20 @@ async def ws_stream(
             hass, _unsub, end_time
         )
 
-    @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_HISTORY_STATES,
-            )
-            _unsub()
-
-    _async_subscribe_events(
+    subscriber, unsub_live_stream = _async_subscribe_live_stream(
         hass,
-        subscriptions,
-        _queue_or_cancel,
+        connection,
+        msg_id,
+        _unsub,
         entity_ids,
-        significant_changes_only=significant_changes_only,
-        minimal_response=minimal_response,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
+    subscriptions.append(unsub_live_stream)
+    live_stream.subscriber = subscriber
     subscriptions_setup_complete_time = dt_util.utcnow()
+    subscriber.start_timestamp = subscriptions_setup_complete_time.timestamp()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -540,15 +971,7 @@ async def ws_stream(
         # Unsubscribe happened while sending historical states
         return
 
-    live_stream.task = create_eager_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            no_attributes,
-        )
-    )
+    subscriber.async_start_live()
 
     live_stream.wait_sync_task = create_eager_task(
         get_instance(hass).async_block_till_done()
@@ -20,6 +20,7 @@ def async_register(
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    state_memory = hass.states.async_memory_usage()
 
     return {
         "version": f"core-{info.get('version')}",
@@ -35,4 +36,5 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "state_memory_per_entity": f"{state_memory['bytes_per_entity']} B",
     }
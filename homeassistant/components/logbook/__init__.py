@@ -45,6 +45,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
 )
+from .index import LogbookIndex
 from .models import LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
@@ -138,7 +139,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    index = LogbookIndex(hass)
+    index.async_start()
+    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter, index)
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -162,5 +165,7 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        if logbook_config.index:
+            logbook_config.index.async_add_event_type(event_name)
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -48,3 +48,12 @@ AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
 # Events that are built-in to the logbook or core
 BUILT_IN_EVENTS = {EVENT_LOGBOOK_ENTRY, EVENT_CALL_SERVICE}
+
+# The maximum number of rows in a chunk of a chunked response
+MAX_ROWS_PER_CHUNK = 1024
+
+# The maximum number of chunks read from the database at a time
+MAX_CHUNKS_PER_PAGE = 4
+
+# The seconds a client has to read a chunk before the response is stopped
+CHUNK_SEND_TIMEOUT = 60
@@ -0,0 +1,255 @@
+"""Index of the recent logbook rows."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from heapq import merge
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+import homeassistant.util.dt as dt_util
+from homeassistant.util.event_type import EventType
+
+from .const import BUILT_IN_EVENTS
+from .helpers import _is_state_filtered, extract_attr
+from .models import EventAsRow, async_event_to_row
+
+# The maximum number of rows in the index
+MAX_INDEXED_ROWS = 4096
+
+_row_time = attrgetter("time_fired_ts")
+
+
+class LogbookIndex:
+    """A size bounded index of the recent logbook rows.
+
+    The rows are converted from the events the live logbook stream
+    listens to, and are indexed by entity_id and context_id, so the
+    logbook can be returned for a recent period without querying the
+    database. Only the events the recorder records are indexed, so
+    every row after start_ts is in the index and in the database.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_rows: int = MAX_INDEXED_ROWS) -> None:
+        """Init the index."""
+        self._hass = hass
+        self._max_rows = max_rows
+        self._rows: deque[EventAsRow] = deque()
+        # The rows of the events that are not state changes
+        self._event_rows: deque[EventAsRow] = deque()
+        self._entity_rows: dict[str, deque[EventAsRow]] = {}
+        self._context_rows: dict[bytes, deque[EventAsRow]] = {}
+        self._event_types: set[EventType[Any] | str] = set()
+        self._subscriptions: list[CALLBACK_TYPE] = []
+        self._recorder_entity_filter: Callable[[str], bool] | None = None
+        self._recorder_exclude_event_types: set[EventType[Any] | str] = set()
+        if (instance := hass.data.get(DATA_INSTANCE)) is not None:
+            self._recorder_entity_filter = instance.entity_filter
+            self._recorder_exclude_event_types = instance.exclude_event_types
+        self.start_ts = dt_util.utcnow().timestamp()
+
+    @callback
+    def async_start(self) -> None:
+        """Start indexing the state changes and the built-in events."""
+        self._subscriptions.append(
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_add_state_changed_event
+            )
+        )
+        for event_type in BUILT_IN_EVENTS:
+            self.async_add_event_type(event_type)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop indexing the events."""
+        for subscription in self._subscriptions:
+            subscription()
+        self._subscriptions.clear()
+        self._event_types.clear()
+
+    @callback
+    def async_add_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Start indexing an event type.
+
+        The events of the type that were fired before are not in the
+        index, so only the rows after now can be returned.
+        """
+        if event_type in self._event_types:
+            return
+        self._event_types.add(event_type)
+        self._subscriptions.append(
+            self._hass.bus.async_listen(event_type, self._async_add_event)
+        )
+        self.start_ts = dt_util.utcnow().timestamp()
+
+    @callback
+    def _async_add_state_changed_event(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Add a state change to the index if the logbook shows it."""
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if not _is_state_filtered(new_state, old_state):
+            self._async_add_event(event)
+
+    @callback
+    def _async_is_recorded(self, event: Event[Any]) -> bool:
+        """Check if the recorder records an event."""
+        if event.event_type in self._recorder_exclude_event_types:
+            return False
+        if (entity_filter := self._recorder_entity_filter) is None or (
+            entity_id := event.data.get(ATTR_ENTITY_ID)
+        ) is None:
+            return True
+        if isinstance(entity_id, str):
+            return entity_filter(entity_id)
+        if isinstance(entity_id, list):
+            return any(entity_filter(eid) for eid in entity_id)
+        return True
+
+    @callback
+    def _async_add_event(self, event: Event[Any]) -> None:
+        """Add an event to the index if the recorder records it."""
+        if not self._async_is_recorded(event):
+            return
+        row = async_event_to_row(event)
+        self._rows.append(row)
+        if (entity_id := row.entity_id) is None:
+            self._event_rows.append(row)
+        elif (entity_rows := self._entity_rows.get(entity_id)) is None:
+            self._entity_rows[entity_id] = deque((row,))
+        else:
+            entity_rows.append(row)
+        if (context_rows := self._context_rows.get(row.context_id_bin)) is None:
+            self._context_rows[row.context_id_bin] = deque((row,))
+        else:
+            context_rows.append(row)
+        if len(self._rows) > self._max_rows:
+            self._async_evict()
+
+    @callback
+    def _async_evict(self) -> None:
+        """Remove the oldest row from the index."""
+        row = self._rows.popleft()
+        # Rows are only returned for periods that start after the row
+        self.start_ts = max(self.start_ts, row.time_fired_ts)
+        if (entity_id := row.entity_id) is None:
+            self._event_rows.popleft()
+        else:
+            entity_rows = self._entity_rows[entity_id]
+            entity_rows.popleft()
+            if not entity_rows:
+                del self._entity_rows[entity_id]
+        context_rows = self._context_rows[row.context_id_bin]
+        context_rows.popleft()
+        if not context_rows:
+            del self._context_rows[row.context_id_bin]
+
+    @callback
+    def async_get_context_row(self, context_id_bin: bytes) -> EventAsRow | None:
+        """Return the first row of a context."""
+        if context_rows := self._context_rows.get(context_id_bin):
+            return context_rows[0]
+        return None
+
+    @callback
+    def async_get_rows(
+        self,
+        start_day: float,
+        end_day: float,
+        event_types: tuple[EventType[Any] | str, ...],
+        entities_filter: Callable[[str], bool] | None,
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+        context_id_bin: bytes | None,
+    ) -> list[EventAsRow] | None:
+        """Return the rows of a logbook request.
+
+        Returns None if the period starts before the rows in the index.
+        The rows are filtered the same way as the events of the live
+        logbook stream.
+        """
+        if start_day < self.start_ts:
+            return None
+        rows: Iterable[EventAsRow]
+        if context_id_bin is not None:
+            rows = self._context_rows.get(context_id_bin, ())
+        elif entity_ids:
+            rows = merge(
+                self._event_rows,
+                *(
+                    entity_rows
+                    for entity_id in entity_ids
+                    if (entity_rows := self._entity_rows.get(entity_id))
+                ),
+                key=_row_time,
+            )
+        elif device_ids:
+            rows = self._event_rows
+        else:
+            rows = self._rows
+        matches_row = _row_matcher(
+            event_types,
+            entities_filter if context_id_bin is None else None,
+            entity_ids,
+            device_ids,
+        )
+        return [
+            row
+            for row in rows
+            if start_day < row.time_fired_ts < end_day and matches_row(row)
+        ]
+
+
+def _row_matcher(
+    event_types: tuple[EventType[Any] | str, ...],
+    entities_filter: Callable[[str], bool] | None,
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+) -> Callable[[EventAsRow], bool]:
+    """Make a callable to filter the rows of a logbook request."""
+    event_types_set = set(event_types)
+    entity_ids_set = set(entity_ids) if entity_ids else set()
+    device_ids_set = set(device_ids) if device_ids else set()
+
+    def _matches_row(row: EventAsRow) -> bool:
+        if (entity_id := row.entity_id) is not None:
+            # The state changes of the requested entity_ids
+            # were already selected by entity_id
+            return not entities_filter or entities_filter(entity_id)
+        if row.event_type not in event_types_set:
+            return False
+        event_data = row.data
+        if entities_filter:
+            row_entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
+            if row_entity_ids and not any(
+                entities_filter(row_entity_id) for row_entity_id in row_entity_ids
+            ):
+                return False
+            domain = event_data.get(ATTR_DOMAIN)
+            return not domain or entities_filter(f"{domain}._")
+        if not entity_ids_set and not device_ids_set:
+            return True
+        return bool(
+            entity_ids_set.intersection(extract_attr(event_data, ATTR_ENTITY_ID))
+            or device_ids_set.intersection(extract_attr(event_data, ATTR_DEVICE_ID))
+        )
+
+    return _matches_row
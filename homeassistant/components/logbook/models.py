@@ -22,6 +22,9 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .index import LogbookIndex
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +36,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    index: LogbookIndex | None = None
 
 
 class LazyEventPartialState:
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 from typing import Any
 
+from sqlalchemy import CompoundSelect, Select, select
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from typing_extensions import Generator
 
 from homeassistant.components.recorder import get_instance
@@ -21,6 +26,7 @@ from homeassistant.components.recorder.models import (
     extract_metadata_ids,
     process_datetime_to_timestamp,
     process_timestamp_to_utc_isoformat,
+    ulid_to_bytes_or_none,
 )
 from homeassistant.components.recorder.util import (
     execute_stmt_lambda_element,
@@ -64,12 +70,16 @@ from .const import (
     LOGBOOK_ENTRY_WHEN,
 )
 from .helpers import is_sensor_continuous
+from .index import LogbookIndex
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum number of contexts kept to augment the events of a streamed request
+MAX_CONTEXT_LOOKUP = 16384
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -87,6 +97,15 @@ class LogbookRun:
     memoize_new_contexts: bool = True
 
 
+@dataclass(slots=True)
+class EventsPosition:
+    """The position a page of events continues from."""
+
+    time_fired_ts: float
+    # The rows read with the time_fired_ts
+    last_rows: Counter[Row]
+
+
 class EventProcessor:
     """Stream into logbook format."""
 
@@ -112,6 +131,8 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.entities_filter = logbook_config.entity_filter
+        self.index: LogbookIndex | None = logbook_config.index
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -146,35 +167,144 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self.humanify(
+                execute_stmt_lambda_element(
+                    session,
+                    self._statement_for_request(session, start_day, end_day),
+                    orm_rows=False,
                 )
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        chunk_size: int,
+        max_chunks: int,
+        position: EventsPosition | None,
+    ) -> tuple[list[list[dict[str, Any]]], EventsPosition | None]:
+        """Get a page of the events for a period of time in chunks.
+
+        Each chunk holds the events of at most chunk_size rows, and a page
+        holds at most max_chunks chunks. A page is read in its own session
+        and continues from the position the previous page returned, so no
+        cursor or transaction is kept open between the pages. Only the
+        most recent contexts are kept to augment the events, so the memory
+        used does not grow with the period.
+
+        Returns the chunks and the position of the next page, or None
+        once every row was read.
+        """
+        logbook_run = self.logbook_run
+        read_rows: Counter[Row] = position.last_rows if position else Counter()
+        # One more row is read to know if there is a next page
+        limit = chunk_size * max_chunks + read_rows.total() + 1
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            if position is not None:
+                time_fired_ts = position.time_fired_ts
+                stmt += lambda s: _select_rows_from(s, time_fired_ts)
+            stmt += lambda s: s.limit(limit)
+            rows = list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+        if has_next_page := len(rows) == limit:
+            del rows[-1]
+        # The page starts with the rows of the time of the last row of
+        # the previous page, the ones that were already read are left out
+        unread_rows = rows
+        if read_rows:
+            read_rows = read_rows.copy()
+            unread_rows = []
+            for row in rows:
+                if read_rows[row]:
+                    read_rows[row] -= 1
+                else:
+                    unread_rows.append(row)
+        chunks: list[list[dict[str, Any]]] = []
+        for idx in range(0, len(unread_rows), chunk_size):
+            if events := self.humanify(unread_rows[idx : idx + chunk_size]):
+                chunks.append(events)
+            logbook_run.event_cache.clear()
+            _trim_context_lookup(logbook_run.context_lookup)
+        if not has_next_page or not rows:
+            return chunks, None
+        last_time_fired_ts = rows[-1].time_fired_ts
+        last_rows: Counter[Row] = Counter()
+        for row in reversed(rows):
+            if row.time_fired_ts != last_time_fired_ts:
+                break
+            last_rows[row] += 1
+        return chunks, EventsPosition(last_time_fired_ts, last_rows)
+
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Return the statement of the events for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
+    def async_in_index(self, start_day: dt) -> bool:
+        """Check if the events after start_day are in the index of the recent rows."""
+        return self.index is not None and start_day.timestamp() >= self.index.start_ts
+
+    def async_get_events_from_index(
+        self, start_day: dt, end_day: dt
+    ) -> list[dict[str, Any]] | None:
+        """Get events for a period of time from the index of the recent rows.
+
+        Returns None if the period is not in the index.
+        """
+        if (
+            self.index is None
+            or (
+                rows := self.index.async_get_rows(
+                    start_day.timestamp(),
+                    end_day.timestamp(),
+                    self.event_types,
+                    None if self.limited_select else self.entities_filter,
+                    self.entity_ids,
+                    self.device_ids,
+                    ulid_to_bytes_or_none(self.context_id),
+                )
+            )
+            is None
+        ):
+            return None
+        # The rows that started the contexts of the rows are
+        # looked up in the index instead of the database
+        context_lookup = self.logbook_run.context_lookup
+        for row in rows:
+            for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+                if (
+                    context_id_bin is not None
+                    and context_id_bin not in context_lookup
+                    and (
+                        context_row := self.index.async_get_context_row(context_id_bin)
+                    )
+                ):
+                    context_lookup[context_id_bin] = context_row
+        return self.humanify(rows)
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self, rows: Generator[EventAsRow] | Sequence[Row | EventAsRow] | Result
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -188,9 +318,29 @@ class EventProcessor:
         )
 
 
+def _select_rows_from(stmt: Select | CompoundSelect, time_fired_ts: float) -> Select:
+    """Select the rows of the statement fired from a time."""
+    subquery = stmt.order_by(None).subquery()
+    return (
+        select(subquery)
+        .where(subquery.c.time_fired_ts >= time_fired_ts)
+        .order_by(subquery.c.time_fired_ts)
+    )
+
+
+def _trim_context_lookup(
+    context_lookup: dict[bytes | None, Row | EventAsRow | None],
+) -> None:
+    """Remove the oldest contexts when the lookup is full."""
+    if (excess := len(context_lookup) - MAX_CONTEXT_LOOKUP) > 0:
+        for context_id_bin in list(islice(context_lookup, excess)):
+            del context_lookup[context_id_bin]
+        context_lookup[None] = None
+
+
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Sequence[Row | EventAsRow] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
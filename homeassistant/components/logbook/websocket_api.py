@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any
 
@@ -13,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.util import query_priority
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
@@ -21,14 +23,14 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
+from .const import CHUNK_SEND_TIMEOUT, DOMAIN, MAX_CHUNKS_PER_PAGE, MAX_ROWS_PER_CHUNK
 from .helpers import (
     async_determine_event_types,
     async_filter_entities,
     async_subscribe_events,
 )
 from .models import LogbookConfig, async_event_to_row
-from .processor import EventProcessor
+from .processor import EventProcessor, EventsPosition
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -97,6 +99,18 @@ async def _async_send_historical_events(
     This function returns the time of the most recent event we sent to the
     websocket.
     """
+    if (
+        events := event_processor.async_get_events_from_index(start_time, end_time)
+    ) is not None:
+        # All the events are in the index so there is no
+        # need to split the request
+        message, last_event_time = _ws_stream_events_message(
+            msg_id, events, start_time, end_time, formatter, partial
+        )
+        if last_event_time or not partial or force_send:
+            connection.send_message(message)
+        return last_event_time
+
     is_big_query = (
         not event_processor.entity_ids
         and not event_processor.device_ids
@@ -177,6 +191,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        priority=query_priority(start_time, end_time),
     )
 
 
@@ -200,7 +215,25 @@ def _ws_stream_get_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    return _ws_stream_events_message(
+        msg_id,
+        event_processor.get_events(start_day, end_day),
+        start_day,
+        end_day,
+        formatter,
+        partial,
+    )
+
+
+def _ws_stream_events_message(
+    msg_id: int,
+    events: list[dict[str, Any]],
+    start_day: dt,
+    end_day: dt,
+    formatter: Callable[[int, Any], dict[str, Any]],
+    partial: bool,
+) -> tuple[bytes, dt | None]:
+    """Convert events to json."""
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
@@ -409,10 +442,11 @@ async def ws_event_stream(
         )
     )
 
-    live_stream.wait_sync_task = create_eager_task(
-        get_instance(hass).async_block_till_done()
-    )
-    await live_stream.wait_sync_task
+    if not event_processor.async_in_index(start_time):
+        live_stream.wait_sync_task = create_eager_task(
+            get_instance(hass).async_block_till_done()
+        )
+        await live_stream.wait_sync_task
 
     #
     # Fetch any events from the database that have
@@ -452,6 +486,111 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    position: EventsPosition | None,
+) -> tuple[list[bytes], EventsPosition | None]:
+    """Fetch a page of events and convert the chunks to json in the executor.
+
+    Every chunk but the last one of the last page is marked as partial.
+    """
+    chunks, position = event_processor.get_events_page(
+        start_time, end_time, MAX_ROWS_PER_CHUNK, MAX_CHUNKS_PER_PAGE, position
+    )
+    if position is None and not chunks:
+        chunks.append([])
+    last_idx = len(chunks) - 1
+    return [
+        json_bytes(
+            messages.event_message(
+                msg_id,
+                {"events": events}
+                if position is None and idx == last_idx
+                else {"events": events, "partial": True},
+            )
+        )
+        for idx, events in enumerate(chunks)
+    ], position
+
+
+async def _async_send_get_events_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+) -> None:
+    """Send events in chunks as the pages are read.
+
+    The next page is read by the recorder while the chunks of a page
+    are sent, so at most two pages are in memory and the database is
+    not kept waiting for the client to read the chunks.
+    """
+    read_page = partial(
+        get_instance(hass).async_add_executor_job,
+        _ws_get_events_page,
+        msg_id,
+        start_time,
+        end_time,
+        event_processor,
+        priority=query_priority(start_time, end_time),
+    )
+    chunks, position = await read_page(None)
+    while position is not None:
+        next_page = read_page(position)
+        if not await _async_send_events_chunks(connection, msg_id, chunks):
+            next_page.cancel()
+            return
+        chunks, position = await next_page
+    await _async_send_events_chunks(connection, msg_id, chunks)
+
+
+async def _async_send_events_chunks(
+    connection: ActiveConnection, msg_id: int, chunks: list[bytes]
+) -> bool:
+    """Send chunks of events, each once the client read the previous chunks.
+
+    Returns False if the client unsubscribed, disconnected or did
+    not read a chunk in time, which is sent to the client as an error.
+    """
+    try:
+        for chunk in chunks:
+            async with asyncio.timeout(CHUNK_SEND_TIMEOUT):
+                if not await connection.async_send_stream_message(msg_id, chunk):
+                    return False
+    except TimeoutError:
+        _LOGGER.debug(
+            "Client did not read the events of %s in %s seconds, stopping",
+            msg_id,
+            CHUNK_SEND_TIMEOUT,
+        )
+        connection.send_error(
+            msg_id,
+            websocket_api.ERR_TIMEOUT,
+            f"The events were not read in {CHUNK_SEND_TIMEOUT} seconds",
+        )
+        return False
+    return True
+
+
+@callback
+def _async_send_events(
+    connection: ActiveConnection, msg: dict[str, Any], events: list[dict[str, Any]]
+) -> None:
+    """Send the events of a logbook get events request in one message."""
+    if not msg["chunked"]:
+        connection.send_message(json_bytes(messages.result_message(msg["id"], events)))
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(
+        json_bytes(messages.event_message(msg["id"], {"events": events}))
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -460,6 +599,7 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -486,7 +626,7 @@ async def ws_get_events(
         return
 
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        _async_send_events(connection, msg, [])
         return
 
     device_ids = msg.get("device_ids")
@@ -496,7 +636,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            _async_send_events(connection, msg, [])
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -511,6 +651,27 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if (
+        events := event_processor.async_get_events_from_index(start_time, end_time)
+    ) is not None:
+        _async_send_events(connection, msg, events)
+        return
+
+    if msg["chunked"]:
+        # The result is sent first, followed by the events in
+        # event messages as they are read from the database.
+        # The client can unsubscribe to stop the response.
+        msg_id: int = msg["id"]
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await _async_send_get_events_chunks(
+                hass, connection, msg_id, start_time, end_time, event_processor
+            )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -518,5 +679,6 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            priority=query_priority(start_time, end_time),
         )
     )
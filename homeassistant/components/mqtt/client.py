@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -208,6 +208,7 @@ def async_subscribe_internal(
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
     job_type: HassJobType | None = None,
+    coalesce_window: float | None = None,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
@@ -235,7 +236,16 @@ def async_subscribe_internal(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         )
-    return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
+    if coalesce_window is None:
+        return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
+    return client.async_subscribe(
+        topic,
+        msg_callback,
+        qos,
+        encoding,
+        job_type,
+        coalesce_window=coalesce_window,
+    )
 
 
 @bind_hass
@@ -268,10 +278,178 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    # The time in seconds the messages are coalesced, None to not coalesce
+    coalesce_window: float | None = None
+
+
+class SubscriptionCoalescer:
+    """Coalesce the messages of a subscription, the last message wins.
+
+    The last message of each topic received during the coalesce window
+    is dispatched when the window ends, so a wildcard subscription gets
+    the last message of every topic that matched. With a window of 0
+    the messages read from the socket together are coalesced.
+    """
+
+    __slots__ = (
+        "_client",
+        "_subscription",
+        "_pending",
+        "_handle",
+        "received",
+        "dispatched",
+        "total_delay",
+        "max_delay",
+    )
+
+    def __init__(self, client: MQTT, subscription: Subscription) -> None:
+        """Initialize the coalescer."""
+        self._client = client
+        self._subscription = subscription
+        # The pending message of each topic and the time it started pending
+        self._pending: dict[str, tuple[ReceiveMessage, float]] = {}
+        self._handle: asyncio.Handle | None = None
+        self.received = 0
+        self.dispatched = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+
+    @callback
+    def async_add(self, msg: ReceiveMessage) -> None:
+        """Add a message, replacing the message of its topic that is pending."""
+        self.received += 1
+        if (pending := self._pending.get(msg.topic)) is not None:
+            self._pending[msg.topic] = (msg, pending[1])
+            return
+        self._pending[msg.topic] = (msg, time.monotonic())
+        if self._handle is None:
+            loop = self._client.loop
+            if window := self._subscription.coalesce_window:
+                self._handle = loop.call_later(window, self._async_dispatch)
+            else:
+                self._handle = loop.call_soon(self._async_dispatch)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending messages."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Dispatch the pending messages."""
+        pending = self._pending
+        self._pending = {}
+        self._handle = None
+        now = time.monotonic()
+        for msg, pending_since in pending.values():
+            delay = now - pending_since
+            self.dispatched += 1
+            self.total_delay += delay
+            self.max_delay = max(self.max_delay, delay)
+            self._client.async_dispatch_message(self._subscription, msg)
+
+
+class _TopicNode:
+    """A level of the subscription topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Match topics to the wildcard subscriptions.
+
+    The subscriptions are stored by the levels of their topic filter,
+    so a topic is matched in a number of steps proportional to its
+    number of levels, and the trie only grows with the subscriptions.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and the levels that are no longer used.
+
+        Raises KeyError if the subscription was not added.
+        """
+        path = [(self._root, "")]
+        node = self._root
+        for level in subscription.topic.split("/"):
+            node = node.children[level]
+            path.append((node, level))
+        node.subscriptions.remove(subscription)
+        for idx in range(len(path) - 1, 0, -1):
+            node, level = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1][0].children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there are subscriptions with the topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        subscriptions: list[Subscription] = []
+        nodes = [self._root]
+        # Wildcards at the first level do not match topics starting with $
+        match_wildcards = not topic.startswith("$")
+        for level in topic.split("/"):
+            next_nodes: list[_TopicNode] = []
+            for node in nodes:
+                children = node.children
+                if match_wildcards:
+                    if (multi_level := children.get("#")) is not None:
+                        subscriptions.extend(multi_level.subscriptions)
+                    if (single_level := children.get("+")) is not None:
+                        next_nodes.append(single_level)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                return subscriptions
+            nodes = next_nodes
+            match_wildcards = True
+        for node in nodes:
+            subscriptions.extend(node.subscriptions)
+            # A multi-level wildcard also matches its parent level
+            if (multi_level := node.children.get("#")) is not None:
+                subscriptions.extend(multi_level.subscriptions)
+        return subscriptions
 
 
 class MqttClientSetup:
@@ -474,7 +652,8 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = SubscriptionTrie()
+        self._coalescers: dict[Subscription, SubscriptionCoalescer] = {}
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -722,8 +901,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -833,28 +1012,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+        if subscription.coalesce_window is not None:
+            self._coalescers[subscription] = SubscriptionCoalescer(self, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -867,6 +1043,8 @@ class MQTT:
                 self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
+        if (coalescer := self._coalescers.pop(subscription, None)) is not None:
+            coalescer.async_cancel()
 
     @callback
     def _async_queue_subscriptions(
@@ -909,8 +1087,13 @@ class MQTT:
         qos: int,
         encoding: str | None = None,
         job_type: HassJobType | None = None,
+        coalesce_window: float | None = None,
     ) -> Callable[[], None]:
-        """Set up a subscription to a topic with the provided qos."""
+        """Set up a subscription to a topic with the provided qos.
+
+        If a coalesce window is set, only the last message received
+        during the window is passed to the callback.
+        """
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
@@ -927,11 +1110,11 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(
+            topic, is_simple_match, job, qos, encoding, coalesce_window
+        )
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -943,7 +1126,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1128,19 +1310,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
-        return subscriptions
+            return [
+                *self._simple_subscriptions[topic],
+                *self._wildcard_subscriptions.match(topic),
+            ]
+        return self._wildcard_subscriptions.match(topic)
 
     @callback
     def _async_mqtt_on_message(
@@ -1210,6 +1386,9 @@ class MQTT:
                 msg_cache_by_subscription_topic[subscription_topic] = receive_msg
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+            if subscription.coalesce_window is not None:
+                self._coalescers[subscription].async_add(receive_msg)
+                continue
             job = subscription.job
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
@@ -1224,6 +1403,49 @@ class MQTT:
                 self.hass.async_run_hass_job(job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def async_dispatch_message(
+        self, subscription: Subscription, receive_msg: ReceiveMessage
+    ) -> None:
+        """Dispatch a coalesced message to a subscription."""
+        job = subscription.job
+        if job.job_type is HassJobType.Callback:
+            try:
+                job.target(receive_msg)
+            except Exception:  # noqa: BLE001
+                log_exception(partial(self._exception_message, job.target, receive_msg))
+        else:
+            self.hass.async_run_hass_job(job, receive_msg)
+        self._mqtt_data.state_write_requests.process_write_state_requests(receive_msg)
+
+    @callback
+    def async_coalesce_info(self, topic: str) -> dict[str, Any] | None:
+        """Return the coalescing statistics of the subscriptions to a topic.
+
+        Returns None if the subscriptions to the topic are not coalesced.
+        """
+        subscriptions = [
+            subscription
+            for subscription in self._coalescers
+            if subscription.topic == topic
+        ]
+        if not subscriptions:
+            return None
+        coalescers = [self._coalescers[subscription] for subscription in subscriptions]
+        dispatched = sum(coalescer.dispatched for coalescer in coalescers)
+        return {
+            "window": max(
+                subscription.coalesce_window or 0.0 for subscription in subscriptions
+            ),
+            "received": sum(coalescer.received for coalescer in coalescers),
+            "dispatched": dispatched,
+            "mean_delay": sum(coalescer.total_delay for coalescer in coalescers)
+            / dispatched
+            if dispatched
+            else 0.0,
+            "max_delay": max(coalescer.max_delay for coalescer in coalescers),
+        }
+
     @callback
     def _async_mqtt_on_callback(
         self,
@@ -1330,13 +1552,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -142,9 +142,10 @@ def remove_trigger_discovery_data(
 
 
 def _info_for_entity(hass: HomeAssistant, entity_id: str) -> dict[str, Any]:
-    entity_info = hass.data[DATA_MQTT].debug_info_entities[entity_id]
+    mqtt_data = hass.data[DATA_MQTT]
+    entity_info = mqtt_data.debug_info_entities[entity_id]
     monotonic_time_diff = time.time() - time.monotonic()
-    subscriptions = [
+    subscriptions: list[dict[str, Any]] = [
         {
             "topic": topic,
             "messages": [
@@ -163,6 +164,12 @@ def _info_for_entity(hass: HomeAssistant, entity_id: str) -> dict[str, Any]:
         }
         for topic, subscription in entity_info["subscriptions"].items()
     ]
+    for subscription_info in subscriptions:
+        # Show how many messages were coalesced and how long they were held
+        if coalesce_info := mqtt_data.client.async_coalesce_info(
+            subscription_info["topic"]
+        ):
+            subscription_info["coalescing"] = coalesce_info
     transmitted = [
         {
             "topic": topic,
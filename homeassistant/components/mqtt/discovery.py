@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from enum import Enum
 import functools
+import hashlib
 import logging
 import re
+import sys
 import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DEVICE, CONF_PLATFORM
+from homeassistant.const import CONF_DEVICE, CONF_PLATFORM, __version__
 from homeassistant.core import HassJobType, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResultType
 import homeassistant.helpers.config_validation as cv
@@ -20,7 +23,9 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_send,
 )
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
-from homeassistant.helpers.typing import DiscoveryInfoType
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
 from homeassistant.util.signal_type import SignalTypeFormat
@@ -64,11 +69,149 @@ MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
 
 TOPIC_BASE = "~"
 
+DISCOVERY_CACHE_STORAGE_KEY = f"{DOMAIN}.discovery_cache"
+DISCOVERY_CACHE_STORAGE_VERSION = 1
+DISCOVERY_CACHE_SAVE_DELAY = 60
+
+# Markers of the values of a cached config that are not JSON types
+_CACHED_TEMPLATE = "__mqtt_template__"
+_CACHED_ENUM = "__mqtt_enum__"
+
 
 class MQTTDiscoveryPayload(dict[str, Any]):
     """Class to hold and MQTT discovery payload and discovery data."""
 
     discovery_data: DiscoveryInfoType
+    # The hash of the received payload, used to look up the cached config
+    payload_hash: str
+
+
+class _NotCacheableError(Exception):
+    """Raised when a validated config can not be stored."""
+
+
+def _encode_config_value(value: Any) -> Any:
+    """Encode a validated config value to a JSON type."""
+    value_type = type(value)
+    if value is None or value_type in (str, int, float, bool):
+        return value
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise _NotCacheableError
+        return {key: _encode_config_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode_config_value(item) for item in value]
+    if value_type is Template:
+        return {_CACHED_TEMPLATE: value.template}
+    if isinstance(value, Enum):
+        return {
+            _CACHED_ENUM: f"{value_type.__module__}:{value_type.__qualname__}",
+            "value": value.value,
+        }
+    raise _NotCacheableError
+
+
+def _decode_config_value(hass: HomeAssistant, value: Any) -> Any:
+    """Decode a cached config value.
+
+    Raises _NotCacheableError if an enum is no longer defined.
+    """
+    if isinstance(value, list):
+        return [_decode_config_value(hass, item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if _CACHED_TEMPLATE in value:
+        return Template(value[_CACHED_TEMPLATE], hass)
+    if _CACHED_ENUM in value:
+        module_name, _, enum_name = value[_CACHED_ENUM].partition(":")
+        # The enums of the schemas are imported with the platforms
+        if (module := sys.modules.get(module_name)) is None or not isinstance(
+            enum_class := getattr(module, enum_name, None), type
+        ):
+            raise _NotCacheableError
+        try:
+            return enum_class(value["value"])
+        except ValueError as err:
+            raise _NotCacheableError from err
+    return {key: _decode_config_value(hass, item) for key, item in value.items()}
+
+
+class MqttDiscoveryCache:
+    """Persistent cache of the validated configs of discovered entities.
+
+    The configs are stored by discovery topic with the hash of the
+    payload they were validated from, so the entities of the retained
+    discovery payloads that did not change are set up without validating
+    the payload again after a restart. The cache is dropped when Home
+    Assistant is updated as the schemas may have changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, DISCOVERY_CACHE_STORAGE_VERSION, DISCOVERY_CACHE_STORAGE_KEY
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache of the current version."""
+        if (data := await self._store.async_load()) and data["version"] == __version__:
+            self._entries = data["entries"]
+
+    async def async_save(self) -> None:
+        """Store the cache."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"version": __version__, "entries": self._entries}
+
+    @callback
+    def async_get(
+        self, domain: str, discovery_payload: MQTTDiscoveryPayload
+    ) -> ConfigType | None:
+        """Return the cached config of a discovery payload."""
+        topic = discovery_payload.discovery_data[ATTR_DISCOVERY_TOPIC]
+        if (
+            (entry := self._entries.get(topic)) is None
+            or entry["domain"] != domain
+            or entry["hash"] != getattr(discovery_payload, "payload_hash", None)
+        ):
+            return None
+        try:
+            config: ConfigType = _decode_config_value(self._hass, entry["config"])
+        except _NotCacheableError:
+            self.async_remove(topic)
+            return None
+        return config
+
+    @callback
+    def async_set(
+        self, domain: str, discovery_payload: MQTTDiscoveryPayload, config: ConfigType
+    ) -> None:
+        """Cache the validated config of a discovery payload."""
+        topic = discovery_payload.discovery_data[ATTR_DISCOVERY_TOPIC]
+        if (payload_hash := getattr(discovery_payload, "payload_hash", None)) is None:
+            return
+        try:
+            encoded_config = _encode_config_value(config)
+        except _NotCacheableError:
+            self.async_remove(topic)
+            return
+        self._entries[topic] = {
+            "domain": domain,
+            "hash": payload_hash,
+            "config": encoded_config,
+        }
+        self._store.async_delay_save(self._data_to_save, DISCOVERY_CACHE_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, topic: str) -> None:
+        """Remove the cached config of a discovery topic."""
+        if self._entries.pop(topic, None) is not None:
+            self._store.async_delay_save(self._data_to_save, DISCOVERY_CACHE_SAVE_DELAY)
 
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -191,6 +334,9 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    if (discovery_cache := mqtt_data.discovery_cache) is None:
+        discovery_cache = mqtt_data.discovery_cache = MqttDiscoveryCache(hass)
+        await discovery_cache.async_load()
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -253,8 +399,13 @@ async def async_start(  # noqa: C901
                 return
             if TOPIC_BASE in discovery_payload:
                 _replace_topic_base(discovery_payload)
+            discovery_payload.payload_hash = hashlib.sha256(
+                payload if isinstance(payload, bytes) else payload.encode()
+            ).hexdigest()
         else:
             discovery_payload = MQTTDiscoveryPayload({})
+            # The component was removed
+            discovery_cache.async_remove(topic)
 
         # If present, the node_id will be included in the discovered object id
         discovery_id = f"{node_id} {object_id}" if node_id else object_id
@@ -416,6 +567,8 @@ async def async_stop(hass: HomeAssistant) -> None:
     for unsub in mqtt_data.discovery_unsubscribe:
         unsub()
     mqtt_data.discovery_unsubscribe = []
+    if mqtt_data.discovery_cache is not None:
+        await mqtt_data.discovery_cache.async_save()
     for key, unsub in list(mqtt_data.integration_unsubscribe.items()):
         unsub()
         mqtt_data.integration_unsubscribe.pop(key)
@@ -69,6 +69,7 @@ from .const import (
     CONF_AVAILABILITY_MODE,
     CONF_AVAILABILITY_TEMPLATE,
     CONF_AVAILABILITY_TOPIC,
+    CONF_COALESCE_WINDOW,
     CONF_CONFIGURATION_URL,
     CONF_CONNECTIONS,
     CONF_ENABLED_BY_DEFAULT,
@@ -265,7 +266,16 @@ def async_setup_entity_entry_helper(
         ):
             return
         try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
+            discovery_cache = mqtt_data.discovery_cache
+            # The config of an unchanged payload was already validated
+            if (
+                discovery_cache is None
+                or (config := discovery_cache.async_get(domain, discovery_payload))
+                is None
+            ):
+                config = discovery_schema(discovery_payload)
+                if discovery_cache is not None:
+                    discovery_cache.async_set(domain, discovery_payload, config)
             if schema_class_mapping is not None:
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
@@ -1300,6 +1310,7 @@ class MqttEntity(
                 "qos": qos,
                 "encoding": encoding,
                 "job_type": HassJobType.Callback,
+                "coalesce_window": self._config.get(CONF_COALESCE_WINDOW),
             }
             return True
         return False
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from .client import MQTT, Subscription
     from .debug_info import TimestampedPublishMessage
     from .device_trigger import Trigger
-    from .discovery import MQTTDiscoveryPayload
+    from .discovery import MqttDiscoveryCache, MQTTDiscoveryPayload
     from .tag import MQTTTagScanner
 
 from .const import DOMAIN, TEMPLATE_ERRORS
@@ -372,7 +372,7 @@ class EntityTopicState:
         self.subscribe_calls: dict[str, Entity] = {}
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self, msg: MQTTMessage | ReceiveMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             entity_id, entity = self.subscribe_calls.popitem()
@@ -406,6 +406,7 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_cache: MqttDiscoveryCache | None = None
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
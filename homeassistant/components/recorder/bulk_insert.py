@@ -0,0 +1,195 @@
+"""Bulk insert of the rows written by the recorder for each commit."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Tables are inserted in this order so the ids of the rows
+# referenced by Events and States are known when they are inserted
+_INSERT_ORDER: tuple[type[Base], ...] = (
+    StatesMeta,
+    StateAttributes,
+    EventTypes,
+    EventData,
+    Events,
+    States,
+)
+
+# Relationships of each table as (relationship, foreign key) pairs
+_RELATIONSHIPS: dict[type[Base], tuple[tuple[str, str], ...]] = {
+    Events: (("event_type_rel", "event_type_id"), ("event_data_rel", "data_id")),
+    States: (
+        ("states_meta_rel", "metadata_id"),
+        ("state_attributes", "attributes_id"),
+        ("old_state", "old_state_id"),
+    ),
+}
+
+
+def _primary_key(table: type[Base]) -> str:
+    """Return the name of the primary key of a table."""
+    return next(column.key for column in table.__table__.columns if column.primary_key)
+
+
+def _insert_columns(table: type[Base]) -> tuple[str, ...]:
+    """Return the names of the columns to insert.
+
+    The primary key is generated by the database.
+    """
+    return tuple(
+        column.key for column in table.__table__.columns if not column.primary_key
+    )
+
+
+def _values_getter(columns: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a callable that gets the values of columns from an object."""
+    if len(columns) == 1:
+        getter = attrgetter(columns[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*columns)
+
+
+_PRIMARY_KEYS = {table: _primary_key(table) for table in _INSERT_ORDER}
+_INSERT_COLUMNS = {table: _insert_columns(table) for table in _INSERT_ORDER}
+_VALUES_GETTERS = {
+    table: _values_getter(columns) for table, columns in _INSERT_COLUMNS.items()
+}
+
+
+def supports_bulk_insert(dialect: Dialect) -> bool:
+    """Return if the dialect can return the ids of a bulk insert in order."""
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+def _insert_returning_ids(session: Session, table: type[Base], objs: list[Any]) -> None:
+    """Insert rows with a single executemany and set the generated ids."""
+    if not objs:
+        return
+    columns = _INSERT_COLUMNS[table]
+    get_values = _VALUES_GETTERS[table]
+    primary_key = _PRIMARY_KEYS[table]
+    sql_table = table.__table__
+    result = session.execute(
+        insert(sql_table).returning(
+            sql_table.c[primary_key], sort_by_parameter_order=True
+        ),
+        [dict(zip(columns, get_values(obj), strict=True)) for obj in objs],
+    )
+    for obj, id_ in zip(objs, result.scalars(), strict=True):
+        setattr(obj, primary_key, id_)
+
+
+class BulkInsertBuffer:
+    """Buffer the rows of a commit interval and insert them in bulk.
+
+    The table managers still create the database objects and link them
+    together with relationships, but the objects are never added to the
+    ORM session. When the buffer is flushed, the rows of each table are
+    written with a single executemany INSERT ... RETURNING in dependency
+    order, and the generated ids are set on the buffered objects so the
+    table managers can map them to ids after the commit as usual.
+
+    This call is not thread-safe and must be called from the
+    recorder thread.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._rows: dict[type[Base], list[Any]] = {table: [] for table in _INSERT_ORDER}
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return sum(len(rows) for rows in self._rows.values())
+
+    def add(self, obj: Base) -> None:
+        """Add an object to the buffer."""
+        self._rows[type(obj)].append(obj)
+
+    def clear(self) -> None:
+        """Drop all buffered rows."""
+        for rows in self._rows.values():
+            rows.clear()
+
+    def _cascade(self) -> None:
+        """Add related objects that have not been added to the buffer.
+
+        This matches the save-update cascade of the ORM session, which
+        inserts the objects referenced by an object added to the session.
+        """
+        buffered_ids = {
+            id(obj) for table_rows in self._rows.values() for obj in table_rows
+        }
+        for table, relationships in _RELATIONSHIPS.items():
+            # The list may grow while we iterate when an old state
+            # that was never added is found
+            for obj in self._rows[table]:
+                for relationship, _ in relationships:
+                    related = getattr(obj, relationship)
+                    if related is None or id(related) in buffered_ids:
+                        continue
+                    if getattr(related, _PRIMARY_KEYS[type(related)]) is None:
+                        buffered_ids.add(id(related))
+                        self._rows[type(related)].append(related)
+
+    def flush(self, session: Session) -> None:
+        """Insert all buffered rows.
+
+        The buffer is not cleared so the flush can be retried if the
+        commit fails.
+        """
+        self._cascade()
+        rows = self._rows
+        for table in (StatesMeta, StateAttributes, EventTypes, EventData):
+            _insert_returning_ids(session, table, rows[table])
+
+        for event in rows[Events]:
+            _set_foreign_keys(event, _RELATIONSHIPS[Events])
+        _insert_returning_ids(session, Events, rows[Events])
+
+        # A state may reference an old state that is inserted in the
+        # same flush if the entity changed more than once during the
+        # commit interval, so states are inserted in generations where
+        # the old state of each state has already been inserted.
+        states_relationships = _RELATIONSHIPS[States]
+        waiting: list[States] = rows[States]
+        waiting_ids = {id(dbstate) for dbstate in waiting}
+        while waiting:
+            ready: list[States] = []
+            not_ready: list[States] = []
+            for dbstate in waiting:
+                if (old_state := dbstate.old_state) is None or id(
+                    old_state
+                ) not in waiting_ids:
+                    ready.append(dbstate)
+                else:
+                    not_ready.append(dbstate)
+            for dbstate in ready:
+                _set_foreign_keys(dbstate, states_relationships)
+            _insert_returning_ids(session, States, ready)
+            waiting_ids.difference_update(id(dbstate) for dbstate in ready)
+            waiting = not_ready
+
+
+def _set_foreign_keys(obj: Base, relationships: tuple[tuple[str, str], ...]) -> None:
+    """Set the foreign keys of an object from its relationships."""
+    for relationship, foreign_key in relationships:
+        if (related := getattr(obj, relationship)) is not None:
+            setattr(obj, foreign_key, getattr(related, _PRIMARY_KEYS[type(related)]))
@@ -1,6 +1,7 @@
 """Recorder constants."""
 
-from enum import StrEnum
+from datetime import timedelta
+from enum import IntEnum, StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
@@ -49,6 +50,14 @@ DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
 
+# The number of database executor workers, each with its own connection
+DEFAULT_DB_READ_POOL_SIZE = 4
+
+# Queries spanning up to SHORT_QUERY_PERIOD run before other queries
+# and queries spanning more than LONG_QUERY_PERIOD run after them
+SHORT_QUERY_PERIOD = timedelta(hours=1)
+LONG_QUERY_PERIOD = timedelta(days=1)
+
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
 ATTR_KEEP_DAYS = "keep_days"
@@ -82,3 +91,11 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class QueryPriority(IntEnum):
+    """Priority of a job in the database executor, lower values run first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
@@ -7,7 +7,7 @@ from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
-from functools import cached_property
+from functools import cached_property, partial
 import logging
 import queue
 import sqlite3
@@ -26,6 +26,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
@@ -44,14 +45,17 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertBuffer, supports_bulk_insert
 from .const import (
     DB_WORKER_PREFIX,
+    DEFAULT_DB_READ_POOL_SIZE,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
     KEEPALIVE_TIME,
@@ -66,6 +70,7 @@ from .const import (
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATISTICS_ROWS_SCHEMA_VERSION,
+    QueryPriority,
     SupportedDialect,
 )
 from .db_schema import (
@@ -89,10 +94,13 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .spool import EventSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -108,6 +116,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DownsampleTask,
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
     ImportStatisticsTask,
@@ -115,6 +124,8 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpoolDrainTask,
+    StatisticsRollupMigrationTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -151,17 +162,27 @@ COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
+SPOOL_DRAIN_TASK = SpoolDrainTask()
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
+# How often events are written to the spool while spooling
+SPOOL_FLUSH_INTERVAL = timedelta(seconds=5)
+# The number of spooled events processed before each commit
+SPOOL_DRAIN_BATCH_SIZE = 1000
+# Spooling stops once the spool is empty and the
+# queue is below this percentage of its maximum size
+SPOOL_RESUME_BACKLOG_PERCENTAGE = 50
+
+PURGE_PROGRESS_STORAGE_KEY = f"{DOMAIN}.purge_progress"
+PURGE_PROGRESS_STORAGE_VERSION = 1
+PURGE_PROGRESS_SAVE_DELAY = 10
+
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
-# Pool size must accommodate Recorder thread + All db executors
-MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
-
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -180,6 +201,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool = False,
+        spool_dir: str | None = None,
+        db_read_pool_size: int = DEFAULT_DB_READ_POOL_SIZE,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -197,6 +221,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_pool_size = db_read_pool_size
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -219,6 +244,26 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # The bulk insert buffer is only created once we know
+        # the database supports it
+        self.bulk_insert = bulk_insert
+        self._bulk_insert_buffer: BulkInsertBuffer | None = None
+        # Events are written to the spool instead of the queue
+        # while the spool buffer is set
+        self._spool = EventSpool(spool_dir) if spool_dir else None
+        self._spool_buffer: list[Event] | None = None
+        self._spool_write: asyncio.Future[None] | None = None
+        # The progress of the running purge, which is persisted
+        # so the purge resumes after a restart
+        self.purge_progress: PurgeProgress | None = None
+        # The end of the last period of downsampled states that was
+        # compiled, loaded from the database by the first compile
+        self.downsampled_until: float | None = None
+        self.statistics_rollup_ready = False
+        self._statistics_rollup_time_zone = hass.config.time_zone
+        self._purge_progress_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_PROGRESS_STORAGE_VERSION, PURGE_PROGRESS_STORAGE_KEY
+        )
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -240,6 +285,7 @@ class Recorder(threading.Thread):
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
+        self._spool_flush_listener: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
@@ -296,7 +342,7 @@ class Recorder(threading.Thread):
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             self.recorder_and_worker_thread_ids,
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=self.db_read_pool_size,
             shutdown_hook=self._shutdown_pool,
         )
 
@@ -308,9 +354,19 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._event_listener = self._async_listen_events(self._queue.put_nowait)
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            timedelta(minutes=10),
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> CALLBACK_TYPE:
+        """Listen for events to record and pass them to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -340,16 +396,7 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-        )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            timedelta(minutes=10),
-            name="Recorder queue watcher",
-        )
+        return self.hass.bus.async_listen(MATCH_ALL, _event_listener)
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -369,10 +416,50 @@ class Recorder(threading.Thread):
 
     @callback
     def async_add_executor_job[_T](
-        self, target: Callable[..., _T], *args: Any
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+        priority: QueryPriority = QueryPriority.NORMAL,
     ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event loop."""
-        return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        """Add an executor job from within the event loop.
+
+        Jobs with a higher priority run before queued jobs
+        with a lower priority.
+        """
+        if self._db_executor is None:
+            return self.hass.loop.run_in_executor(None, target, *args)
+        return asyncio.wrap_future(
+            self._db_executor.submit_with_priority(priority, target, *args),
+            loop=self.hass.loop,
+        )
+
+    async def async_load_purge_progress(self) -> None:
+        """Load the progress of a purge that did not finish."""
+        if not (data := await self._purge_progress_store.async_load()) or not (
+            stored := data.get("purge")
+        ):
+            return
+        try:
+            self.purge_progress = PurgeProgress.from_stored_dict(stored)
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring invalid purge progress: %s", stored)
+
+    @callback
+    def async_save_purge_progress(self, stored: dict[str, Any] | None) -> None:
+        """Save the progress of the running purge.
+
+        The purge is finished when stored is None.
+        """
+        self._purge_progress_store.async_delay_save(
+            lambda: {"purge": stored}, PURGE_PROGRESS_SAVE_DELAY
+        )
+
+    @callback
+    def async_read_pool_info(self) -> dict[str, Any] | None:
+        """Return the size and latency of the database executor."""
+        if (executor := self._db_executor) is None:
+            return None
+        return {"size": executor.size, "latency": executor.latency()}
 
     def _stop_executor(self) -> None:
         """Stop the executor."""
@@ -391,6 +478,9 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Recorder queue size is: %s", size)
         if not self._reached_max_backlog_percentage(100):
             return
+        if self._spool is not None:
+            self._async_start_spooling()
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -425,6 +515,99 @@ class Recorder(threading.Thread):
         self.max_backlog = max(max_queue_backlog, MAX_QUEUE_BACKLOG_MIN_VALUE)
         return current_backlog >= (max_queue_backlog * percentage_modifier)
 
+    @callback
+    def _async_start_spooling(self) -> None:
+        """Write new events to the spool instead of the queue."""
+        if self._spool_buffer is not None or not self._event_listener:
+            return
+        assert self._spool is not None
+        _LOGGER.warning(
+            (
+                "The recorder backlog queue reached the maximum size of %s events; "
+                "new events will be written to %s until the database catches up"
+            ),
+            self.backlog,
+            self._spool.path,
+        )
+        self._spool_buffer = []
+        self._event_listener()
+        self._event_listener = self._async_listen_events(self._spool_buffer.append)
+        self._spool_flush_listener = async_track_time_interval(
+            self.hass,
+            self._async_flush_spool,
+            SPOOL_FLUSH_INTERVAL,
+            name="Recorder spool flush",
+        )
+
+    @callback
+    def _async_flush_spool(self, *_: Any) -> None:
+        """Write the buffered events to the spool or stop spooling."""
+        if (buffer := self._spool_buffer) is None or (
+            self._spool_write is not None and not self._spool_write.done()
+        ):
+            return
+        if buffer:
+            events = buffer.copy()
+            buffer.clear()
+            self._spool_write = self.hass.async_add_executor_job(
+                self._write_spool, events
+            )
+            self._spool_write.add_done_callback(
+                partial(self._async_spool_written, events)
+            )
+            return
+        assert self._spool is not None
+        if self._spool.pending or self._reached_max_backlog_percentage(
+            SPOOL_RESUME_BACKLOG_PERCENTAGE
+        ):
+            return
+        _LOGGER.info("The recorder caught up, events are no longer spooled")
+        self._async_stop_spooling()
+        if self._event_listener:
+            self._event_listener()
+            self._event_listener = self._async_listen_events(self._queue.put_nowait)
+
+    @callback
+    def _async_spool_written(
+        self, events: list[Event], future: asyncio.Future[None]
+    ) -> None:
+        """Put back the events that could not be written to the spool."""
+        if future.cancelled():
+            _LOGGER.error("Writing %s events to the spool was cancelled", len(events))
+        elif (err := future.exception()) is not None:
+            _LOGGER.error("Error writing %s events to the spool: %s", len(events), err)
+        else:
+            return
+        if (buffer := self._spool_buffer) is not None:
+            # The events are written again by the next flush
+            buffer[:0] = events
+            return
+        for event in events:
+            self._queue.put_nowait(event)
+
+    @callback
+    def _async_stop_spooling(self) -> None:
+        """Stop writing events to the spool."""
+        self._spool_buffer = None
+        if self._spool_flush_listener:
+            self._spool_flush_listener()
+            self._spool_flush_listener = None
+
+    def _write_spool(self, events: list[Event]) -> None:
+        """Write events to the spool and queue a task to drain it."""
+        assert self._spool is not None
+        self._spool.append(events)
+        self.queue_task(SPOOL_DRAIN_TASK)
+
+    def _drain_spool(self) -> None:
+        """Record the events in the spool."""
+        assert self._spool is not None
+        while events := self._spool.read(SPOOL_DRAIN_BATCH_SIZE):
+            _LOGGER.debug("Recording %s spooled events", len(events))
+            for event in events:
+                self._process_one_task_or_event_or_recover(event)
+            self._commit_event_session_or_retry()
+
     @callback
     def _async_stop_queue_watcher_and_event_listener(self) -> None:
         """Stop watching the queue and listening for events."""
@@ -434,6 +617,7 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        self._async_stop_spooling()
 
     @callback
     def _async_stop_listeners(self) -> None:
@@ -474,8 +658,17 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._spool_write is not None and not self._spool_write.done():
+            # The events of a failed write are put back in the buffer
+            await asyncio.wait((self._spool_write,))
+        spool_buffer = self._spool_buffer
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        if spool_buffer:
+            # Write the events that are still buffered to the
+            # spool so they are recorded after a restart
+            assert self._spool is not None
+            await self.hass.async_add_executor_job(self._spool.append, spool_buffer)
         await self.hass.async_add_executor_job(self.join)
 
     @callback
@@ -490,6 +683,16 @@ class Recorder(threading.Thread):
         bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close)
         bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_shutdown)
         async_at_started(self.hass, self._async_hass_started)
+        bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated)
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Compile the statistics rollups again if the time zone changed."""
+        if self.hass.config.time_zone == self._statistics_rollup_time_zone:
+            return
+        self._statistics_rollup_time_zone = self.hass.config.time_zone
+        self.statistics_rollup_ready = False
+        self.queue_task(StatisticsRollupMigrationTask())
 
     @callback
     def _async_startup_failed(self) -> None:
@@ -556,6 +759,7 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        self.queue_task(DownsampleTask(dt_util.utcnow()))
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -672,6 +876,16 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        # Resume a purge that did not finish before the last shutdown
+        if (progress := self.purge_progress) is not None:
+            _LOGGER.info(
+                "Resuming purge of data before %s",
+                progress.purge_before.isoformat(sep=" ", timespec="seconds"),
+            )
+            self.queue_task(
+                PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
+            )
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -714,10 +928,13 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
-        """Add an object to the session."""
+    def _add_to_session(self, session: Session, obj: Base) -> None:
+        """Add an object to the session or the bulk insert buffer."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_insert_buffer is not None:
+            self._bulk_insert_buffer.add(obj)
+        else:
+            session.add(obj)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -836,6 +1053,14 @@ class Recorder(threading.Thread):
                     ):
                         self.queue_task(EntityIDPostMigrationTask())
 
+            migrator = StatisticsRollupMigration(
+                session, schema_version, migration_changes
+            )
+            if migrator.needs_migrate():
+                self.queue_task(migrator.task())
+            else:
+                self.statistics_rollup_ready = True
+
             if self.schema_version > LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION:
                 with contextlib.suppress(SQLAlchemyError):
                     # If the index of event_ids on the states table is still present
@@ -863,6 +1088,10 @@ class Recorder(threading.Thread):
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
         self._pre_process_startup_events(startup_task_or_events)
+        if self._spool is not None:
+            # Events spooled by a previous run are older
+            # than the events queued during startup
+            self._drain_spool()
         for task in startup_task_or_events:
             self._guarded_process_one_task_or_event_or_recover(task)
 
@@ -1227,7 +1456,17 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if (bulk_insert_buffer := self._bulk_insert_buffer) is not None:
+            start = time.monotonic()
+            bulk_insert_buffer.flush(session)
+            _LOGGER.debug(
+                "Bulk inserted %s rows in %.3f seconds",
+                len(bulk_insert_buffer),
+                time.monotonic() - start,
+            )
         session.commit()
+        if bulk_insert_buffer is not None:
+            bulk_insert_buffer.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1260,6 +1499,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self._bulk_insert_buffer is not None:
+            self._bulk_insert_buffer.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1306,6 +1547,10 @@ class Recorder(threading.Thread):
         """Migrate entity_ids if needed."""
         return migration.migrate_entity_ids(self)
 
+    def _migrate_statistics_rollup(self, after_metadata_id: int) -> int | None:
+        """Compile the statistics rollups of a batch of statistics."""
+        return migration.migrate_statistics_rollup(self, after_metadata_id)
+
     def _post_migrate_entity_ids(self) -> bool:
         """Post migrate entity_ids if needed."""
         return migration.post_migrate_entity_ids(self)
@@ -1423,6 +1668,8 @@ class Recorder(threading.Thread):
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
+            # The pool must accommodate the recorder thread and all db executors
+            kwargs["pool_size"] = self.db_read_pool_size + 1
         elif self.db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
@@ -1444,12 +1691,24 @@ class Recorder(threading.Thread):
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+            # The default pool size accommodates the default number of db executors
+            if self.db_read_pool_size > DEFAULT_DB_READ_POOL_SIZE:
+                kwargs["pool_size"] = self.db_read_pool_size + 1
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        self._bulk_insert_buffer = None
+        if self.bulk_insert:
+            if supports_bulk_insert(self.engine.dialect):
+                self._bulk_insert_buffer = BulkInsertBuffer()
+            else:
+                _LOGGER.warning(
+                    "The database does not support returning the ids of bulk"
+                    " inserts, bulk inserts are disabled"
+                )
         self.__dict__.pop("dialect_name", None)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
@@ -78,12 +78,14 @@ TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
+TABLE_STATES_DOWNSAMPLED = "states_downsampled"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_ROLLUP = "statistics_rollup"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -103,10 +105,12 @@ ALL_TABLES = [
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATES_DOWNSAMPLED,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_ROLLUP,
 ]
 
 TABLES_TO_CHECK = [
@@ -642,6 +646,48 @@ class StatesMeta(Base):
         )
 
 
+class StatesDownsampled(Base):
+    """Downsampled states of an entity.
+
+    Each row summarizes the states of an entity that were recorded
+    during a period of resolution seconds.
+    """
+
+    __table_args__ = (
+        # Used for fetching the downsampled states of an entity during a period
+        Index(
+            "ix_states_downsampled_metadata_id_resolution_start_ts",
+            "metadata_id",
+            "resolution",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("states_meta.metadata_id")
+    )
+    resolution: Mapped[int | None] = mapped_column(Integer)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    first_state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    last_state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    count: Mapped[int | None] = mapped_column(Integer)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesDownsampled("
+            f"id={self.id}, metadata_id={self.metadata_id},"
+            f" resolution={self.resolution}, start_ts={self.start_ts},"
+            f" last_state='{self.last_state}'"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -737,6 +783,55 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollup(Base):
+    """Long term statistics reduced to a day, week or month.
+
+    Each row holds what the hourly statistics of a period reduce to. The
+    mean is kept as the compensated sum and number of the hourly means,
+    so the hours can be added to the period as they are compiled.
+    """
+
+    __table_args__ = (
+        # Used for fetching the rollups of a statistic during a period
+        Index(
+            "ix_statistics_rollup_metadata_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUP
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[int | None] = mapped_column(SmallInteger)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    end_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    # The start of the last hourly statistics of the period
+    last_start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    mean_sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    mean_compensation: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatisticsRollup("
+            f"id={self.id}, metadata_id={self.metadata_id},"
+            f" period={self.period}, start_ts={self.start_ts}"
+            ")>"
+        )
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
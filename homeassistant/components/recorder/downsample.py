@@ -0,0 +1,361 @@
+"""Downsampled states for long-range history queries.
+
+The states of each entity are summarized in buckets of several
+resolutions. The 5 minute buckets are compiled from the states
+table once a 5 minute period has ended, and each coarser resolution
+is rolled up from the resolution before it once its period has ended,
+so every state row is read once and long-range queries read a number
+of rows proportional to the number of points they return.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from itertools import groupby
+import logging
+import math
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .db_schema import States, StatesDownsampled
+from .util import get_instance, retryable_database_job, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# The resolutions in seconds, each resolution is
+# rolled up from the resolution before it
+DOWNSAMPLE_RESOLUTIONS: dict[str, int] = {
+    "5minute": 300,
+    "hour": 3600,
+    "day": 86400,
+}
+DOWNSAMPLE_PERIOD = timedelta(seconds=DOWNSAMPLE_RESOLUTIONS["5minute"])
+
+# The maximum number of 5 minute periods compiled by a task
+MAX_PERIODS_PER_COMPILE = 288
+
+DOWNSAMPLED_STATE_FIRST = "first"
+DOWNSAMPLED_STATE_MIN = "min"
+DOWNSAMPLED_STATE_MAX = "max"
+
+# metadata_id, first state, last state, min, max, count
+type _BucketRow = tuple[int, str | None, str | None, float | None, float | None, int]
+
+
+def resolution_for_max_points(
+    start_time: datetime, end_time: datetime, max_points: int
+) -> str:
+    """Return the finest resolution that returns at most max_points per entity."""
+    period = (end_time - start_time).total_seconds()
+    for resolution, seconds in DOWNSAMPLE_RESOLUTIONS.items():
+        if period / seconds <= max_points:
+            return resolution
+    return resolution
+
+
+def _numeric(state: str | None) -> float | None:
+    """Return the numeric value of a state or None."""
+    if state is None:
+        return None
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _state_rows_to_bucket_rows(
+    rows: Iterable[tuple[int, str | None]],
+) -> Iterator[_BucketRow]:
+    """Convert state rows to single state bucket rows."""
+    for metadata_id, state in rows:
+        value = _numeric(state)
+        yield metadata_id, state, state, value, value, 1
+
+
+def _merge_bucket_rows(
+    resolution: int, start_ts: float, rows: Iterable[_BucketRow]
+) -> list[StatesDownsampled]:
+    """Merge bucket rows sorted by metadata_id into a bucket per entity."""
+    buckets: list[StatesDownsampled] = []
+    for metadata_id, entity_rows in groupby(rows, itemgetter(0)):
+        _, first_state, last_state, minimum, maximum, count = next(entity_rows)
+        for _, _, row_last, row_min, row_max, row_count in entity_rows:
+            last_state = row_last
+            count += row_count
+            if row_min is not None and (minimum is None or row_min < minimum):
+                minimum = row_min
+            if row_max is not None and (maximum is None or row_max > maximum):
+                maximum = row_max
+        buckets.append(
+            StatesDownsampled(
+                metadata_id=metadata_id,
+                resolution=resolution,
+                start_ts=start_ts,
+                first_state=first_state,
+                last_state=last_state,
+                min=minimum,
+                max=maximum,
+                count=count,
+            )
+        )
+    return buckets
+
+
+def _compile_period(
+    session: Session, resolution: int, start_ts: float, end_ts: float
+) -> None:
+    """Compile the buckets of a resolution for a period.
+
+    The 5 minute buckets are compiled from the states, the other
+    resolutions from the buckets of the resolution before them.
+    """
+    rows: Iterable[_BucketRow]
+    if resolution == DOWNSAMPLE_RESOLUTIONS["5minute"]:
+        rows = _state_rows_to_bucket_rows(
+            session.execute(
+                select(States.metadata_id, States.state)
+                .filter(States.last_updated_ts >= start_ts)
+                .filter(States.last_updated_ts < end_ts)
+                .filter(States.metadata_id.is_not(None))
+                .filter(States.state.is_not(None))
+                .order_by(States.metadata_id, States.last_updated_ts)
+            ).tuples()
+        )
+    else:
+        source_resolution = max(
+            seconds
+            for seconds in DOWNSAMPLE_RESOLUTIONS.values()
+            if seconds < resolution
+        )
+        rows = session.execute(
+            select(
+                StatesDownsampled.metadata_id,
+                StatesDownsampled.first_state,
+                StatesDownsampled.last_state,
+                StatesDownsampled.min,
+                StatesDownsampled.max,
+                StatesDownsampled.count,
+            )
+            .filter(StatesDownsampled.start_ts >= start_ts)
+            .filter(StatesDownsampled.start_ts < end_ts)
+            .filter(StatesDownsampled.resolution == source_resolution)
+            .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+        ).tuples()  # type: ignore[assignment]
+    # Remove the buckets of a previous attempt to compile the period
+    session.execute(
+        delete(StatesDownsampled)
+        .filter(StatesDownsampled.start_ts == start_ts)
+        .filter(StatesDownsampled.resolution == resolution)
+        .execution_options(synchronize_session=False)
+    )
+    session.add_all(_merge_bucket_rows(resolution, start_ts, rows))
+
+
+def _compile_periods_ending_at(session: Session, end_ts: float) -> None:
+    """Compile the buckets of every resolution whose period ends at end_ts."""
+    for resolution in DOWNSAMPLE_RESOLUTIONS.values():
+        if end_ts % resolution:
+            return
+        _compile_period(session, resolution, end_ts - resolution, end_ts)
+
+
+def _compiled_until(instance: Recorder, session: Session) -> float | None:
+    """Return the end of the last period that was compiled or None."""
+    if (until := instance.downsampled_until) is not None:
+        return until
+    if last_start_ts := session.execute(
+        select(func.max(StatesDownsampled.start_ts)).filter(
+            StatesDownsampled.resolution == DOWNSAMPLE_RESOLUTIONS["5minute"]
+        )
+    ).scalar():
+        return last_start_ts + DOWNSAMPLE_PERIOD.total_seconds()
+    return None
+
+
+def _downsampled_until(instance: Recorder, session: Session, end: datetime) -> float:
+    """Return the end of the last period that was compiled."""
+    if (until := _compiled_until(instance, session)) is not None:
+        return until
+    # Compile the states that were recorded before the downsampled
+    # states were compiled for the first time
+    start = end
+    if oldest_ts := session.execute(select(func.min(States.last_updated_ts))).scalar():
+        start = max(
+            end - timedelta(days=instance.keep_days),
+            dt_util.utc_from_timestamp(oldest_ts),
+        )
+    return start.replace(minute=0, second=0, microsecond=0).timestamp()
+
+
+@retryable_database_job("compile downsampled states")
+def compile_downsampled_states(instance: Recorder, end: datetime) -> bool:
+    """Compile the downsampled states of the periods that ended before end.
+
+    Returns False if there are more periods to compile.
+    """
+    end_ts = end.timestamp()
+    period = DOWNSAMPLE_PERIOD.total_seconds()
+    with session_scope(session=instance.get_session()) as session:
+        start_ts = _downsampled_until(instance, session, end)
+        for _ in range(MAX_PERIODS_PER_COMPILE):
+            if start_ts + period > end_ts:
+                break
+            _LOGGER.debug(
+                "Compiling downsampled states for %s",
+                dt_util.utc_from_timestamp(start_ts),
+            )
+            start_ts += period
+            _compile_periods_ending_at(session, start_ts)
+    instance.downsampled_until = start_ts
+    return start_ts + period > end_ts
+
+
+def states_fit_in_max_points(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    max_points: int,
+) -> bool:
+    """Return if each entity has at most max_points states during a period."""
+    start_time_ts = start_time.timestamp()
+    instance = get_instance(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        for metadata_id in instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        ).values():
+            if metadata_id is None:
+                continue
+            stmt = (
+                select(States.last_updated_ts)
+                .filter(States.metadata_id == metadata_id)
+                .filter(States.last_updated_ts >= start_time_ts)
+                .order_by(States.last_updated_ts)
+                .offset(max_points)
+                .limit(1)
+            )
+            if end_time is not None:
+                stmt = stmt.filter(States.last_updated_ts < end_time.timestamp())
+            if session.execute(stmt).first():
+                return False
+    return True
+
+
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    resolution: str,
+    include_start_time_state: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the downsampled states of entities during a period.
+
+    Each bucket is returned as the last state of the entity in the
+    bucket, with the first state and the min and max of the numeric
+    states. The states recorded after the last bucket of the resolution
+    that was compiled are returned as they were recorded.
+    """
+    resolution_seconds = DOWNSAMPLE_RESOLUTIONS[resolution]
+    start_time_ts = start_time.timestamp()
+    instance = get_instance(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        }
+        if not metadata_id_to_entity_id:
+            return {}
+        result: dict[str, list[dict[str, Any]]] = {
+            entity_id: [] for entity_id in metadata_id_to_entity_id.values()
+        }
+        if include_start_time_state:
+            for metadata_id, entity_id in metadata_id_to_entity_id.items():
+                if (
+                    state := session.execute(
+                        select(States.state)
+                        .filter(States.metadata_id == metadata_id)
+                        .filter(States.last_updated_ts < start_time_ts)
+                        .order_by(States.last_updated_ts.desc())
+                        .limit(1)
+                    ).scalar()
+                ) is not None:
+                    result[entity_id].append(
+                        {
+                            COMPRESSED_STATE_STATE: state,
+                            COMPRESSED_STATE_LAST_UPDATED: start_time_ts,
+                        }
+                    )
+        stmt = (
+            select(
+                StatesDownsampled.metadata_id,
+                StatesDownsampled.start_ts,
+                StatesDownsampled.first_state,
+                StatesDownsampled.last_state,
+                StatesDownsampled.min,
+                StatesDownsampled.max,
+            )
+            .filter(StatesDownsampled.metadata_id.in_(metadata_id_to_entity_id))
+            .filter(StatesDownsampled.resolution == resolution_seconds)
+            .filter(StatesDownsampled.start_ts >= start_time_ts)
+            .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+        )
+        if end_time is not None:
+            stmt = stmt.filter(StatesDownsampled.start_ts < end_time.timestamp())
+        for (
+            metadata_id,
+            start_ts,
+            first_state,
+            last_state,
+            minimum,
+            maximum,
+        ) in session.execute(stmt).tuples():
+            bucket: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: last_state,
+                COMPRESSED_STATE_LAST_UPDATED: start_ts,
+                DOWNSAMPLED_STATE_FIRST: first_state,
+            }
+            if minimum is not None:
+                bucket[DOWNSAMPLED_STATE_MIN] = minimum
+                bucket[DOWNSAMPLED_STATE_MAX] = maximum
+            result[metadata_id_to_entity_id[metadata_id]].append(bucket)
+        # The periods of the resolution that have not been compiled yet
+        tail_start_ts = start_time_ts
+        if (compiled_until_ts := _compiled_until(instance, session)) is not None:
+            tail_start_ts = max(
+                tail_start_ts,
+                compiled_until_ts - compiled_until_ts % resolution_seconds,
+            )
+        tail_stmt = (
+            select(States.metadata_id, States.state, States.last_updated_ts)
+            .filter(States.metadata_id.in_(metadata_id_to_entity_id))
+            .filter(States.last_updated_ts >= tail_start_ts)
+            .filter(States.state.is_not(None))
+            .order_by(States.metadata_id, States.last_updated_ts)
+        )
+        if end_time is not None:
+            tail_stmt = tail_stmt.filter(States.last_updated_ts < end_time.timestamp())
+        for metadata_id, state, last_updated_ts in session.execute(tail_stmt).tuples():
+            result[metadata_id_to_entity_id[metadata_id]].append(
+                {
+                    COMPRESSED_STATE_STATE: state,
+                    COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                }
+            )
+    return {entity_id: states for entity_id, states in result.items() if states}
@@ -2,14 +2,127 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future
 from concurrent.futures.thread import _threads_queues, _worker
+import heapq
+import itertools
+import queue
 import threading
-from typing import Any
+import time
+from typing import Any, TypedDict
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+from .const import QueryPriority
+
+# The number of jobs per priority the latency metrics are computed from
+LATENCY_SAMPLES = 100
+
+# Shutdown sentinels are handed out after all queued jobs
+_SENTINEL_PRIORITY = len(QueryPriority)
+
+
+class QueryLatency(TypedDict):
+    """Latency of the recent jobs of a priority in milliseconds."""
+
+    jobs: int
+    queued: int
+    avg_wait: float
+    max_wait: float
+    avg_run: float
+    max_run: float
+
+
+class _PrioritizedJob:
+    """A job submitted with a priority that measures its latency."""
+
+    __slots__ = ("latencies", "priority", "queued_at", "target")
+
+    def __init__(
+        self,
+        priority: QueryPriority,
+        target: Callable[..., Any],
+        latencies: deque[tuple[float, float]],
+    ) -> None:
+        """Initialize the job."""
+        self.priority = priority
+        self.target = target
+        self.latencies = latencies
+        self.queued_at = time.monotonic()
+
+    def __call__(self, *args: Any) -> Any:
+        """Run the job and record how long it waited and ran."""
+        started_at = time.monotonic()
+        try:
+            return self.target(*args)
+        finally:
+            finished_at = time.monotonic()
+            self.latencies.append(
+                (started_at - self.queued_at, finished_at - started_at)
+            )
+
+
+class _PriorityWorkQueue:
+    """A work queue that hands out the jobs with the highest priority first.
+
+    Jobs with the same priority are handed out in the order they were
+    queued. Work items not submitted with a priority, such as the ones
+    submitted by the event loop, have the normal priority.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._heap: list[tuple[int, int, Any]] = []
+        self._counter = itertools.count()
+        self._not_empty = threading.Condition(threading.Lock())
+        self.queued: dict[int, int] = dict.fromkeys(QueryPriority, 0)
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Put a work item in the queue."""
+        if item is None:
+            priority = _SENTINEL_PRIORITY
+        elif isinstance(job := item.fn, _PrioritizedJob):
+            priority = job.priority
+        else:
+            priority = QueryPriority.NORMAL
+        with self._not_empty:
+            heapq.heappush(self._heap, (priority, next(self._counter), item))
+            if priority != _SENTINEL_PRIORITY:
+                self.queued[priority] += 1
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        """Put a work item in the queue without blocking."""
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Remove and return the work item with the highest priority."""
+        with self._not_empty:
+            if not block:
+                if not self._heap:
+                    raise queue.Empty
+            elif not self._not_empty.wait_for(lambda: self._heap, timeout):
+                raise queue.Empty
+            priority, _, item = heapq.heappop(self._heap)
+            if priority != _SENTINEL_PRIORITY:
+                self.queued[priority] -= 1
+            return item
+
+    def get_nowait(self) -> Any:
+        """Remove and return the work item with the highest priority without blocking."""
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        """Return if the queue is empty."""
+        return not self._heap
+
+    def qsize(self) -> int:
+        """Return the number of work items in the queue."""
+        return len(self._heap)
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None],
@@ -33,6 +146,44 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
         self._shutdown_hook: Callable[[], None] = kwargs.pop("shutdown_hook")
         self.recorder_and_worker_thread_ids = recorder_and_worker_thread_ids
         super().__init__(*args, **kwargs)
+        self._work_queue: _PriorityWorkQueue = _PriorityWorkQueue()  # type: ignore[assignment]
+        self._latencies: dict[QueryPriority, deque[tuple[float, float]]] = {
+            priority: deque(maxlen=LATENCY_SAMPLES) for priority in QueryPriority
+        }
+        self._jobs: dict[QueryPriority, int] = dict.fromkeys(QueryPriority, 0)
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of workers."""
+        return self._max_workers
+
+    def submit_with_priority(
+        self, priority: QueryPriority, target: Callable[..., Any], *args: Any
+    ) -> Future[Any]:
+        """Submit a job that runs before the queued jobs with a lower priority."""
+        self._jobs[priority] += 1
+        return self.submit(
+            _PrioritizedJob(priority, target, self._latencies[priority]), *args
+        )
+
+    def latency(self) -> dict[str, QueryLatency]:
+        """Return the latency of the recent jobs of each priority."""
+        queued = self._work_queue.queued
+        result: dict[str, QueryLatency] = {}
+        for priority, latencies in self._latencies.items():
+            # Copy since the workers append to the deque
+            samples = list(latencies)
+            waits = [wait for wait, _ in samples] or [0.0]
+            runs = [run for _, run in samples] or [0.0]
+            result[priority.name.lower()] = {
+                "jobs": self._jobs[priority],
+                "queued": queued[priority],
+                "avg_wait": round(sum(waits) / len(waits) * 1000, 3),
+                "max_wait": round(max(waits) * 1000, 3),
+                "avg_run": round(sum(runs) / len(runs) * 1000, 3),
+                "max_run": round(max(runs) * 1000, 3),
+            }
+        return result
 
     def _adjust_thread_count(self) -> None:
         """Overridden to add support for shutdown hook.
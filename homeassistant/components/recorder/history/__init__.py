@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -13,9 +13,11 @@ from ... import recorder
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    SignificantStatesPosition,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_page as _modern_get_significant_states_page,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +26,11 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "SignificantStatesPosition",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_page",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -152,6 +156,55 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_page(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    max_chunks: int,
+    position: SignificantStatesPosition | None,
+) -> tuple[list[dict[str, list[dict[str, Any]]]], SignificantStatesPosition | None]:
+    """Return a page of the compressed significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        # The legacy schema returns all the states in one chunk
+        if states := _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ):
+            return [cast(dict[str, list[dict[str, Any]]], states)], None
+        return [], None
+    return _modern_get_significant_states_page(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+        max_chunks,
+        position,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
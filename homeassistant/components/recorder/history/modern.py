@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -21,6 +23,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -52,6 +55,15 @@ _FIELD_MAP = {
 }
 
 
+@dataclass(slots=True)
+class SignificantStatesPosition:
+    """The position a page of significant states continues from."""
+
+    last_row: Row
+    # The rows read with the metadata_id and last_updated_ts of the last row
+    last_rows: Counter[Row]
+
+
 def _stmt_and_join_attributes(
     no_attributes: bool,
     include_last_changed: bool,
@@ -201,6 +213,20 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
+def _select_after_position(
+    stmt: Select, after_metadata_id: int, after_last_updated_ts: float
+) -> Select:
+    """Select the rows ordered from a metadata_id and last_updated_ts."""
+    columns = stmt.selected_columns
+    return stmt.where(
+        (columns.metadata_id > after_metadata_id)
+        | (
+            (columns.metadata_id == after_metadata_id)
+            & (columns.last_updated_ts >= after_last_updated_ts)
+        )
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -227,6 +253,165 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        list(entity_id_to_metadata_id),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_page(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    max_chunks: int,
+    position: SignificantStatesPosition | None,
+) -> tuple[list[dict[str, list[dict[str, Any]]]], SignificantStatesPosition | None]:
+    """Return a page of the significant states during a period in chunks.
+
+    Each chunk holds the compressed states of at most chunk_size rows,
+    and a page holds at most max_chunks chunks. The states of an entity
+    continue in the next chunk when they do not fit in a chunk.
+
+    A page is read in its own session and continues from the position
+    the previous page returned, so no cursor or transaction is kept
+    open between the pages. Returns the chunks and the position of the
+    next page, or None once every row was read.
+    """
+    read_rows: Counter[Row] = position.last_rows if position else Counter()
+    # One more row is read to know if there is a next page
+    limit = chunk_size * max_chunks + read_rows.total() + 1
+    with session_scope(hass=hass, read_only=True) as session:
+        if (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                position.last_row if position else None,
+                limit,
+            )
+        ) is None:
+            return [], None
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        rows = cast(
+            list[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+    if has_next_page := len(rows) == limit:
+        del rows[-1]
+    # The page starts with the rows of the last row of the previous
+    # page, the ones that were already read are left out
+    unread_rows = rows
+    if read_rows:
+        read_rows = read_rows.copy()
+        unread_rows = []
+        for row in rows:
+            if read_rows[row]:
+                read_rows[row] -= 1
+            else:
+                unread_rows.append(row)
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    entity_ids = list(entity_id_to_metadata_id)
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    chunks: list[dict[str, list[dict[str, Any]]]] = []
+    last_row = position.last_row if position else None
+    for idx in range(0, len(unread_rows), chunk_size):
+        chunk = unread_rows[idx : idx + chunk_size]
+        # The last row of the previous chunk is converted again
+        # when the entity continues so the first state is not a
+        # full state, and the repeated states are still filtered
+        # with minimal_response
+        continued_entity_id: str | None = None
+        if (
+            last_row is not None
+            and (metadata_id := last_row[metadata_id_idx]) == chunk[0][metadata_id_idx]
+        ):
+            continued_entity_id = metadata_id_to_entity_id[metadata_id]
+            chunk.insert(0, last_row)
+        last_row = chunk[-1]
+        result = _sorted_states_to_dict(
+            chunk,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            True,
+            no_attributes=no_attributes,
+        )
+        if continued_entity_id is not None:
+            continued_states = result[continued_entity_id]
+            del continued_states[0]
+            if not continued_states:
+                del result[continued_entity_id]
+        if result:
+            chunks.append(cast(dict[str, list[dict[str, Any]]], result))
+    if not has_next_page or last_row is None:
+        return chunks, None
+    # The next page starts with the rows ordered the same as the last
+    # row since more rows can have its metadata_id and last_updated_ts
+    key = (last_row[metadata_id_idx], last_row[last_updated_ts_idx])
+    last_rows: Counter[Row] = Counter()
+    for row in reversed(rows):
+        if (row[metadata_id_idx], row[last_updated_ts_idx]) != key:
+            break
+        last_rows[row] += 1
+    return chunks, SignificantStatesPosition(last_row, last_rows)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    after_row: Row | None = None,
+    limit: int | None = None,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the statement of the significant states during a period.
+
+    The rows ordered before after_row are left out and at most limit
+    rows are read when they are set.
+
+    Returns None if none of the entities were recorded, otherwise the
+    statement, the metadata_ids of the entities and the start time of
+    the states at the start time.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -237,7 +422,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +460,18 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    if after_row is not None:
+        after_metadata_id = after_row[_FIELD_MAP["metadata_id"]]
+        after_last_updated_ts = after_row[_FIELD_MAP["last_updated_ts"]]
+        stmt += lambda s: _select_after_position(
+            s, after_metadata_id, after_last_updated_ts
+        )
+    if limit:
+        stmt += lambda s: s.limit(limit)
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
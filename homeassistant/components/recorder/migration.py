@@ -86,17 +86,23 @@ from .queries import (
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
     find_states_context_ids_to_migrate,
+    find_statistics_to_rollup,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_to_rollup,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import (
+    compile_statistics_rollup,
+    get_start_time,
+    statistics_rollup_time_zone_changed,
+)
 from .tasks import (
     CommitTask,
     EntityIDMigrationTask,
@@ -105,6 +111,7 @@ from .tasks import (
     PostSchemaMigrationTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupMigrationTask,
     StatisticsTimestampMigrationCleanupTask,
 )
 from .util import (
@@ -122,6 +129,10 @@ LIVE_MIGRATION_MIN_SCHEMA_VERSION = 0
 _EMPTY_ENTITY_ID = "missing.entity_id"
 _EMPTY_EVENT_TYPE = "missing_event_type"
 
+# The number of statistics the rollups are compiled for in each
+# migration task, each statistic has about 9000 hourly rows a year
+STATISTICS_ROLLUP_BATCH_SIZE = 20
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -1620,6 +1631,36 @@ def migrate_event_type_ids(instance: Recorder) -> bool:
     return is_done
 
 
+def migrate_statistics_rollup(instance: Recorder, after_metadata_id: int) -> int | None:
+    """Compile the rollups of a batch of statistics.
+
+    Returns the last metadata_id of the batch, or None if the rollups
+    of all statistics are compiled. If the migration fails the rollups
+    are not used, and the statistics are reduced from the hourly
+    statistics as before.
+    """
+    _LOGGER.debug("Compiling statistics rollups after %s", after_metadata_id)
+    with session_scope(session=instance.get_session()) as session:
+        if not after_metadata_id:
+            # Forget the rollups were compiled, so they are compiled
+            # again if Home Assistant is restarted before they are done
+            session.query(MigrationChanges).filter_by(
+                migration_id=StatisticsRollupMigration.migration_id
+            ).delete(synchronize_session=False)
+        if metadata_ids := list(
+            session.execute(
+                find_statistics_to_rollup(
+                    after_metadata_id, STATISTICS_ROLLUP_BATCH_SIZE
+                )
+            ).scalars()
+        ):
+            compile_statistics_rollup(session, metadata_ids)
+            return metadata_ids[-1]
+        _mark_migration_done(session, StatisticsRollupMigration)
+    _LOGGER.debug("Compiling statistics rollups done")
+    return None
+
+
 @retryable_database_job("migrate states entity_ids to states_meta")
 def migrate_entity_ids(instance: Recorder) -> bool:
     """Migrate entity_ids to states_meta.
@@ -1885,6 +1926,27 @@ class EntityIDMigration(BaseRunTimeMigration):
         return has_entity_ids_to_migrate()
 
 
+class StatisticsRollupMigration(BaseRunTimeMigration):
+    """Migration to compile the day, week and month rollups of the statistics."""
+
+    migration_id = "statistics_rollup"
+    task = StatisticsRollupMigrationTask
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are statistics to compile the rollups of."""
+        return has_statistics_to_rollup()
+
+    def needs_migrate(self) -> bool:
+        """Return if the migration needs to run.
+
+        The rollups are also compiled again if they were compiled
+        for another time zone than the configured time zone.
+        """
+        if super().needs_migrate():
+            return True
+        return statistics_rollup_time_zone_changed(self.session)
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
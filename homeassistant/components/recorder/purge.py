@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
@@ -25,6 +27,8 @@ from .queries import (
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_downsampled_rows,
+    delete_states_downsampled_rows_for_metadata_ids,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
@@ -38,6 +42,7 @@ from .queries import (
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_downsampled_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -53,6 +58,79 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The time in seconds a purge slice may hold the recorder thread
+# before it yields to the events that are waiting to be recorded
+PURGE_SLICE_TIME_BUDGET = 1.0
+
+# The maximum number of attributes or event data ids that may no longer
+# be used to collect before they are checked, even if there are still
+# states or events to purge
+MAX_UNUSED_ID_CANDIDATES = 100000
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge that runs in slices.
+
+    The progress is persisted so a purge that was interrupted by
+    a restart resumes where it stopped.
+    """
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    started: datetime = field(default_factory=dt_util.utcnow)
+    slices: int = 0
+    states: int = 0
+    events: int = 0
+    attributes: int = 0
+    data: int = 0
+    # Ids of the attributes and event data of purged rows which
+    # are checked once all rows that may use them are purged
+    attributes_ids: set[int] = field(default_factory=set)
+    data_ids: set[int] = field(default_factory=set)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress to report it."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "slices": self.slices,
+            "states": self.states,
+            "events": self.events,
+            "state_attributes": self.attributes,
+            "event_data": self.data,
+        }
+
+    def as_stored_dict(self) -> dict[str, Any]:
+        """Return the progress to persist it."""
+        return {
+            **self.as_dict(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "attributes_ids": list(self.attributes_ids),
+            "data_ids": list(self.data_ids),
+        }
+
+    @classmethod
+    def from_stored_dict(cls, data: dict[str, Any]) -> PurgeProgress:
+        """Return the progress from a persisted dict."""
+        return cls(
+            purge_before=dt_util.parse_datetime(
+                data["purge_before"], raise_on_error=True
+            ),
+            repack=data["repack"],
+            apply_filter=data["apply_filter"],
+            started=dt_util.parse_datetime(data["started"], raise_on_error=True),
+            slices=data["slices"],
+            states=data["states"],
+            events=data["events"],
+            attributes=data["state_attributes"],
+            data=data["event_data"],
+            attributes_ids=set(data["attributes_ids"]),
+            data_ids=set(data["data_ids"]),
+        )
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,15 +140,29 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If a progress is passed, the purge stops once it has used its time
+    budget, and the attributes and event data ids of the purged rows
+    are collected in the progress and only checked once all states or
+    events have been purged, instead of once for every slice.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if progress is None:
+        deadline = float("inf")
+        defer_unused_ids = False
+        progress = PurgeProgress(purge_before, repack, apply_filter)
+    else:
+        deadline = time.monotonic() + PURGE_SLICE_TIME_BUDGET
+        defer_unused_ids = True
+    progress.slices += 1
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -87,10 +179,22 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance,
+                session,
+                states_batch_size,
+                purge_before,
+                progress,
+                deadline,
+                defer_unused_ids,
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance,
+                session,
+                events_batch_size,
+                purge_before,
+                progress,
+                deadline,
+                defer_unused_ids,
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -105,7 +209,18 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        states_downsampled = _select_states_downsampled_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
+        if states_downsampled:
+            _purge_states_downsampled(session, states_downsampled)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or states_downsampled
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -178,6 +293,9 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
+    defer_unused_ids: bool,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -190,7 +308,7 @@ def _purge_states_and_attributes_ids(
     # we purge enough state_ids to try to generate a full
     # size batch of attributes_ids that will be around the size
     # max_bind_vars
-    attributes_ids_batch: set[int] = set()
+    attributes_ids_batch = progress.attributes_ids
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
@@ -200,9 +318,23 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
-        attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.states += len(state_ids)
+        attributes_ids_batch |= attributes_ids
+        if time.monotonic() >= deadline:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    # An attributes id can only become unused once no state that
+    # may use it is left to purge, so collected ids are not checked
+    # again after every slice.
+    if (
+        not defer_unused_ids
+        or not has_remaining_state_ids_to_purge
+        or len(attributes_ids_batch) >= MAX_UNUSED_ID_CANDIDATES
+    ):
+        progress.attributes += _purge_unused_attributes_ids(
+            instance, session, attributes_ids_batch
+        )
+        attributes_ids_batch.clear()
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,6 +347,9 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
+    defer_unused_ids: bool,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -225,7 +360,7 @@ def _purge_events_and_data_ids(
     # we purge enough event_ids to try to generate a full
     # size batch of data_ids that will be around the size
     # max_bind_vars
-    data_ids_batch: set[int] = set()
+    data_ids_batch = progress.data_ids
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
@@ -235,9 +370,19 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
-        data_ids_batch = data_ids_batch | data_ids
+        progress.events += len(event_ids)
+        data_ids_batch |= data_ids
+        if time.monotonic() >= deadline:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    # See _purge_states_and_attributes_ids
+    if (
+        not defer_unused_ids
+        or not has_remaining_event_ids_to_purge
+        or len(data_ids_batch) >= MAX_UNUSED_ID_CANDIDATES
+    ):
+        progress.data += _purge_unused_data_ids(instance, session, data_ids_batch)
+        data_ids_batch.clear()
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -365,14 +510,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -413,13 +559,14 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -454,6 +601,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_states_downsampled_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of downsampled states to purge."""
+    states_downsampled = session.execute(
+        find_states_downsampled_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s downsampled states to remove", len(states_downsampled))
+    return [states_downsampled_id for (states_downsampled_id,) in states_downsampled]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -570,6 +728,12 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_states_downsampled(session: Session, states_downsampled: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_states_downsampled_rows(states_downsampled))
+    _LOGGER.debug("Deleted %s downsampled states", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -622,6 +786,13 @@ def _purge_old_entity_ids(instance: Recorder, session: Session) -> None:
     if not states_metadata_ids:
         return
 
+    # The entities may still have newer downsampled states
+    # if their states were purged by an entity filter
+    session.execute(
+        delete_states_downsampled_rows_for_metadata_ids(
+            states_metadata_ids, time.time()
+        )
+    )
     deleted_rows = session.execute(delete_states_meta_rows(states_metadata_ids))
     _LOGGER.debug("Deleted %s states meta", deleted_rows)
 
@@ -695,6 +866,11 @@ def _purge_filtered_states(
         .all()
     )
     if not to_purge:
+        session.execute(
+            delete_states_downsampled_rows_for_metadata_ids(
+                metadata_ids_to_purge, purge_before_timestamp
+            )
+        )
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
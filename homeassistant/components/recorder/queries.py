@@ -17,8 +17,10 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -591,6 +593,29 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_states_downsampled_rows(
+    states_downsampled_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete states_downsampled rows."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.id.in_(states_downsampled_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_downsampled_rows_for_metadata_ids(
+    metadata_ids: Iterable[int], purge_before_ts: float
+) -> StatementLambdaElement:
+    """Delete states_downsampled rows of entities that started before purge_before_ts."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .where(StatesDownsampled.start_ts < purge_before_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -648,6 +673,18 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_states_downsampled_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find downsampled states to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesDownsampled.id)
+        .filter(StatesDownsampled.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -963,3 +1000,20 @@ def delete_duplicate_statistics_row(statistic_id: int) -> StatementLambdaElement
         .where(Statistics.id == statistic_id)
         .execution_options(synchronize_session=False)
     )
+
+
+def has_statistics_to_rollup() -> StatementLambdaElement:
+    """Check if there are statistics to compile the rollups of."""
+    return lambda_stmt(lambda: select(Statistics.id).limit(1))
+
+
+def find_statistics_to_rollup(
+    after_metadata_id: int, batch_size: int
+) -> StatementLambdaElement:
+    """Find the statistics after a metadata_id to compile the rollups of."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.id)
+        .filter(StatisticsMeta.id > after_metadata_id)
+        .order_by(StatisticsMeta.id)
+        .limit(batch_size)
+    )
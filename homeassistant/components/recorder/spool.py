@@ -0,0 +1,221 @@
+"""On-disk spool for events that overflow the recorder queue."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import suppress
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads_object
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_SEGMENT_PREFIX = "segment-"
+SPOOL_SEGMENT_MAX_SIZE = 16 * 1024 * 1024
+
+# Each record is the length of the payload followed by the payload
+_RECORD_HEADER = struct.Struct("<I")
+
+
+def _encode_event(event: Event[Any]) -> bytes:
+    """Encode an event as a spool record."""
+    context = event.context
+    payload = json_bytes(
+        {
+            "event_type": event.event_type,
+            "data": event.data,
+            "origin": event.origin.value,
+            "time_fired_ts": event.time_fired_timestamp,
+            "context": [context.id, context.user_id, context.parent_id],
+        }
+    )
+    return _RECORD_HEADER.pack(len(payload)) + payload
+
+
+def _decode_state(state_dict: dict[str, Any] | None) -> State | None:
+    """Decode a state from a spool record."""
+    if state_dict is None:
+        return None
+    context = state_dict["context"]
+    return State(
+        state_dict["entity_id"],
+        state_dict["state"],
+        state_dict["attributes"],
+        last_changed=dt_util.parse_datetime(state_dict["last_changed"]),
+        last_reported=dt_util.parse_datetime(state_dict["last_reported"]),
+        last_updated=dt_util.parse_datetime(state_dict["last_updated"]),
+        context=Context(context["user_id"], context["parent_id"], context["id"]),
+        validate_entity_id=False,
+    )
+
+
+def _decode_event(payload: bytes) -> Event[Any]:
+    """Decode an event from a spool record."""
+    record = json_loads_object(payload)
+    event_type = record["event_type"]
+    data: dict[str, Any] = record["data"]  # type: ignore[assignment]
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = _decode_state(data["old_state"])  # type: ignore[arg-type]
+        data["new_state"] = _decode_state(data["new_state"])  # type: ignore[arg-type]
+    context_id, user_id, parent_id = record["context"]  # type: ignore[misc]
+    return Event(
+        event_type,  # type: ignore[arg-type]
+        data,
+        EventOrigin(record["origin"]),
+        record["time_fired_ts"],  # type: ignore[arg-type]
+        Context(user_id, parent_id, context_id),  # type: ignore[arg-type]
+    )
+
+
+class EventSpool:
+    """Append-only spool of events split into segment files.
+
+    Events are appended from an executor thread while the recorder
+    queue is over its maximum size, and read back by the recorder
+    thread once the database catches up. Segments are memory mapped
+    when they are read and removed once every event in them has been
+    read. Segments left over from a previous run are read first.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        # Segment numbers on disk, oldest first
+        self._segments: list[int] = []
+        self._read_offset = 0
+        self._write_size = 0
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of events that have not been read."""
+        return self._pending
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self.path, f"{SPOOL_SEGMENT_PREFIX}{segment:08d}")
+
+    def _load(self) -> None:
+        """Find the segments left over from a previous run."""
+        self._loaded = True
+        os.makedirs(self.path, exist_ok=True)
+        self._segments = sorted(
+            int(name.removeprefix(SPOOL_SEGMENT_PREFIX))
+            for name in os.listdir(self.path)
+            if name.startswith(SPOOL_SEGMENT_PREFIX)
+        )
+        for segment in self._segments:
+            size = os.path.getsize(self._segment_path(segment))
+            self._pending += sum(1 for _ in self._iter_records(segment, 0, size))
+        if self._segments:
+            # The last segment may end with a partly written record
+            # so new events are always appended to a new segment
+            self._write_size = SPOOL_SEGMENT_MAX_SIZE
+        if self._pending:
+            _LOGGER.info(
+                "Found %s events spooled by a previous run in %s",
+                self._pending,
+                self.path,
+            )
+
+    def _iter_records(
+        self, segment: int, offset: int, size: int
+    ) -> Iterable[tuple[int, bytes]]:
+        """Iterate the records of a segment as (end offset, payload) tuples.
+
+        A record that was only partly written, because Home Assistant
+        was stopped while it was written, ends the segment.
+        """
+        if offset >= size:
+            return
+        with (
+            open(self._segment_path(segment), "rb") as segment_file,
+            mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            size = min(size, len(mapped))
+            header_size = _RECORD_HEADER.size
+            while offset + header_size <= size:
+                (length,) = _RECORD_HEADER.unpack_from(mapped, offset)
+                end = offset + header_size + length
+                if end > size:
+                    return
+                yield end, mapped[offset + header_size : end]
+                offset = end
+
+    def append(self, events: Iterable[Event[Any]]) -> int:
+        """Append events to the spool and return the number appended.
+
+        Events that cannot be serialized are logged and dropped,
+        as they could not be recorded either.
+        """
+        records: list[bytes] = []
+        for event in events:
+            try:
+                records.append(_encode_event(event))
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "Event is not JSON serializable, not spooled: %s", event
+                )
+        if not records:
+            return 0
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if not self._segments or self._write_size >= SPOOL_SEGMENT_MAX_SIZE:
+                self._segments.append(self._segments[-1] + 1 if self._segments else 0)
+                self._write_size = 0
+            payload = b"".join(records)
+            with open(self._segment_path(self._segments[-1]), "ab") as segment_file:
+                segment_file.write(payload)
+            self._write_size += len(payload)
+            self._pending += len(records)
+        return len(records)
+
+    def read(self, max_events: int) -> list[Event[Any]]:
+        """Read up to max_events events from the oldest segments.
+
+        Events are removed from the spool once they have been read.
+        """
+        events: list[Event[Any]] = []
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            while self._segments and len(events) < max_events:
+                segment = self._segments[0]
+                newest = len(self._segments) == 1
+                size = (
+                    self._write_size
+                    if newest
+                    else os.path.getsize(self._segment_path(segment))
+                )
+                for end, payload in self._iter_records(
+                    segment, self._read_offset, size
+                ):
+                    self._read_offset = end
+                    try:
+                        events.append(_decode_event(payload))
+                    except (KeyError, TypeError, ValueError):
+                        _LOGGER.warning("Dropping corrupt event in %s", self.path)
+                    self._pending -= 1
+                    if len(events) >= max_events:
+                        break
+                else:
+                    # The segment has been read to the end
+                    with suppress(FileNotFoundError):
+                        os.unlink(self._segment_path(segment))
+                    self._segments.pop(0)
+                    self._read_offset = 0
+                    if newest:
+                        self._write_size = 0
+        return events
@@ -9,11 +9,12 @@ from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, delete, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -58,6 +59,7 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsRollup,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -103,6 +105,31 @@ QUERY_STATISTICS_SHORT_TERM = (
     StatisticsShortTerm.sum,
 )
 
+QUERY_STATISTICS_ROLLUP = (
+    StatisticsRollup.metadata_id,
+    StatisticsRollup.start_ts,
+    StatisticsRollup.end_ts,
+    StatisticsRollup.mean_sum,
+    StatisticsRollup.mean_compensation,
+    StatisticsRollup.mean_count,
+    StatisticsRollup.min,
+    StatisticsRollup.max,
+    StatisticsRollup.last_reset_ts,
+    StatisticsRollup.state,
+    StatisticsRollup.sum,
+)
+
+QUERY_STATISTICS_ROLLUP_HOURS = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.mean,
+    Statistics.min,
+    Statistics.max,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+)
+
 QUERY_STATISTICS_SUMMARY_MEAN = (
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -441,6 +468,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    _add_hourly_statistics_to_rollup(session, start_time_ts, summary)
 
 
 @retryable_database_job("compile missing statistics")
@@ -1100,6 +1128,331 @@ def _reduce_statistics_per_month(
     )
 
 
+STATISTICS_ROLLUP_PERIODS: dict[str, int] = {"day": 1, "week": 2, "month": 3}
+
+_STATISTICS_ROLLUP_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _new_statistics_rollup(
+    metadata_id: int, period: int, start_ts: float, end_ts: float
+) -> StatisticsRollup:
+    """Return an empty rollup of a statistic for a period."""
+    return StatisticsRollup(
+        metadata_id=metadata_id,
+        period=period,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        mean_sum=0.0,
+        mean_compensation=0.0,
+        mean_count=0,
+    )
+
+
+def _add_hour_to_statistics_rollup(
+    rollup: StatisticsRollup,
+    start_ts: float,
+    _mean: float | None,
+    _min: float | None,
+    _max: float | None,
+    last_reset_ts: float | None,
+    state: float | None,
+    _sum: float | None,
+) -> None:
+    """Add the hourly statistics that follow the last hour of a rollup.
+
+    This reduces the hours the same way _reduce_statistics does. The means
+    are summed with the same compensated summation as the sum builtin, so
+    the mean of the rollup is the same as the mean of the hourly means.
+    """
+    if _mean is not None:
+        mean_sum = rollup.mean_sum
+        total = mean_sum + _mean
+        if abs(mean_sum) >= abs(_mean):
+            rollup.mean_compensation += (mean_sum - total) + _mean
+        else:
+            rollup.mean_compensation += (_mean - total) + mean_sum
+        rollup.mean_sum = total
+        rollup.mean_count += 1
+    if _min is not None and (rollup.min is None or _min < rollup.min):
+        rollup.min = _min
+    if _max is not None and (rollup.max is None or _max > rollup.max):
+        rollup.max = _max
+    rollup.last_reset_ts = last_reset_ts
+    rollup.state = state
+    rollup.sum = _sum
+    rollup.last_start_ts = start_ts
+
+
+def _compile_statistics_rollup_period(
+    session: Session,
+    period: str,
+    metadata_ids: Sequence[int],
+    first_hour_ts: float | None,
+    last_hour_ts: float | None,
+) -> None:
+    """Compile the rollups of statistics for a period from their hourly statistics.
+
+    The rollups of the periods of first_hour_ts to last_hour_ts are
+    replaced, or all rollups of the statistics if they are None.
+    """
+    _, period_start_end = _STATISTICS_ROLLUP_FACTORIES[period]()
+    period_id = STATISTICS_ROLLUP_PERIODS[period]
+    delete_stmt = (
+        delete(StatisticsRollup)
+        .filter(StatisticsRollup.metadata_id.in_(metadata_ids))
+        .filter(StatisticsRollup.period == period_id)
+    )
+    hours_stmt = select(*QUERY_STATISTICS_ROLLUP_HOURS).filter(
+        Statistics.metadata_id.in_(metadata_ids)
+    )
+    if first_hour_ts is not None:
+        start_ts = period_start_end(first_hour_ts)[0]
+        delete_stmt = delete_stmt.filter(StatisticsRollup.start_ts >= start_ts)
+        hours_stmt = hours_stmt.filter(Statistics.start_ts >= start_ts)
+    if last_hour_ts is not None:
+        end_ts = period_start_end(last_hour_ts)[1]
+        delete_stmt = delete_stmt.filter(StatisticsRollup.start_ts < end_ts)
+        hours_stmt = hours_stmt.filter(Statistics.start_ts < end_ts)
+    session.execute(delete_stmt.execution_options(synchronize_session=False))
+
+    rollups: list[StatisticsRollup] = []
+    rollup: StatisticsRollup | None = None
+    for metadata_id, start_ts, *values in session.execute(
+        hours_stmt.order_by(Statistics.metadata_id, Statistics.start_ts)
+    ):
+        if (
+            rollup is None
+            or rollup.metadata_id != metadata_id
+            or start_ts >= rollup.end_ts
+        ):
+            rollup = _new_statistics_rollup(
+                metadata_id, period_id, *period_start_end(start_ts)
+            )
+            rollups.append(rollup)
+        _add_hour_to_statistics_rollup(rollup, start_ts, *values)
+    session.add_all(rollups)
+
+
+def compile_statistics_rollup(
+    session: Session,
+    metadata_ids: Sequence[int],
+    first_hour_ts: float | None = None,
+    last_hour_ts: float | None = None,
+) -> None:
+    """Compile the rollups of statistics from their hourly statistics.
+
+    The rollups of the periods of first_hour_ts to last_hour_ts are
+    replaced, or all rollups of the statistics if they are None.
+    """
+    for period in STATISTICS_ROLLUP_PERIODS:
+        _compile_statistics_rollup_period(
+            session, period, metadata_ids, first_hour_ts, last_hour_ts
+        )
+
+
+def _add_hourly_statistics_to_rollup(
+    session: Session, start_ts: float, summary: dict[int, StatisticDataTimestamp]
+) -> None:
+    """Add compiled hourly statistics to the rollups of their periods."""
+    for period, factory in _STATISTICS_ROLLUP_FACTORIES.items():
+        _, period_start_end = factory()
+        period_start_ts, period_end_ts = period_start_end(start_ts)
+        period_id = STATISTICS_ROLLUP_PERIODS[period]
+        rollups: dict[int | None, StatisticsRollup] = {
+            rollup.metadata_id: rollup
+            for rollup in session.execute(
+                select(StatisticsRollup)
+                .filter(StatisticsRollup.period == period_id)
+                .filter(StatisticsRollup.start_ts == period_start_ts)
+            ).scalars()
+        }
+        out_of_order: list[int] = []
+        for metadata_id, stat in summary.items():
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = _new_statistics_rollup(
+                    metadata_id, period_id, period_start_ts, period_end_ts
+                )
+                session.add(rollup)
+            elif rollup.last_start_ts is None or rollup.last_start_ts >= start_ts:
+                # Later hours are already in the rollup
+                out_of_order.append(metadata_id)
+                continue
+            _add_hour_to_statistics_rollup(
+                rollup,
+                start_ts,
+                stat.get("mean"),
+                stat.get("min"),
+                stat.get("max"),
+                stat.get("last_reset_ts"),
+                stat.get("state"),
+                stat.get("sum"),
+            )
+        if out_of_order:
+            _compile_statistics_rollup_period(
+                session, period, out_of_order, start_ts, start_ts
+            )
+
+
+def _adjust_sum_statistics_rollup(
+    session: Session, metadata_id: int, start_time: datetime, adj: float
+) -> None:
+    """Adjust the sum of the rollups whose last hour was adjusted."""
+    start_time_ts = start_time.timestamp()
+    try:
+        session.query(StatisticsRollup).filter_by(metadata_id=metadata_id).filter(
+            StatisticsRollup.last_start_ts >= start_time_ts
+        ).update(
+            {StatisticsRollup.sum: StatisticsRollup.sum + adj},
+            synchronize_session=False,
+        )
+    except SQLAlchemyError:
+        _LOGGER.exception(
+            "Unexpected exception when updating statistics rollup %s", metadata_id
+        )
+
+
+def statistics_rollup_time_zone_changed(session: Session) -> bool:
+    """Return if the rollups were compiled for another time zone."""
+    if (
+        start_ts := session.execute(
+            select(StatisticsRollup.start_ts)
+            .filter(StatisticsRollup.period == STATISTICS_ROLLUP_PERIODS["day"])
+            .order_by(StatisticsRollup.start_ts.desc())
+            .limit(1)
+        ).scalar()
+    ) is None:
+        return False
+    _, day_start_end = reduce_day_ts_factory()
+    return day_start_end(start_ts)[0] != start_ts
+
+
+def _generate_statistics_rollup_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period_id: int,
+) -> StatementLambdaElement:
+    """Prepare a database query for the rollups of statistics during a period."""
+    start_time_ts = start_time.timestamp()
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_ROLLUP)
+        .filter(StatisticsRollup.period == period_id)
+        .filter(StatisticsRollup.start_ts >= start_time_ts)
+    )
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(StatisticsRollup.start_ts < end_time_ts)
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsRollup.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(
+        StatisticsRollup.metadata_id, StatisticsRollup.start_ts
+    )
+    return stmt
+
+
+def _statistics_rollup_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return the rollups of statistics during a period.
+
+    The rows are the same as the rows _reduce_statistics returns. None is
+    returned if the mean of a statistic has to be converted to another unit,
+    as the mean of the converted hourly means would not be the same.
+    """
+    stmt = _generate_statistics_rollup_during_period_stmt(
+        start_time, end_time, metadata_ids, STATISTICS_ROLLUP_PERIODS[period]
+    )
+    rows = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    result: dict[str, list[StatisticsRow]] = {}
+    if not rows:
+        return result
+    metadata = dict(_metadata.values())
+    rows_by_meta_id = {
+        meta_id: list(group) for meta_id, group in groupby(rows, itemgetter(0))
+    }
+    if statistic_ids is not None:
+        # Keep the order of the statistic ids like _sorted_statistics_to_dict
+        seen_statistic_ids = {
+            metadata[meta_id]["statistic_id"] for meta_id in rows_by_meta_id
+        }
+        for statistic_id in statistic_ids:
+            if statistic_id in seen_statistic_ids:
+                result[statistic_id] = []
+
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    for meta_id, db_rows in rows_by_meta_id.items():
+        metadata_by_id = metadata[meta_id]
+        statistic_id = metadata_by_id["statistic_id"]
+        state_unit = unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+        if convert is not None and _want_mean:
+            return None
+
+        stat_rows: list[StatisticsRow] = []
+        for (
+            _,
+            start_ts,
+            end_ts,
+            mean_sum,
+            mean_compensation,
+            mean_count,
+            _min,
+            _max,
+            last_reset_ts,
+            _state,
+            _sum,
+        ) in db_rows:
+            row: StatisticsRow = {"start": start_ts, "end": end_ts}
+            if _want_mean:
+                if mean_count:
+                    if mean_compensation and math.isfinite(mean_compensation):
+                        mean_sum += mean_compensation
+                    row["mean"] = mean_sum / mean_count
+                else:
+                    row["mean"] = None
+            if _want_min:
+                row["min"] = convert(_min) if convert else _min
+            if _want_max:
+                row["max"] = convert(_max) if convert else _max
+            if _want_last_reset:
+                row["last_reset"] = last_reset_ts
+            if _want_state:
+                row["state"] = convert(_state) if convert else _state
+            if _want_sum:
+                row["sum"] = convert(_sum) if convert else _sum
+            stat_rows.append(row)
+        result[statistic_id] = stat_rows
+    return result
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1755,35 +2108,56 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    result: dict[str, list[StatisticsRow]] | None = None
+    if (
+        period in STATISTICS_ROLLUP_PERIODS
+        and get_instance(hass).statistics_rollup_ready
+    ):
+        result = _statistics_rollup_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
+        if result is not None and not result:
+            return {}
 
-    if not stats:
-        return {}
+    if result is None:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if not stats:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
+
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2439,16 +2813,35 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
+    imported = False
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if imported and table == Statistics:
+        # The rollups are compiled once the statistics are committed, as
+        # duplicated statistics are only blocked when they are committed
+        hour_starts = [dt_util.utc_to_timestamp(stat["start"]) for stat in statistics]
+        with session_scope(session=instance.get_session()) as session:
+            if hour_starts and (
+                metadata_id_and_metadata := instance.statistics_meta_manager.get(
+                    session, metadata["statistic_id"]
+                )
+            ):
+                compile_statistics_rollup(
+                    session,
+                    [metadata_id_and_metadata[0]],
+                    min(hour_starts),
+                    max(hour_starts),
+                )
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2489,6 +2882,13 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_sum_statistics_rollup(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
@@ -2552,6 +2952,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        compile_statistics_rollup(session, [metadata_id])
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
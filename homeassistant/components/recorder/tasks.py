@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import downsample, entity_registry, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
@@ -110,10 +110,41 @@ class PurgeTask(RecorderTask):
     apply_filter: bool
 
     def run(self, instance: Recorder) -> None:
-        """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        """Purge the database.
+
+        Each task purges a slice, and queues the next task
+        to continue the purge after the queued events.
+        """
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.purge_before != self.purge_before
+            or progress.repack != self.repack
+            or progress.apply_filter != self.apply_filter
         ):
+            new_progress = purge.PurgeProgress(
+                self.purge_before, self.repack, self.apply_filter
+            )
+            if progress is not None:
+                # The rows of the previous purge are deleted, the attributes
+                # and event data they used are still to be checked
+                new_progress.attributes_ids |= progress.attributes_ids
+                new_progress.data_ids |= progress.data_ids
+            progress = instance.purge_progress = new_progress
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress=progress,
+        )
+        if finished:
+            instance.purge_progress = None
+        instance.hass.add_job(
+            instance.async_save_purge_progress,
+            None if finished else progress.as_stored_dict(),
+        )
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -169,6 +200,20 @@ class StatisticsTask(RecorderTask):
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
 
 
+@dataclass(slots=True)
+class DownsampleTask(RecorderTask):
+    """An object to insert into the recorder queue to compile downsampled states."""
+
+    end: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Run downsample task."""
+        if downsample.compile_downsampled_states(instance, self.end):
+            return
+        # Schedule a new downsample task if this one didn't finish
+        instance.queue_task(DownsampleTask(self.end))
+
+
 @dataclass(slots=True)
 class CompileMissingStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a compile missing statistics."""
@@ -291,6 +336,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class SpoolDrainTask(RecorderTask):
+    """Record the events in the spool."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._drain_spool()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -427,6 +483,27 @@ class EntityIDMigrationTask(RecorderTask):
             instance.queue_task(EntityIDPostMigrationTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupMigrationTask(RecorderTask):
+    """An object to insert into the recorder queue to compile the statistics rollups."""
+
+    after_metadata_id: int = 0
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup migration task."""
+        if (
+            last_metadata_id := instance._migrate_statistics_rollup(  # noqa: SLF001
+                self.after_metadata_id
+            )
+        ) is not None:
+            # Schedule a new migration task for the next batch of statistics
+            instance.queue_task(StatisticsRollupMigrationTask(last_metadata_id))
+        else:
+            # The rollups of all statistics are compiled, so
+            # the statistics queries can start using them
+            instance.statistics_rollup_ready = True
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
@@ -36,9 +36,12 @@ from .const import (
     DATA_INSTANCE,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
+    LONG_QUERY_PERIOD,
+    SHORT_QUERY_PERIOD,
     SQLITE_MAX_BIND_VARS,
     SQLITE_MODERN_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
+    QueryPriority,
     SupportedDialect,
 )
 from .db_schema import (
@@ -776,6 +779,24 @@ def get_instance(hass: HomeAssistant) -> Recorder:
     return hass.data[DATA_INSTANCE]
 
 
+def query_priority(
+    start_time: datetime | None, end_time: datetime | None
+) -> QueryPriority:
+    """Return the priority of a query for a period.
+
+    Queries for a short period, such as the latest states, should
+    not wait behind queries for a long period, such as an export.
+    """
+    if start_time is None:
+        return QueryPriority.LOW
+    period = (end_time or dt_util.utcnow()) - start_time
+    if period <= SHORT_QUERY_PERIOD:
+        return QueryPriority.HIGH
+    if period > LONG_QUERY_PERIOD:
+        return QueryPriority.LOW
+    return QueryPriority.NORMAL
+
+
 PERIOD_SCHEMA = vol.Schema(
     {
         vol.Exclusive("calendar", "period"): vol.Schema(
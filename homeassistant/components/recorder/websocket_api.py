@@ -44,7 +44,7 @@ from .statistics import (
     statistics_during_period,
     validate_statistics,
 )
-from .util import PERIOD_SCHEMA, get_instance, resolve_period
+from .util import PERIOD_SCHEMA, get_instance, query_priority, resolve_period
 
 UNIT_SCHEMA = vol.Schema(
     {
@@ -136,6 +136,7 @@ async def ws_get_statistic_during_period(
             msg["statistic_id"],
             msg.get("types"),
             msg.get("units"),
+            priority=query_priority(start_time, end_time),
         )
     )
 
@@ -205,6 +206,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            priority=query_priority(start_time, end_time),
         )
     )
 
@@ -495,6 +497,12 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        read_pool = instance.async_read_pool_info()
+        purge = (
+            progress.as_dict()
+            if (progress := instance.purge_progress) is not None
+            else None
+        )
     else:
         backlog = None
         migration_in_progress = False
@@ -502,12 +510,16 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        read_pool = None
+        purge = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge": purge,
+        "read_pool": read_pool,
         "recording": recording,
         "thread_running": is_running,
     }
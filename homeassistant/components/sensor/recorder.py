@@ -8,8 +8,10 @@ import datetime
 import itertools
 import logging
 import math
+from operator import attrgetter, itemgetter
 from typing import Any
 
+import numpy as np
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components.recorder import (
@@ -140,6 +142,166 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _float_states_to_arrays(
+    entities_float_states: list[list[tuple[float, State]]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenate the float states of entities into arrays.
+
+    Returns the values, the last_updated times in microseconds since the
+    epoch, and the offset and number of states of each entity.
+    """
+    lengths = np.fromiter(
+        map(len, entities_float_states),
+        dtype=np.int64,
+        count=len(entities_float_states),
+    )
+    offsets = np.zeros_like(lengths)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    float_states = list(itertools.chain.from_iterable(entities_float_states))
+    values = np.fromiter(
+        map(itemgetter(0), float_states), dtype=np.float64, count=len(float_states)
+    )
+    # Microseconds are kept as integers so the durations are exactly the
+    # durations of the timedeltas between the states. Rounding the float
+    # timestamps gives the microseconds of the datetimes, unless they are
+    # too close to half a microsecond to be rounded the same way.
+    microseconds = (
+        np.fromiter(
+            map(attrgetter("last_updated_timestamp"), map(itemgetter(1), float_states)),
+            dtype=np.float64,
+            count=len(float_states),
+        )
+        * 1e6
+    )
+    last_updated = np.rint(microseconds)
+    for index in np.flatnonzero(np.abs(microseconds - last_updated) > 0.25).tolist():
+        last_updated[index] = (
+            float_states[index][1].last_updated - _EPOCH
+        ) // _MICROSECOND
+    return values, last_updated.astype(np.int64), offsets, lengths
+
+
+def _time_weighted_averages(
+    values: np.ndarray,
+    last_updated: np.ndarray,
+    offsets: np.ndarray,
+    lengths: np.ndarray,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> np.ndarray:
+    """Calculate the time weighted average of each entity.
+
+    This is the vectorized form of _time_weighted_average and returns
+    the same results. The weighted values of each entity are accumulated
+    in order, one state of every entity at a time, as floating point
+    additions in a different order would round differently.
+    """
+    start_us = (start - _EPOCH) // _MICROSECOND
+    end_us = (end - _EPOCH) // _MICROSECOND
+    start_times = np.maximum(last_updated, start_us)
+    # Each state lasts until the next state of the entity,
+    # the last state of each entity lasts until the end
+    end_times = np.empty_like(start_times)
+    end_times[:-1] = start_times[1:]
+    end_times[offsets + lengths - 1] = end_us
+    weighted = values * ((end_times - start_times) / 1e6)
+
+    # Entities with the most states first, so the entities that
+    # still have states to accumulate are always the first ones
+    order = np.argsort(-lengths, kind="stable")
+    sorted_offsets = offsets[order]
+    descending_lengths = -lengths[order]
+    accumulated = np.zeros(len(lengths))
+    for index in range(int(-descending_lengths[0])):
+        active = int(np.searchsorted(descending_lengths, -index))
+        accumulated[:active] += weighted[sorted_offsets[:active] + index]
+
+    period_seconds = (end_us - start_times[sorted_offsets]) / 1e6
+    averages = np.zeros(len(lengths))
+    # If the only state change happened at the exact moment at the end
+    # of the period, the average is 0.0, as in _time_weighted_average
+    np.divide(accumulated, period_seconds, out=averages, where=period_seconds != 0)
+    result = np.empty_like(averages)
+    result[order] = averages
+    return result
+
+
+def _compile_vectorized_statistics(
+    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]],
+    wanted_statistics: dict[str, set[str]],
+    last_stats: dict[str, list[statistics.StatisticsRow]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, StatisticData]:
+    """Compile the statistics of all entities that can be compiled as arrays.
+
+    The float states of every entity are converted to arrays once, and the
+    mean, min and max are calculated for all entities at once. The sum of a
+    total_increasing sensor is calculated at once when it continues a
+    previous sum and its states did not decrease or go negative during the
+    period, the sum of other sensors has to be compiled state by state to
+    detect cycles and is not included in the result.
+    """
+    if not to_process:
+        return {}
+    values, last_updated, offsets, lengths = _float_states_to_arrays(
+        [valid_float_states for *_, valid_float_states in to_process]
+    )
+    minimums = np.minimum.reduceat(values, offsets).tolist()
+    maximums = np.maximum.reduceat(values, offsets).tolist()
+    means = _time_weighted_averages(
+        values, last_updated, offsets, lengths, start, end
+    ).tolist()
+
+    # The previous state of the first state of each entity is the state
+    # of the last compiled statistics, NaN fails every comparison below
+    previous_states = np.empty_like(values)
+    previous_states[1:] = values[:-1]
+    initial_states = np.full(len(to_process), np.nan)
+    initial_sums = np.zeros(len(to_process))
+    for index, (entity_id, _, state_class, _) in enumerate(to_process):
+        if (
+            state_class == SensorStateClass.TOTAL_INCREASING
+            and "sum" in wanted_statistics[entity_id]
+            and entity_id in last_stats
+            and (last_state := last_stats[entity_id][0].get("state")) is not None
+        ):
+            initial_states[index] = last_state
+            initial_sums[index] = last_stats[entity_id][0].get("sum") or 0.0
+    previous_states[offsets] = initial_states
+    # A state that is lower than the state before it is a dip or a new cycle
+    increasing = np.logical_and.reduceat(
+        (values >= 0) & (values >= previous_states), offsets
+    ).tolist()
+    sums = (initial_sums + (values[offsets + lengths - 1] - initial_states)).tolist()
+    last_values = values[offsets + lengths - 1].tolist()
+
+    result: dict[str, StatisticData] = {}
+    for index, (entity_id, _, _, _) in enumerate(to_process):
+        wanted = wanted_statistics[entity_id]
+        stat: StatisticData = {"start": start}
+        if "max" in wanted:
+            stat["max"] = maximums[index]
+        if "min" in wanted:
+            stat["min"] = minimums[index]
+        if "mean" in wanted:
+            stat["mean"] = means[index]
+        if increasing[index]:
+            last_stat = last_stats[entity_id][0]
+            if (
+                last_reset := _timestamp_to_isoformat_or_none(last_stat["last_reset"])
+            ) is not None:
+                stat["last_reset"] = dt_util.parse_datetime(last_reset)
+            stat["sum"] = sums[index]
+            stat["state"] = last_values[index]
+        result[entity_id] = stat
+    return result
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -468,6 +630,9 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    vectorized_stats = _compile_vectorized_statistics(
+        to_process, wanted_statistics, last_stats, start, end
+    )
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -509,21 +674,11 @@ def compile_statistics(  # noqa: C901
             "unit_of_measurement": statistics_unit,
         }
 
-        # Make calculations
-        stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        # The mean, min and max, and the sum if it could be compiled
+        # without going through the states one by one
+        stat = vectorized_stats[entity_id]
 
-        if "sum" in wanted_statistics[entity_id]:
+        if "sum" in wanted_statistics[entity_id] and "sum" not in stat:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
@@ -57,6 +57,7 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        wait_for_written: Callable[[], Coroutine[Any, Any, None]],
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
@@ -67,6 +68,8 @@ class AuthPhase:
         self._request = request
         # send_bytes_text will directly send a message to the client.
         self._send_bytes_text = send_bytes_text
+        # wait_for_written will wait until the queued messages are written.
+        self._wait_for_written = wait_for_written
 
     async def async_handle(self, msg: JsonValueType) -> ActiveConnection:
         """Handle authentication."""
@@ -89,6 +92,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._wait_for_written,
             )
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -42,9 +42,13 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "coalesce_window",
+        "coalesce_max_bytes",
+        "can_compress",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_for_written",
     )
 
     def __init__(
@@ -54,6 +58,7 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_written: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -64,11 +69,15 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.coalesce_window = 0.0
+        self.coalesce_max_bytes = const.DEFAULT_COALESCE_MAX_BYTES
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_for_written = wait_for_written
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -79,6 +88,21 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        # The messages are coalesced until the window ends
+        # instead of until no more messages are queued
+        self.coalesce_window = (
+            min(
+                features.get(const.FEATURE_COALESCE_WINDOW, 0),
+                const.MAX_COALESCE_WINDOW,
+            )
+            / 1000
+            if self.can_coalesce
+            else 0.0
+        )
+        self.coalesce_max_bytes = features.get(
+            const.FEATURE_COALESCE_MAX_BYTES, const.DEFAULT_COALESCE_MAX_BYTES
+        )
+        self.can_compress = const.FEATURE_COMPRESS_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -133,6 +157,23 @@ class ActiveConnection:
         """Send a event message."""
         self.send_message(messages.event_message(msg_id, event))
 
+    async def async_send_stream_message(self, msg_id: int, message: bytes) -> bool:
+        """Send a message of a response that is streamed in chunks.
+
+        Waits until the message is written to the client, so the
+        chunks are produced as fast as the client reads them. The
+        response must be registered in the subscriptions while it is
+        streamed.
+
+        Returns False if the client unsubscribed or disconnected.
+        """
+        if msg_id not in self.subscriptions:
+            return False
+        self.send_message(message)
+        if self._wait_for_written is not None:
+            await self._wait_for_written()
+        return msg_id in self.subscriptions
+
     @callback
     def send_error(
         self,
@@ -34,6 +34,19 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# The longest coalesce window a client can select in milliseconds
+MAX_COALESCE_WINDOW: Final = 1000
+# The default size of the coalesced messages that are written
+# before the end of the coalesce window
+DEFAULT_COALESCE_MAX_BYTES: Final = 65536
+
+# Messages of at least this size are sent compressed
+# when the client supports compressed messages.
+COMPRESS_MSG_MIN_SIZE: Final = 1024
+# Messages of at least this size are compressed in the executor
+COMPRESS_MSG_EXECUTOR_SIZE: Final = 65536
+COMPRESS_MSG_LEVEL: Final = 3
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +71,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
+# The time in milliseconds messages are coalesced before they are written
+FEATURE_COALESCE_WINDOW = "coalesce_window"
+# The size in bytes of the coalesced messages that are written before
+# the end of the coalesce window
+FEATURE_COALESCE_MAX_BYTES = "coalesce_max_bytes"
@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -22,6 +24,9 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MSG_EXECUTOR_SIZE,
+    COMPRESS_MSG_LEVEL,
+    COMPRESS_MSG_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -63,6 +68,21 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+@dataclass(slots=True)
+class WebSocketWriteMetrics:
+    """Track the messages written to a websocket client."""
+
+    frames: int = 0
+    messages: int = 0
+    # The longest the queue of pending messages has been
+    queue_peak: int = 0
+
+    @property
+    def messages_per_frame(self) -> float:
+        """Return the average number of messages per written frame."""
+        return self.messages / self.frames if self.frames else 0.0
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -81,6 +101,12 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_release_ready_handle",
+        "_coalesced_bytes",
+        "_queued_count",
+        "_written_count",
+        "_write_waiters",
+        "write_metrics",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -104,6 +130,15 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Set while the messages are coalesced until the coalesce window ends
+        self._release_ready_handle: asyncio.TimerHandle | None = None
+        self._coalesced_bytes: int = 0
+        self.write_metrics = WebSocketWriteMetrics()
+        # The number of messages queued and written so far, the waiters
+        # are released once the messages queued before them are written
+        self._queued_count: int = 0
+        self._written_count: int = 0
+        self._write_waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -124,7 +159,9 @@ class WebSocketHandler:
         return "finished connection"
 
     async def _writer(
-        self, send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -135,6 +172,8 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = self._connection and self._connection.can_coalesce
+        can_compress = self._connection and self._connection.can_compress
+        write_metrics = self.write_metrics
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -150,18 +189,30 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = self._connection and self._connection.can_coalesce
 
+                if not can_compress:
+                    # compress may be enabled later in the connection
+                    can_compress = self._connection and self._connection.can_compress
+
+                write_metrics.frames += 1
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                    message_count = 1
+                else:
+                    message_count = len(message_queue)
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
+                write_metrics.messages += message_count
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                if can_compress and len(message) >= COMPRESS_MSG_MIN_SIZE:
+                    # Compressed messages are sent as binary messages
+                    await send_bytes_binary(await self._async_compress(message))
+                else:
+                    await send_bytes_text(message)
+                self._written_count += message_count
+                if self._write_waiters:
+                    self._release_write_waiters()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -172,6 +223,14 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_compress(self, message: bytes) -> bytes:
+        """Compress a message with zlib."""
+        if len(message) < COMPRESS_MSG_EXECUTOR_SIZE:
+            return zlib.compress(message, COMPRESS_MSG_LEVEL)
+        return await self._hass.async_add_executor_job(
+            zlib.compress, message, COMPRESS_MSG_LEVEL
+        )
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -179,6 +238,28 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    async def _async_wait_for_written(self) -> None:
+        """Wait until the messages queued so far are written to the client.
+
+        The messages queued after the call are not waited for, so
+        the wait ends even if other messages keep the queue busy.
+        """
+        if self._closing or self._written_count >= (position := self._queued_count):
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._write_waiters.append((position, future))
+        await future
+
+    @callback
+    def _release_write_waiters(self, release_all: bool = False) -> None:
+        """Release the tasks waiting for their messages to be written."""
+        write_waiters = self._write_waiters
+        written_count = self._written_count
+        while write_waiters and (release_all or write_waiters[0][0] <= written_count):
+            _, future = write_waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -200,6 +281,7 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
+        self._queued_count += 1
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -214,10 +296,28 @@ class WebSocketHandler:
             self._cancel()
             return
 
-        if self._release_ready_queue_size == 0:
-            # Try to coalesce more messages to reduce the number of writes
+        if queue_size_after_add > self.write_metrics.queue_peak:
+            self.write_metrics.queue_peak = queue_size_after_add
+
+        if self._release_ready_handle is not None:
+            # The messages are coalesced until the coalesce window ends
+            # unless they are over the size the client wants at once
+            self._coalesced_bytes += len(message)
+            if (
+                self._coalesced_bytes >= self._connection.coalesce_max_bytes  # type: ignore[union-attr]
+                or queue_size_after_add >= PENDING_MSG_MAX_FORCE_READY
+            ):
+                self._release_ready_future()
+        elif self._release_ready_queue_size == 0:
             self._release_ready_queue_size = queue_size_after_add
-            self._loop.call_soon(self._release_ready_future_or_reschedule)
+            if (connection := self._connection) and connection.coalesce_window:
+                self._coalesced_bytes = len(message)
+                self._release_ready_handle = self._loop.call_later(
+                    connection.coalesce_window, self._release_ready_future
+                )
+            else:
+                # Try to coalesce more messages to reduce the number of writes
+                self._loop.call_soon(self._release_ready_future_or_reschedule)
 
         peak_checker_active = self._peak_checker_unsub is not None
 
@@ -257,23 +357,53 @@ class WebSocketHandler:
         if not ready_future.done():
             ready_future.set_result(queue_size)
 
+    @callback
+    def _release_ready_future(self) -> None:
+        """Release the ready future at the end of the coalesce window.
+
+        The writer is also released when the connection is closing.
+        """
+        if self._release_ready_handle is not None:
+            self._release_ready_handle.cancel()
+            self._release_ready_handle = None
+        self._release_ready_queue_size = 0
+        if (
+            (ready_future := self._ready_future)
+            and not ready_future.done()
+            and (self._message_queue or self._closing)
+        ):
+            ready_future.set_result(len(self._message_queue))
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
+        write_metrics = self.write_metrics
         if len(self._message_queue) < PENDING_MSG_PEAK:
+            self._logger.debug(
+                (
+                    "%s: Client caught up with pending messages; Queue peak was %s"
+                    " with %.1f messages per frame"
+                ),
+                self.description,
+                write_metrics.queue_peak,
+                write_metrics.messages_per_frame,
+            )
             return
 
         self._logger.error(
             (
                 "%s: Client unable to keep up with pending messages. Stayed over %s for %s"
-                " seconds. The system's load is too high or an integration is"
-                " misbehaving; Last message was: %s"
+                " seconds with a queue peak of %s and %.1f messages per frame. The"
+                " system's load is too high or an integration is misbehaving; Last"
+                " message was: %s"
             ),
             self.description,
             PENDING_MSG_PEAK,
             PENDING_MSG_PEAK_TIME,
+            write_metrics.queue_peak,
+            write_metrics.messages_per_frame,
             self._message_queue[-1],
         )
         self._cancel()
@@ -322,8 +452,15 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_for_written,
         )
         connection = None
         disconnect_warn = None
@@ -360,7 +497,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            self._writer_task = create_eager_task(
+                self._writer(send_bytes_text, send_bytes_binary)
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -462,8 +601,8 @@ class WebSocketHandler:
                 connection.async_handle_close()
 
             self._closing = True
-            if self._ready_future and not self._ready_future.done():
-                self._ready_future.set_result(len(self._message_queue))
+            self._release_ready_future()
+            self._release_write_waiters(True)
 
             # If the writer gets canceled we still need to close the websocket
             # so we have another finally block to make sure we close the websocket
@@ -477,7 +616,12 @@ class WebSocketHandler:
                     await wsock.close()
                 finally:
                     if disconnect_warn is None:
-                        debug("%s: Disconnected", self.description)
+                        debug(
+                            "%s: Disconnected; Wrote %s messages in %s frames",
+                            self.description,
+                            self.write_metrics.messages,
+                            self.write_metrics.frames,
+                        )
                     else:
                         self._logger.warning(
                             "%s: Disconnected: %s", self.description, disconnect_warn
@@ -43,6 +43,7 @@ from homeassistant.loader import (
     bind_hass,
 )
 from homeassistant.setup import async_when_setup_or_start
+from homeassistant.util.glob_index import GlobIndex
 
 from .models import HaAsyncZeroconf, HaZeroconf
 from .usage import install_multiple_zeroconf_catcher
@@ -256,15 +257,15 @@ def _build_homekit_model_lookups(
     homekit_models: dict[str, HomeKitDiscoveredIntegration],
 ) -> tuple[
     dict[str, HomeKitDiscoveredIntegration],
-    dict[re.Pattern, HomeKitDiscoveredIntegration],
+    GlobIndex[HomeKitDiscoveredIntegration],
 ]:
     """Build lookups for homekit models."""
     homekit_model_lookup: dict[str, HomeKitDiscoveredIntegration] = {}
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration] = {}
+    homekit_model_matchers: GlobIndex[HomeKitDiscoveredIntegration] = GlobIndex()
 
     for model, discovery in homekit_models.items():
         if "*" in model or "?" in model or "[" in model:
-            homekit_model_matchers[_compile_fnmatch(model)] = discovery
+            homekit_model_matchers.add(model, discovery)
         else:
             homekit_model_lookup[model] = discovery
 
@@ -353,7 +354,7 @@ class ZeroconfDiscovery:
         zeroconf: HaZeroconf,
         zeroconf_types: dict[str, list[ZeroconfMatcher]],
         homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-        homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+        homekit_model_matchers: GlobIndex[HomeKitDiscoveredIntegration],
     ) -> None:
         """Init discovery."""
         self.hass = hass
@@ -520,7 +521,7 @@ class ZeroconfDiscovery:
 
 def async_get_homekit_discovery(
     homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+    homekit_model_matchers: GlobIndex[HomeKitDiscoveredIntegration],
     props: dict[str, Any],
 ) -> HomeKitDiscoveredIntegration | None:
     """Handle a HomeKit discovery.
@@ -537,9 +538,8 @@ def async_get_homekit_discovery(
         if discovery := homekit_model_lookups.get(key):
             return discovery
 
-    for pattern, discovery in homekit_model_matchers.items():
-        if pattern.match(model):
-            return discovery
+    if discoveries := homekit_model_matchers.match(model):
+        return discoveries[0]
 
     return None
 
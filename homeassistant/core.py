@@ -29,6 +29,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -37,6 +38,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -44,6 +46,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+from weakref import WeakValueDictionary
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -1219,6 +1222,10 @@ class HomeAssistant:
                 and job.cancel_on_shutdown
             ):
                 handle.cancel()
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.event import async_cancel_timers_on_shutdown
+
+        async_cancel_timers_on_shutdown(self)
 
     def _async_log_running_tasks(self, stage: str) -> None:
         """Log all running tasks."""
@@ -1424,13 +1431,22 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, dict[str, list[_FilterableJobType[Any]]]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1448,7 +1464,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs)
+                for index in keyed_listeners.values()
+                for jobs in index.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1514,6 +1537,19 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            # Keyed listeners are routed with a dict lookup on the
+            # event data instead of calling a filter for each of them
+            for key, index in keyed_listeners.items():
+                try:
+                    matched = index.get(event_data.get(key))
+                except TypeError:
+                    # Unhashable values can never match a key
+                    continue
+                if matched is not None:
+                    listeners = listeners + matched
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1615,6 +1651,99 @@ class EventBus:
             )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        values: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a matching key.
+
+        The listener will only be called for events where the value of
+        ``key`` in the event data (for example ``entity_id`` or
+        ``device_id``) is one of ``values``. Matching listeners are found
+        with a dict lookup, so the cost of firing an event does not grow
+        with the number of keyed listeners.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, is called for events that
+        matched the key to determine if the listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners are not supported for all events")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if isinstance(values, str):
+            values = (values,)
+        else:
+            values = tuple(values)
+        filterable_job = (
+            HassJob(listener, f"listen {event_type} {key} {values}"),
+            event_filter,
+        )
+        if event_type == EVENT_STATE_REPORTED:
+            # Special case for EVENT_STATE_REPORTED, we also want to listen to
+            # EVENT_STATE_CHANGED
+            event_types: tuple[EventType[Any] | str, ...] = (
+                EVENT_STATE_REPORTED,
+                EVENT_STATE_CHANGED,
+            )
+        else:
+            event_types = (event_type,)
+        for keyed_event_type in event_types:
+            index = self._keyed_listeners.setdefault(keyed_event_type, {}).setdefault(
+                key, {}
+            )
+            for value in values:
+                if value in index:
+                    index[value].append(filterable_job)
+                else:
+                    index[value] = [filterable_job]
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_types,
+            key,
+            values,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_types: Iterable[EventType[_DataT] | str],
+        key: str,
+        values: Iterable[str],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        for event_type in event_types:
+            try:
+                keyed_listeners = self._keyed_listeners[event_type]
+                index = keyed_listeners[key]
+                for value in values:
+                    index[value].remove(filterable_job)
+                    # delete value list if empty
+                    if not index[value]:
+                        del index[value]
+                if not index:
+                    del keyed_listeners[key]
+                if not keyed_listeners:
+                    del self._keyed_listeners[event_type]
+            except (KeyError, ValueError):
+                # KeyError is key event_type, key or value listener did not exist
+                # ValueError if listener did not exist within value
+                _LOGGER.exception(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+
     @callback
     def _async_remove_multiple_listeners(
         self,
@@ -1726,6 +1855,28 @@ class EventBus:
             )
 
 
+# Cached properties of State that hold an encoded version of the state
+_STATE_ENCODING_CACHES = (
+    "_as_dict",
+    "_as_read_only_dict",
+    "as_dict_json",
+    "json_fragment",
+    "as_compressed_state",
+    "as_compressed_state_json",
+)
+
+
+class StatesMemoryUsage(TypedDict):
+    """Estimated memory used by the states in the state machine."""
+
+    entities: int
+    unique_attributes: int
+    state_bytes: int
+    attributes_bytes: int
+    encoded_bytes: int
+    bytes_per_entity: int
+
+
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
 
@@ -1979,6 +2130,20 @@ class State:
             self.context.user_id, self.context.parent_id, self.context.id
         )
 
+    def release_encodings(self) -> int:
+        """Drop the cached encodings of the state.
+
+        The encodings are rebuilt the next time they are accessed.
+
+        Returns the number of bytes of encoded JSON that were released.
+        """
+        released = 0
+        cache = self.__dict__
+        for key in _STATE_ENCODING_CACHES:
+            if isinstance(encoded := cache.pop(key, None), bytes):
+                released += len(encoded)
+        return released
+
     def __repr__(self) -> str:
         """Return the representation of the states."""
         attrs = f"; {util.repr_helper(self.attributes)}" if self.attributes else ""
@@ -1994,12 +2159,104 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    In compact mode, attribute keys are interned and states with identical
+    attributes share a single attributes mapping.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, compact: bool = False) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._attributes_pool: (
+            WeakValueDictionary[tuple[Any, ...], ReadOnlyDict[str, Any]] | None
+        ) = None
+        if compact:
+            self.set_compact(True)
+
+    @property
+    def compact(self) -> bool:
+        """Return if compact mode is enabled."""
+        return self._attributes_pool is not None
+
+    def set_compact(self, compact: bool) -> None:
+        """Enable or disable compact mode.
+
+        When enabled, the attributes of the existing states are shared.
+        """
+        if not compact:
+            self._attributes_pool = None
+            return
+        if self._attributes_pool is not None:
+            return
+        self._attributes_pool = WeakValueDictionary()
+        for entry in self.data.values():
+            if entry.attributes:
+                entry.attributes = self._share_attributes(entry.attributes)
+
+    def _share_attributes(
+        self, attributes: ReadOnlyDict[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared attributes mapping equal to attributes."""
+        pool = self._attributes_pool
+        if TYPE_CHECKING:
+            assert pool is not None
+        try:
+            # The type is part of the key since 1 == 1.0 == True
+            key = tuple([(k, type(v), v) for k, v in attributes.items()])
+            if (shared := pool.get(key)) is not None:
+                return shared
+        except TypeError:
+            # Attributes with unhashable values, like lists, are not shared
+            return attributes
+        shared = ReadOnlyDict(
+            {
+                sys.intern(k) if type(k) is str else k: v  # noqa: E721
+                for k, v in attributes.items()
+            }
+        )
+        pool[key] = shared
+        return shared
+
+    def release_encodings(self) -> int:
+        """Drop the cached encodings of all states.
+
+        Returns the number of bytes of encoded JSON that were released.
+        """
+        return sum(entry.release_encodings() for entry in self.data.values())
+
+    def memory_usage(self) -> StatesMemoryUsage:
+        """Estimate the memory used by the states.
+
+        Attributes mappings shared between states are only counted once.
+        """
+        seen_attributes: set[int] = set()
+        state_bytes = 0
+        attributes_bytes = 0
+        encoded_bytes = 0
+        getsizeof = sys.getsizeof
+        for entry in self.data.values():
+            cache = entry.__dict__
+            state_bytes += getsizeof(entry) + getsizeof(cache)
+            attributes = entry.attributes
+            if id(attributes) not in seen_attributes:
+                seen_attributes.add(id(attributes))
+                attributes_bytes += getsizeof(attributes) + sum(
+                    getsizeof(value) for value in attributes.values()
+                )
+            for key in ("as_dict_json", "as_compressed_state_json"):
+                if (encoded := cache.get(key)) is not None:
+                    encoded_bytes += getsizeof(encoded)
+        entities = len(self.data)
+        total_bytes = state_bytes + attributes_bytes + encoded_bytes
+        return {
+            "entities": entities,
+            "unique_attributes": len(seen_attributes),
+            "state_bytes": state_bytes,
+            "attributes_bytes": attributes_bytes,
+            "encoded_bytes": encoded_bytes,
+            "bytes_per_entity": total_bytes // entities if entities else 0,
+        }
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2007,6 +2264,8 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if self._attributes_pool is not None and entry.attributes:
+            entry.attributes = self._share_attributes(entry.attributes)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
@@ -2031,6 +2290,17 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class StateWrite(NamedTuple):
+    """A state to write to the state machine with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -2115,6 +2385,39 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_set_compact_storage(self, compact: bool) -> None:
+        """Enable or disable compact storage of states.
+
+        In compact mode, attribute keys are interned and states with
+        identical attributes share a single attributes mapping.
+
+        This method must be run in the event loop.
+        """
+        self._states.set_compact(compact)
+
+    @callback
+    def async_release_encodings(self) -> int:
+        """Drop the cached JSON encodings of all states.
+
+        The encodings are rebuilt the next time they are needed. This
+        can be used to release memory when the system is under memory
+        pressure.
+
+        Returns the number of bytes of encoded JSON that were released.
+
+        This method must be run in the event loop.
+        """
+        return self._states.release_encodings()
+
+    @callback
+    def async_memory_usage(self) -> StatesMemoryUsage:
+        """Estimate the memory used by the states.
+
+        This method must be run in the event loop.
+        """
+        return self._states.memory_usage()
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2327,6 +2630,130 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        writes: Iterable[StateWrite],
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities in one pass.
+
+        All states in the batch share the same timestamp, and states written
+        without a context share a single context. States are validated
+        before any of them are written, so if one of them is invalid none of
+        them are written. Once all states are written, the events are fired
+        in order.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        states_data = self._states_data
+        # States written earlier in this batch, which have not yet been
+        # added to the state machine
+        pending: dict[str, State] = {}
+        # Tuples of (entity_id, old_state, new_state, context), new_state is
+        # None if the existing state was only reported
+        writes_to_apply: list[
+            tuple[str, State | None, State | None, Context | None]
+        ] = []
+        shared_context: Context | None = None
+
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+        ) in writes:
+            new_state = str(new_state)
+            attributes = attributes or {}
+            old_state = pending.get(entity_id) or states_data.get(entity_id)
+            if old_state is None:
+                # If the state is missing, try to convert the entity_id to
+                # lowercase and try again.
+                entity_id = entity_id.lower()
+                old_state = pending.get(entity_id) or states_data.get(entity_id)
+
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                same_attr = old_state.attributes == attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                writes_to_apply.append((entity_id, old_state, None, context))
+                continue
+
+            if context is None:
+                if shared_context is None:
+                    shared_context = Context(id=ulid_at_time(timestamp))
+                context = shared_context
+
+            if same_attr:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                attributes = old_state.attributes
+
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                now,
+                context,
+                old_state is None,
+                state_info,
+                timestamp,
+            )
+            pending[entity_id] = state
+            writes_to_apply.append((entity_id, old_state, state, context))
+
+        events: list[tuple[str, Mapping[str, Any], Context | None]] = []
+        for entity_id, old_state, state, context in writes_to_apply:
+            if state is None:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                old_last_reported = old_state.last_reported
+                old_state.last_reported = now
+                old_state.last_reported_timestamp = timestamp
+                events.append(
+                    (
+                        EVENT_STATE_REPORTED,
+                        {
+                            "entity_id": entity_id,
+                            "old_last_reported": old_last_reported,
+                            "new_state": old_state,
+                        },
+                        context,
+                    )
+                )
+                continue
+            if old_state is not None:
+                old_state.expire()
+            self._states[entity_id] = state
+            events.append(
+                (
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": state,
+                    },
+                    context,
+                )
+            )
+
+        fire = self._bus.async_fire_internal
+        for event_type, event_data, context in events:
+            fire(event_type, event_data, context=context, time_fired=timestamp)
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -45,6 +45,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateWrite,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -199,6 +200,48 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
+@callback
+def _async_set_state(
+    hass: HomeAssistant, state_write: StateWrite, timestamp: float | None
+) -> None:
+    """Write a state to the state machine, fall back to unknown if invalid."""
+    entity_id, _, _, force_update, context, _ = state_write
+    try:
+        hass.states.async_set(*state_write, timestamp)
+    except InvalidStateError:
+        _LOGGER.exception(
+            "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+        )
+        hass.states.async_set(entity_id, STATE_UNKNOWN, {}, force_update, context)
+
+
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine in one pass.
+
+    This is equivalent to calling async_write_ha_state on each entity, but
+    the states share a timestamp and are written with a single call to
+    StateMachine.async_set_many.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+    state_writes: list[StateWrite] = []
+    for entity in entities:
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        if (state_write := entity._async_prepare_state_write()) is not None:  # noqa: SLF001
+            state_writes.append(state_write[0])
+    if not state_writes:
+        return
+    try:
+        hass.states.async_set_many(state_writes)
+    except InvalidStateError:
+        # Nothing was written, write the states one by one so only
+        # the invalid states fall back to unknown
+        for state_write in state_writes:
+            _async_set_state(hass, state_write, None)
+
+
 class EntityInfo(TypedDict):
     """Entity info."""
 
@@ -1111,9 +1154,20 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (state_write := self._async_prepare_state_write()) is None:
+            return
+        _async_set_state(self.hass, *state_write)
+
+    @callback
+    def _async_prepare_state_write(self) -> tuple[StateWrite, float] | None:
+        """Calculate the state to write to the state machine.
+
+        Returns a tuple (state_write, timestamp), or None if the state
+        should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1129,7 +1183,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
@@ -1203,23 +1257,17 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set(
+        return (
+            StateWrite(
                 entity_id,
                 state,
                 attr,
                 self.force_update,
                 self._context,
                 self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+            ),
+            time_now,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Mapping, Sequence
+import contextvars
 import copy
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from functools import partial, wraps
+from heapq import heapify, heappop, heappush
 import logging
+import math
+from operator import attrgetter
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -69,6 +74,13 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
+_TIME_PATTERN_SCHEDULES: HassKey[dict[_TimePatternKey, _TimePatternSchedule]] = HassKey(
+    "time_pattern_schedules"
+)
+_SHARED_TEMPLATE_RENDERS: HassKey[_SharedTemplateRenders] = HassKey(
+    "shared_template_renders"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -118,6 +130,69 @@ class _KeyedEventData(Generic[_TypedDictT]):
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
 
 
+class _SharedTemplateRenders:
+    """Share the renders of a template between the trackers of a state change.
+
+    Template entities often track the same template with the same variables,
+    for example the availability template of the entities of a blueprint.
+    When a state change triggers the trackers of those templates, the template
+    is rendered once and the render is used by every tracker, as long as the
+    states it used have not been changed by a tracker that was called before.
+    """
+
+    __slots__ = ("_event", "_now", "_renders")
+
+    def __init__(self) -> None:
+        """Initialize the shared renders."""
+        self._event: Event[EventStateChangedData] | None = None
+        self._now: float | None = None
+        self._renders: dict[Hashable, tuple[RenderInfo, dict[str, State | None]]] = {}
+
+    @callback
+    def async_render_to_info(
+        self,
+        hass: HomeAssistant,
+        template: Template,
+        variables: TemplateVarsType,
+        event: Event[EventStateChangedData],
+        now: float,
+    ) -> RenderInfo:
+        """Render a template or return the render of an identical template."""
+        if event is not self._event or now != self._now:
+            self._event = event
+            self._now = now
+            self._renders.clear()
+
+        if (key := template.render_key(variables)) is None:
+            return template.async_render_to_info(variables)
+
+        get_state = hass.states.get
+        if (shared := self._renders.get(key)) is not None:
+            info, states = shared
+            if all(
+                get_state(entity_id) is state for entity_id, state in states.items()
+            ):
+                info = copy.copy(info)
+                info.template = template
+                return info
+
+        info = template.async_render_to_info(variables)
+        # Renders that depend on the time or on all the states
+        # of a domain are not shared
+        if not (
+            info.has_time
+            or info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+        ):
+            self._renders[key] = (
+                info,
+                {entity_id: get_state(entity_id) for entity_id in info.entities},
+            )
+        return info
+
+
 @dataclass(slots=True)
 class TrackStates:
     """Class for keeping track of states being tracked.
@@ -947,6 +1022,9 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        if _SHARED_TEMPLATE_RENDERS not in hass.data:
+            hass.data[_SHARED_TEMPLATE_RENDERS] = _SharedTemplateRenders()
+        self._shared_renders = hass.data[_SHARED_TEMPLATE_RENDERS]
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1114,9 +1192,13 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event:
+            info = self._shared_renders.async_render_to_info(
+                self.hass, template, track_template_.variables, event, now
+            )
+        else:
+            info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1430,19 +1512,317 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+# The callbacks are considered due like the event loop considers timer handles due
+_TIMER_WHEEL_RESOLUTION = time.get_clock_info("monotonic").resolution
+# Cancelled timers are removed from the buckets once there are more
+# cancelled timers than scheduled timers
+_TIMER_WHEEL_MIN_CANCELLED_TO_COMPACT = 100
+
+_timer_order = attrgetter("when", "sequence")
+
+
+class _TimerWheelEntry:
+    """A callback scheduled by the timer wheel."""
+
+    __slots__ = (
+        "when",
+        "sequence",
+        "func",
+        "args",
+        "context",
+        "cancel_on_shutdown",
+        "done",
+        "_wheel",
+    )
+
+    def __init__(
+        self,
+        wheel: _TimerWheel,
+        when: float,
+        sequence: int,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        cancel_on_shutdown: bool | None,
+    ) -> None:
+        """Initialize the timer."""
+        self._wheel = wheel
+        self.when = when
+        self.sequence = sequence
+        self.func = func
+        self.args = args
+        # The callback is called in the context it was scheduled from,
+        # like the event loop calls its handles
+        self.context = contextvars.copy_context()
+        self.cancel_on_shutdown = cancel_on_shutdown
+        # Set when the callback was called or cancelled
+        self.done = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<_TimerWheelEntry when={self.when} {self.func!r}{self.args!r}>"
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the callback."""
+        if not self.done:
+            self.done = True
+            self._wheel.async_cancelled(self)
+
+
+class _TimerWheel:
+    """Schedule the callbacks of the time tracking helpers.
+
+    The callbacks are kept in a bucket per second of event loop time and
+    only the earliest callback is scheduled on the event loop. When it is
+    called, every callback that is due is called in order, so the event loop
+    heap does not grow with the number of timers and cancelling a timer that
+    is not the earliest only marks it as cancelled.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_loop",
+        "_buckets",
+        "_bucket_starts",
+        "_armed",
+        "_handle",
+        "_sequence",
+        "_scheduled",
+        "_cancelled",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        self._loop = hass.loop
+        self._buckets: dict[int, list[_TimerWheelEntry]] = {}
+        # Heap of the starts of the buckets
+        self._bucket_starts: list[int] = []
+        # The callback the event loop callback is scheduled for
+        self._armed: _TimerWheelEntry | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._sequence = 0
+        self._scheduled = 0
+        self._cancelled = 0
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        entries = self.async_scheduled_entries()
+        return f"<_TimerWheel scheduled={self._scheduled} {entries[:10]!r}>"
+
+    @property
+    def scheduled(self) -> int:
+        """Return the number of scheduled callbacks."""
+        return self._scheduled
+
+    @callback
+    def async_call_at(
+        self,
+        when: float,
+        func: Callable[..., Any],
+        *args: Any,
+        cancel_on_shutdown: bool | None = None,
+    ) -> _TimerWheelEntry:
+        """Call a callback at or after an event loop time."""
+        self._sequence += 1
+        entry = _TimerWheelEntry(
+            self, when, self._sequence, func, args, cancel_on_shutdown
+        )
+        start = math.floor(when)
+        if (bucket := self._buckets.get(start)) is None:
+            self._buckets[start] = [entry]
+            heappush(self._bucket_starts, start)
+        else:
+            bucket.append(entry)
+        self._scheduled += 1
+        if (armed := self._armed) is None or when < armed.when:
+            self._arm(entry)
+        return entry
+
+    @callback
+    def async_cancelled(self, entry: _TimerWheelEntry) -> None:
+        """Handle a callback that was cancelled."""
+        self._scheduled -= 1
+        self._cancelled += 1
+        if not self._scheduled:
+            self._clear()
+            return
+        if (
+            self._cancelled > _TIMER_WHEEL_MIN_CANCELLED_TO_COMPACT
+            and self._cancelled > self._scheduled
+        ):
+            self._compact()
+        if entry is self._armed:
+            # The event loop callback was scheduled for the callback
+            self._arm(self._next_entry())
+
+    def _arm(self, entry: _TimerWheelEntry) -> None:
+        """Schedule the event loop callback at the time of a callback.
+
+        The event loop callback is passed the callback and its arguments
+        so they are shown when the event loop logs the handle.
+        """
+        self._disarm()
+        self._handle = self._loop.call_at(
+            entry.when, self._run, entry.func, *entry.args
+        )
+        self._armed = entry
+
+    def _disarm(self) -> None:
+        """Cancel the event loop callback."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._armed = None
+
+    def _clear(self) -> None:
+        """Remove the cancelled callbacks when no callback is scheduled."""
+        self._disarm()
+        self._buckets.clear()
+        self._bucket_starts.clear()
+        self._cancelled = 0
+
+    def _compact(self) -> None:
+        """Remove the cancelled callbacks from the buckets."""
+        buckets: dict[int, list[_TimerWheelEntry]] = {}
+        for start, bucket in self._buckets.items():
+            if scheduled := [entry for entry in bucket if not entry.done]:
+                buckets[start] = scheduled
+        self._buckets = buckets
+        self._bucket_starts = list(buckets)
+        heapify(self._bucket_starts)
+        self._cancelled = 0
+
+    def _next_entry(self) -> _TimerWheelEntry:
+        """Return the earliest scheduled callback."""
+        buckets = self._buckets
+        bucket_starts = self._bucket_starts
+        while True:
+            start = bucket_starts[0]
+            bucket = buckets[start]
+            if scheduled := [entry for entry in bucket if not entry.done]:
+                if len(scheduled) != len(bucket):
+                    self._cancelled -= len(bucket) - len(scheduled)
+                    buckets[start] = scheduled
+                return min(scheduled, key=_timer_order)
+            self._cancelled -= len(bucket)
+            heappop(bucket_starts)
+            del buckets[start]
+
+    def async_scheduled_entries(self) -> list[_TimerWheelEntry]:
+        """Return the callbacks that are scheduled."""
+        return sorted(
+            (
+                entry
+                for bucket in self._buckets.values()
+                for entry in bucket
+                if not entry.done
+            ),
+            key=_timer_order,
+        )
+
+    @callback
+    def _run(self, *_: Any) -> None:
+        """Call the callbacks that are due."""
+        self.async_run_due(self._loop.time() + _TIMER_WHEEL_RESOLUTION)
+
+    @callback
+    def async_run_due(self, due_until: float) -> None:
+        """Call the callbacks due at or before an event loop time.
+
+        Tests call this to simulate the time passing.
+        """
+        self._disarm()
+        buckets = self._buckets
+        bucket_starts = self._bucket_starts
+        due: list[_TimerWheelEntry] = []
+        while bucket_starts and bucket_starts[0] <= due_until:
+            start = bucket_starts[0]
+            later: list[_TimerWheelEntry] = []
+            for entry in buckets[start]:
+                if entry.done:
+                    self._cancelled -= 1
+                elif entry.when <= due_until:
+                    due.append(entry)
+                else:
+                    later.append(entry)
+            if later:
+                buckets[start] = later
+                break
+            heappop(bucket_starts)
+            del buckets[start]
+
+        due.sort(key=_timer_order)
+        for entry in due:
+            # A callback can cancel the callbacks after it
+            if entry.done:
+                continue
+            entry.done = True
+            self._scheduled -= 1
+            try:
+                entry.context.run(entry.func, *entry.args)
+            except Exception as exc:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {
+                        "message": f"Exception in callback {entry.func!r}",
+                        "exception": exc,
+                    }
+                )
+
+        if not self._scheduled:
+            self._clear()
+            return
+        # The callbacks that were called may have scheduled
+        # callbacks after the earliest callback
+        if (next_entry := self._next_entry()) is not self._armed:
+            self._arm(next_entry)
+
+    @callback
+    def async_cancel_on_shutdown(self) -> None:
+        """Cancel the callbacks of jobs that are cancelled on shutdown."""
+        for bucket in list(self._buckets.values()):
+            for entry in bucket:
+                if entry.cancel_on_shutdown:
+                    entry.cancel()
+
+
+@callback
+def async_cancel_timers_on_shutdown(hass: HomeAssistant) -> None:
+    """Cancel the time tracking callbacks of jobs that are cancelled on shutdown.
+
+    Called by the core when it cancels the cancellable timer handles,
+    as the timer wheel only schedules a handle for its earliest callback.
+    """
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is not None:
+        wheel.async_cancel_on_shutdown()
+
+
+@callback
+def _async_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel of the time tracking helpers."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
 @dataclass(slots=True)
 class _TrackPointUTCTime:
     hass: HomeAssistant
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: _TimerWheelEntry | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        self._schedule(
+            self.hass.loop.time() + self.expected_fire_timestamp - time.time()
+        )
+
+    def _schedule(self, when: float) -> None:
+        """Schedule the call."""
+        self._cancel_callback = _async_timer_wheel(self.hass).async_call_at(
+            when, self, cancel_on_shutdown=self.job.cancel_on_shutdown
         )
 
     @callback
@@ -1461,8 +1841,7 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            self._schedule(self.hass.loop.time() + delta)
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1527,7 +1906,17 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return (
+        _async_timer_wheel(hass)
+        .async_call_at(
+            loop_time,
+            _run_async_call_action,
+            hass,
+            job,
+            cancel_on_shutdown=job.cancel_on_shutdown,
+        )
+        .cancel
+    )
 
 
 @callback
@@ -1549,8 +1938,17 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return (
+        _async_timer_wheel(hass)
+        .async_call_at(
+            hass.loop.time() + delay,
+            _run_async_call_action,
+            hass,
+            job,
+            cancel_on_shutdown=job.cancel_on_shutdown,
+        )
+        .cancel
+    )
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1567,7 +1965,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: _TimerWheelEntry | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1589,9 +1987,11 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = _async_timer_wheel(hass).async_call_at(
+            hass.loop.time() + self.seconds,
+            self._interval_listener,
+            self._track_job,
+            cancel_on_shutdown=self.cancel_on_shutdown,
         )
 
     @callback
@@ -1732,16 +2132,118 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+# The number of times a time pattern matches that are computed at once
+_TIME_PATTERN_BATCH_SIZE = 32
+
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
+class _TimePatternSchedule:
+    """The next times a time pattern matches, shared by its trackers.
+
+    The times are computed in batches, so the trackers of a
+    pattern only look up the next time when they fire.
+    """
+
+    __slots__ = (
+        "key",
+        "time_match_expression",
+        "local",
+        "listeners",
+        "_time_zone",
+        "_start",
+        "_timestamps",
+        "_times",
+    )
+
+    def __init__(
+        self,
+        key: _TimePatternKey,
+        time_match_expression: tuple[list[int], list[int], list[int]],
+        local: bool,
+    ) -> None:
+        """Initialize the schedule."""
+        self.key = key
+        self.time_match_expression = time_match_expression
+        self.local = local
+        self.listeners = 0
+        self._time_zone: tzinfo | None = None
+        self._start = 0
+        self._timestamps: list[int] = []
+        self._times: list[datetime] = []
+
+    def next_time(self, utc_now: datetime) -> datetime:
+        """Return the next time the pattern matches from utc_now.
+
+        The time is returned in local time if the pattern matches
+        local time.
+        """
+        time_zone = dt_util.get_default_time_zone() if self.local else dt_util.UTC
+        timestamp = int(utc_now.timestamp())
+        if (
+            time_zone is not self._time_zone
+            or timestamp < self._start
+            or timestamp > self._timestamps[-1]
+        ):
+            self._compute(utc_now, time_zone)
+        return self._times[bisect_left(self._timestamps, timestamp)]
+
+    def _compute(self, utc_now: datetime, time_zone: tzinfo) -> None:
+        """Compute the next times the pattern matches from utc_now."""
+        self._time_zone = time_zone
+        self._start = int(utc_now.timestamp())
+        times: list[datetime] = []
+        for _ in range(_TIME_PATTERN_BATCH_SIZE):
+            next_time = dt_util.find_next_time_expression_time(
+                dt_util.as_local(utc_now) if self.local else utc_now,
+                *self.time_match_expression,
+            )
+            times.append(next_time)
+            utc_now = dt_util.as_utc(next_time) + timedelta(seconds=1)
+        self._times = times
+        self._timestamps = [int(time.timestamp()) for time in times]
+
+
+@callback
+def _async_time_pattern_schedule(
+    hass: HomeAssistant,
+    time_match_expression: tuple[list[int], list[int], list[int]],
+    local: bool,
+) -> _TimePatternSchedule:
+    """Return the schedule of a time pattern and add a listener to it."""
+    if (schedules := hass.data.get(_TIME_PATTERN_SCHEDULES)) is None:
+        schedules = hass.data[_TIME_PATTERN_SCHEDULES] = {}
+    seconds, minutes, hours = time_match_expression
+    key = (tuple(seconds), tuple(minutes), tuple(hours), local)
+    if (schedule := schedules.get(key)) is None:
+        schedule = schedules[key] = _TimePatternSchedule(
+            key, time_match_expression, local
+        )
+    schedule.listeners += 1
+    return schedule
+
+
+@callback
+def _async_release_time_pattern_schedule(
+    hass: HomeAssistant, schedule: _TimePatternSchedule
+) -> None:
+    """Remove a listener from the schedule of a time pattern."""
+    schedule.listeners -= 1
+    if not schedule.listeners:
+        del hass.data[_TIME_PATTERN_SCHEDULES][schedule.key]
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
-    time_match_expression: tuple[list[int], list[int], list[int]]
+    schedule: _TimePatternSchedule
     microsecond: int
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
+    _cancelled: bool = False
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1758,10 +2260,7 @@ class _TrackUTCTimeChange:
 
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
+        return self.schedule.next_time(utc_now).replace(microsecond=self.microsecond)
 
     @callback
     def _pattern_time_change_listener(self, _: datetime) -> None:
@@ -1786,6 +2285,9 @@ class _TrackUTCTimeChange:
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        if not self._cancelled:
+            self._cancelled = True
+            _async_release_time_pattern_schedule(self.hass, self.schedule)
 
 
 @callback
@@ -1823,7 +2325,9 @@ def async_track_utc_time_change(
     listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
     track = _TrackUTCTimeChange(
         hass,
-        (matching_seconds, matching_minutes, matching_hours),
+        _async_time_pattern_schedule(
+            hass, (matching_seconds, matching_minutes, matching_hours), local
+        ),
         microsecond,
         local,
         job,
@@ -6,14 +6,18 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -28,7 +32,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import meta, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -44,13 +48,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -82,6 +89,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -99,6 +107,17 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_TEMPLATES: HassKey[CompiledTemplateCache] = HassKey(
+    "template.compiled_templates"
+)
+
+COMPILED_TEMPLATES_STORAGE_KEY = "core.compiled_templates"
+COMPILED_TEMPLATES_STORAGE_VERSION = 1
+COMPILED_TEMPLATES_SAVE_DELAY = 60
+# The maximum number of compiled templates that are kept
+MAX_COMPILED_TEMPLATES = 10000
+# Larger templates are not kept as they are rarely the same across restarts
+MAX_COMPILED_TEMPLATE_SIZE = 64 * 1024
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -357,6 +376,25 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _template_variable_names(template: str) -> tuple[str, ...]:
+    """Return the sorted names of the variables a template may use."""
+    return tuple(sorted(meta.find_undeclared_variables(_NO_HASS_ENV.parse(template))))
+
+
+def _variable_key(value: Any) -> Hashable:
+    """Return a key for the value of a template variable.
+
+    Values that are not hashable are only the same as themselves.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    # 1, 1.0 and True are equal but do not render the same
+    return (type(value), value)
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -487,6 +525,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_render",
         "_exc_info",
         "_limited",
         "_strict",
@@ -503,6 +542,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: Callable[[], str] | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -601,7 +641,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_render := self._fast_render) is not None and (
+                not kwargs or kwargs.keys().isdisjoint(_FAST_RENDER_GLOBALS)
+            ):
+                render_result = _fast_render_with_context(self.template, fast_render)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -724,6 +769,28 @@ class Template:
         render_info._freeze()  # noqa: SLF001
         return render_info
 
+    def render_key(self, variables: TemplateVarsType = None) -> Hashable | None:
+        """Return a key that is the same for templates that render the same.
+
+        Templates render the same if they have the same source, are compiled
+        for the same environment and the variables they use are the same.
+        Returns None if the template can not share its renders.
+        """
+        if self.is_static or self._log_fn is not None:
+            return None
+        used_variables: tuple[tuple[str, Hashable], ...] = ()
+        if variables:
+            try:
+                names = _template_variable_names(self.template)
+            except jinja2.TemplateError:
+                return None
+            used_variables = tuple(
+                (name, _variable_key(variables[name]))
+                for name in names
+                if name in variables
+            )
+        return (self.template, self._limited, self._strict, used_variables)
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -817,6 +884,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited and log_fn is None:
+            self._fast_render = _compile_fast_render(env, self.template)
 
         return self._compiled
 
@@ -2621,6 +2690,206 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _fast_render_with_context(template_str: str, fast_render: Callable[[], str]) -> str:
+    """Store template being rendered in a ContextVar to aid error handling."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return fast_render()
+
+
+# The globals and filters a template rendered by the fast path can use,
+# they are looked up in the environment so they are the same functions
+# the compiled template uses and collect the same render info
+_FAST_RENDER_GLOBALS = frozenset(
+    {"has_value", "is_state", "is_state_attr", "state_attr", "states"}
+)
+_FAST_RENDER_FILTERS = frozenset({"bool", "float", "int", "round"})
+_FAST_RENDER_MAX_SIZE = 256
+_FAST_RENDER_BINARY_OPERATORS: dict[
+    type[jinja2.nodes.Expr], Callable[[Any, Any], Any]
+] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+    jinja2.nodes.Mod: operator.mod,
+}
+_FAST_RENDER_UNARY_OPERATORS: dict[type[jinja2.nodes.Expr], Callable[[Any], Any]] = {
+    jinja2.nodes.Not: operator.not_,
+    jinja2.nodes.Neg: operator.neg,
+    jinja2.nodes.Pos: operator.pos,
+}
+_FAST_RENDER_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda value, container: value in container,
+    "notin": lambda value, container: value not in container,
+}
+
+
+class _FastRenderUnsupported(Exception):
+    """Raised when a template can not be rendered by the fast path."""
+
+
+def _compile_fast_render(
+    env: TemplateEnvironment, template: str
+) -> Callable[[], str] | None:
+    """Compile a simple template to a function that renders it without Jinja.
+
+    Templates that only output constants, calls of the state functions,
+    number filters and operators on them are compiled to closures that
+    return the same result as the compiled Jinja template. Returns None
+    for every other template, which is rendered by Jinja.
+    """
+    if len(template) > _FAST_RENDER_MAX_SIZE or "{%" in template or "{#" in template:
+        return None
+    try:
+        parsed = env.parse(template)
+        parts: list[Callable[[], str]] = []
+        for output in parsed.body:
+            if not isinstance(output, jinja2.nodes.Output):
+                return None
+            for node in output.nodes:
+                if isinstance(node, jinja2.nodes.TemplateData):
+                    parts.append(_fast_render_constant(node.data))
+                else:
+                    parts.append(_compile_fast_render_output(env, node))
+    except (jinja2.TemplateError, _FastRenderUnsupported):
+        return None
+    if len(parts) == 1:
+        return parts[0]
+    return lambda: "".join([part() for part in parts])
+
+
+def _fast_render_constant(value: Any) -> Callable[[], Any]:
+    """Return a function that returns a constant."""
+    return lambda: value
+
+
+def _compile_fast_render_output(
+    env: TemplateEnvironment, node: jinja2.nodes.Node
+) -> Callable[[], str]:
+    """Compile an expression that is output like Jinja outputs it."""
+    if env.finalize is not None or env.autoescape is not False:
+        raise _FastRenderUnsupported
+    expression = _compile_fast_render_expression(env, node)
+    return lambda: str(expression())
+
+
+def _compile_fast_render_expression(  # noqa: C901
+    env: TemplateEnvironment, node: jinja2.nodes.Node
+) -> Callable[[], Any]:
+    """Compile an expression to a function that evaluates it."""
+    if isinstance(node, jinja2.nodes.Const):
+        return _fast_render_constant(node.value)
+
+    if isinstance(node, (jinja2.nodes.List, jinja2.nodes.Tuple)):
+        items = [_compile_fast_render_expression(env, item) for item in node.items]
+        if isinstance(node, jinja2.nodes.List):
+            return lambda: [item() for item in items]
+        return lambda: tuple(item() for item in items)
+
+    if isinstance(node, (jinja2.nodes.Call, jinja2.nodes.Filter)):
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _FastRenderUnsupported
+        func: Callable[..., Any]
+        args = [_compile_fast_render_expression(env, arg) for arg in node.args]
+        if isinstance(node, jinja2.nodes.Call):
+            if (
+                not isinstance(node.node, jinja2.nodes.Name)
+                or node.node.name not in _FAST_RENDER_GLOBALS
+            ):
+                raise _FastRenderUnsupported
+            func = env.globals[node.node.name]
+            # The state functions are wrapped to be passed the
+            # context, which they discard
+            if getattr(func, "jinja_pass_arg", None) is not None:
+                func = partial(func, None)
+        else:
+            if node.node is None or node.name not in _FAST_RENDER_FILTERS:
+                raise _FastRenderUnsupported
+            func = env.filters[node.name]
+            if getattr(func, "jinja_pass_arg", None) is not None:
+                raise _FastRenderUnsupported
+            args.insert(0, _compile_fast_render_expression(env, node.node))
+        kwargs = {
+            keyword.key: _compile_fast_render_expression(env, keyword.value)
+            for keyword in node.kwargs
+        }
+        if kwargs:
+            return lambda: func(
+                *[arg() for arg in args],
+                **{key: value() for key, value in kwargs.items()},
+            )
+        if len(args) == 1:
+            arg = args[0]
+            return lambda: func(arg())
+        if len(args) == 2:
+            first, second = args
+            return lambda: func(first(), second())
+        return lambda: func(*[arg() for arg in args])
+
+    if (binary_operator := _FAST_RENDER_BINARY_OPERATORS.get(type(node))) is not None:
+        left = _compile_fast_render_expression(env, node.left)
+        right = _compile_fast_render_expression(env, node.right)
+        return lambda: binary_operator(left(), right())
+
+    if (unary_operator := _FAST_RENDER_UNARY_OPERATORS.get(type(node))) is not None:
+        operand = _compile_fast_render_expression(env, node.node)
+        return lambda: unary_operator(operand())
+
+    if isinstance(node, jinja2.nodes.And):
+        left = _compile_fast_render_expression(env, node.left)
+        right = _compile_fast_render_expression(env, node.right)
+        return lambda: left() and right()
+
+    if isinstance(node, jinja2.nodes.Or):
+        left = _compile_fast_render_expression(env, node.left)
+        right = _compile_fast_render_expression(env, node.right)
+        return lambda: left() or right()
+
+    if isinstance(node, jinja2.nodes.CondExpr) and node.expr2 is not None:
+        test = _compile_fast_render_expression(env, node.test)
+        expr1 = _compile_fast_render_expression(env, node.expr1)
+        expr2 = _compile_fast_render_expression(env, node.expr2)
+        return lambda: expr1() if test() else expr2()
+
+    if isinstance(node, jinja2.nodes.Compare):
+        expr = _compile_fast_render_expression(env, node.expr)
+        operands = [
+            (
+                _FAST_RENDER_COMPARE_OPERATORS[operand.op],
+                _compile_fast_render_expression(env, operand.expr),
+            )
+            for operand in node.ops
+            if operand.op in _FAST_RENDER_COMPARE_OPERATORS
+        ]
+        if len(operands) != len(node.ops):
+            raise _FastRenderUnsupported
+        if len(operands) == 1:
+            ((compare, other),) = operands
+            return lambda: compare(expr(), other())
+
+        def _compare() -> Any:
+            # Comparisons are chained like they are in Python
+            left = expr()
+            for compare, other in operands:
+                right = other()
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare
+
+    raise _FastRenderUnsupported
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2699,6 +2968,91 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+def _compiled_templates_versions() -> str:
+    """Return the versions the compiled templates are only valid for."""
+    return f"{__version__}-{jinja2.__version__}-{importlib.util.MAGIC_NUMBER.hex()}"
+
+
+class CompiledTemplateCache:
+    """Compiled templates that are kept across restarts.
+
+    The code of the compiled templates is marshalled and stored keyed by a
+    hash of the template, the environment that compiled it and the time zone
+    the constant filters were folded in, so a restart does not parse and
+    compile the templates that did not change. The stored
+    templates are discarded when Home Assistant, Jinja or Python is upgraded,
+    and the templates that were not compiled during a run are dropped when
+    the run ends.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the compiled templates."""
+        self._store = Store[dict[str, Any]](
+            hass,
+            COMPILED_TEMPLATES_STORAGE_VERSION,
+            COMPILED_TEMPLATES_STORAGE_KEY,
+            private=True,
+        )
+        # The templates compiled by the previous run
+        self._stored: dict[str, str] = {}
+        # The templates compiled by this run
+        self._compiled: dict[str, str] = {}
+        self._stopping = False
+
+    async def async_load(self) -> None:
+        """Load the templates compiled by the previous run."""
+        hass = self._store.hass
+        if (data := await self._store.async_load()) and data.get(
+            "versions"
+        ) == _compiled_templates_versions():
+            self._stored = data["templates"]
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_save)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_save)
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the code of a template compiled by the previous run."""
+        if (encoded := self._stored.get(key)) is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (EOFError, TypeError, ValueError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        self._compiled[key] = encoded
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the code of a compiled template."""
+        if len(self._compiled) < MAX_COMPILED_TEMPLATES:
+            self._compiled[key] = base64.b64encode(marshal.dumps(code)).decode()
+
+    @callback
+    def _async_save(self, event: Event) -> None:
+        """Save the compiled templates."""
+        self._stopping = event.event_type == EVENT_HOMEASSISTANT_STOP
+        self._store.async_delay_save(self._data_to_save, COMPILED_TEMPLATES_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the compiled templates to store."""
+        templates = dict(self._compiled)
+        if not self._stopping:
+            # Keep the templates of the previous run that are not compiled
+            # yet, they may still be compiled before the run ends
+            for key, encoded in self._stored.items():
+                if len(templates) >= MAX_COMPILED_TEMPLATES:
+                    break
+                templates.setdefault(key, encoded)
+        return {"versions": _compiled_templates_versions(), "templates": templates}
+
+
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the templates compiled by the previous run."""
+    compiled_templates = CompiledTemplateCache(hass)
+    await compiled_templates.async_load()
+    hass.data[_COMPILED_TEMPLATES] = compiled_templates
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2740,6 +3094,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Templates are compiled differently in a limited environment
+        self._compiled_template_prefix = f"{bool(limited)}-{bool(strict)}-"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3090,7 +3446,25 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or len(source) > MAX_COMPILED_TEMPLATE_SIZE
+            or (compiled_templates := self.hass.data.get(_COMPILED_TEMPLATES)) is None
+        ):
+            compiled = super().compile(source)
+        else:
+            # The time zone is folded into the code of
+            # the constant time filters like as_local
+            time_zone = self.hass.config.time_zone
+            key = hashlib.sha256(
+                f"{self._compiled_template_prefix}{time_zone}-{source}".encode()
+            ).hexdigest()
+            if (cached := compiled_templates.get(key)) is not None:
+                compiled = cached
+            else:
+                compiled = super().compile(source)
+                compiled_templates.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -7,6 +7,7 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -19,6 +20,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -225,6 +227,62 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def set_states(hass):
+    """Set the state of 10k entities one at a time."""
+    count = 0
+    entities_to_set = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    attributes = {"friendly_name": "Kitchen Lights"}
+
+    start = timer()
+
+    for idx in range(entities_to_set):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", attributes)
+
+    await hass.async_block_till_done()
+
+    assert count == entities_to_set
+
+    return timer() - start
+
+
+@benchmark
+async def set_states_many(hass):
+    """Set the state of 10k entities in one batch."""
+    count = 0
+    entities_to_set = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    attributes = {"friendly_name": "Kitchen Lights"}
+
+    start = timer()
+
+    hass.states.async_set_many(
+        core.StateWrite(f"light.kitchen_{idx}", "on", attributes)
+        for idx in range(entities_to_set)
+    )
+
+    await hass.async_block_till_done()
+
+    assert count == entities_to_set
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -312,6 +370,146 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_insert_states(hass):
+    """Insert 10k states through the recorder ORM session."""
+    return await hass.async_add_executor_job(_recorder_insert_states, False)
+
+
+@benchmark
+async def recorder_bulk_insert_states(hass):
+    """Insert 10k states through the recorder bulk insert buffer."""
+    return await hass.async_add_executor_job(_recorder_insert_states, True)
+
+
+def _recorder_insert_states(bulk: bool) -> float:
+    """Insert 10k states with 1000 entities into an in memory database."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.bulk_insert import BulkInsertBuffer
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    events_to_insert = 10**4
+    entities = 1000
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    objs: list[Base] = []
+    old_states: dict[int, States] = {}
+    states_meta = [
+        StatesMeta(entity_id=f"sensor.test_{idx}") for idx in range(entities)
+    ]
+    objs.extend(states_meta)
+    for idx in range(events_to_insert):
+        entity_idx = idx % entities
+        state_attributes = StateAttributes(shared_attrs=f'{{"value":{idx}}}', hash=idx)
+        dbstate = States(
+            state=str(idx),
+            last_updated_ts=1700000000.0 + idx,
+            states_meta_rel=states_meta[entity_idx],
+            state_attributes=state_attributes,
+            old_state=old_states.get(entity_idx),
+        )
+        old_states[entity_idx] = dbstate
+        objs.append(state_attributes)
+        objs.append(dbstate)
+
+    start = timer()
+    with Session(engine) as session:
+        if bulk:
+            buffer = BulkInsertBuffer()
+            for obj in objs:
+                buffer.add(obj)
+            buffer.flush(session)
+        else:
+            session.add_all(objs)
+        session.commit()
+    runtime = timer() - start
+    engine.dispose()
+    print(f"Inserted {events_to_insert / runtime:.0f} events/sec")
+    return runtime
+
+
+@benchmark
+async def sensor_compile_statistics(hass):
+    """Compile 5 minute statistics of synthetic sensor fleets."""
+    return await hass.async_add_executor_job(_sensor_compile_statistics)
+
+
+def _sensor_compile_statistics() -> float:
+    """Compile the mean, min and max of fleets of 100 to 10k sensors.
+
+    Each fleet is compiled state by state and as arrays,
+    and the results are checked to be the same.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import (
+        _compile_vectorized_statistics,
+        _time_weighted_average,
+    )
+
+    period_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    period_end = period_start + timedelta(minutes=5)
+    total = 0.0
+    for entities in (100, 1000, 10000):
+        to_process = []
+        for idx in range(entities):
+            entity_id = f"sensor.test_{idx}"
+            float_states = []
+            # A state before the period and a state every 10 seconds
+            for change in range(-1, 1 + idx % 30):
+                value = float((idx * 31 + change * 7) % 997)
+                float_states.append(
+                    (
+                        value,
+                        core.State(
+                            entity_id,
+                            str(value),
+                            last_updated=period_start + timedelta(seconds=change * 10),
+                        ),
+                    )
+                )
+            to_process.append((entity_id, "W", "measurement", float_states))
+        wanted_statistics = {
+            entity_id: {"mean", "min", "max"} for entity_id, *_ in to_process
+        }
+
+        start = timer()
+        expected = {
+            entity_id: (
+                _time_weighted_average(float_states, period_start, period_end),
+                min(value for value, _ in float_states),
+                max(value for value, _ in float_states),
+            )
+            for entity_id, _, _, float_states in to_process
+        }
+        state_by_state = timer() - start
+
+        start = timer()
+        stats = _compile_vectorized_statistics(
+            to_process, wanted_statistics, {}, period_start, period_end
+        )
+        vectorized = timer() - start
+        total += vectorized
+
+        assert expected == {
+            entity_id: (stat["mean"], stat["min"], stat["max"])
+            for entity_id, stat in stats.items()
+        }
+        print(
+            f"{entities} sensors: {state_by_state:.4f}s state by state,"
+            f" {vectorized:.4f}s vectorized"
+        )
+    return total
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -355,3 +553,203 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def template_compiled_templates(hass):
+    """Compile 1000 templates, then load them as after a restart."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    sources = [
+        f"{{{{ states('sensor.test_{idx}') | float(0) * {idx} + 1 }}}}"
+        if idx % 2
+        else f"{{% if is_state('binary_sensor.test_{idx}', 'on') %}}"
+        f"{{{{ state_attr('sensor.test_{idx}', 'power') | round(1) }}}}"
+        "{% else %}off{% endif %}"
+        for idx in range(1000)
+    ]
+    compiled_templates = template.CompiledTemplateCache(hass)
+    hass.data[template._COMPILED_TEMPLATES] = compiled_templates  # noqa: SLF001
+    env = template.TemplateEnvironment(hass)
+    start = timer()
+    for source in sources:
+        env.compile(source)
+    compile_runtime = timer() - start
+
+    # Simulate a restart with the templates compiled by the previous run
+    compiled_templates._stored = compiled_templates._compiled  # noqa: SLF001
+    compiled_templates._compiled = {}  # noqa: SLF001
+    env = template.TemplateEnvironment(hass)
+    start = timer()
+    for source in sources:
+        env.compile(source)
+    runtime = timer() - start
+    print(
+        f"Compiled {len(sources)} templates in {compile_runtime:.3f}s,"
+        f" loaded them in {runtime:.3f}s"
+    )
+    return runtime
+
+
+@benchmark
+async def template_fast_render(hass):
+    """Render simple state templates with and without the fast path."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    hass.states.async_set("sensor.power", "12.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("binary_sensor.motion", "on")
+    sources = [
+        "{{ states('sensor.power') | float * 2 }}",
+        "{{ is_state('binary_sensor.motion', 'on') }}",
+        "{{ state_attr('sensor.power', 'unit_of_measurement') }}",
+        "{{ states('sensor.power') | float(0) > 10 and "
+        "is_state('binary_sensor.motion', 'on') }}",
+    ]
+    count = 100000
+    runtime = 0.0
+    for source in sources:
+        runtimes = []
+        for fast_render in (False, True):
+            tpl = template.Template(source, hass)
+            tpl.ensure_valid()
+            tpl.async_render_to_info()
+            if not fast_render:
+                tpl._fast_render = None  # noqa: SLF001
+            start = timer()
+            for _ in range(count):
+                tpl.async_render_to_info()
+            runtimes.append(timer() - start)
+        runtime += runtimes[1]
+        print(
+            f"{source}: {count / runtimes[0]:.0f} renders/sec with Jinja,"
+            f" {count / runtimes[1]:.0f} renders/sec with the fast path"
+        )
+    return runtime
+
+
+@benchmark
+async def track_time_timers(hass):
+    """Schedule 50000 timers, cancel half of them and wait for the others."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import async_call_later
+
+    count = 50000
+    event = asyncio.Event()
+    fired = 0
+
+    @core.callback
+    def listener(_):
+        nonlocal fired
+        fired += 1
+        if fired == count // 2:
+            event.set()
+
+    start = timer()
+    # The timers are due during 1 second, after 1 second
+    cancels = [
+        async_call_later(hass, 1 + idx % 1000 / 1000, listener) for idx in range(count)
+    ]
+    loop_handles = len(hass.loop._scheduled)  # noqa: SLF001
+    for cancel in cancels[1::2]:
+        cancel()
+    runtime = timer() - start
+    await event.wait()
+    print(
+        f"Scheduled and cancelled {count} timers in {runtime:.3f}s"
+        f" with {loop_handles} event loop handles"
+    )
+    return runtime
+
+
+@benchmark
+async def track_time_pattern(hass):
+    """Track 10000 time patterns, 10 of them distinct, and find when they fire."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import async_track_utc_time_change
+
+    count = 10000
+    now = dt_util.utcnow()
+
+    @core.callback
+    def listener(_):
+        pass
+
+    start = timer()
+    unsubs = [
+        async_track_utc_time_change(hass, listener, minute=f"/{idx % 10 + 1}", second=0)
+        for idx in range(count)
+    ]
+    # Find the next times the patterns fire after they fired for an hour
+    for minutes in range(60):
+        for unsub in unsubs:
+            unsub.__self__._calculate_next(now + timedelta(minutes=minutes))  # noqa: SLF001
+    runtime = timer() - start
+    for unsub in unsubs:
+        unsub()
+    return runtime
+
+
+@benchmark
+async def discovery_glob_matchers(hass):
+    """Match names against the generated DHCP hostname and HomeKit model globs."""
+    # pylint: disable-next=import-outside-toplevel
+    from fnmatch import translate
+
+    # pylint: disable-next=import-outside-toplevel
+    import re
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.dhcp import DHCP
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.zeroconf import HOMEKIT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.glob_index import GlobIndex
+
+    pattern_sets = {
+        "DHCP hostname": list(
+            dict.fromkeys(
+                matcher["hostname"] for matcher in DHCP if "hostname" in matcher
+            )
+        ),
+        "HomeKit model": [
+            model for model in HOMEKIT if "*" in model or "?" in model or "[" in model
+        ],
+    }
+    count = 100
+    runtime = 0.0
+    for name, patterns in pattern_sets.items():
+        # A name matching each pattern and as many names matching none
+        names = [
+            re.sub(r"\[(.)[^\]]*\]", r"\1", pattern).replace("?", "a").replace("*", "x")
+            for pattern in patterns
+        ]
+        names.extend(f"unknown-{idx}" for idx in range(len(patterns)))
+        compiled = [(re.compile(translate(p)), p) for p in patterns]
+        index = GlobIndex()
+        for pattern in patterns:
+            index.add(pattern, pattern)
+
+        start = timer()
+        for _ in range(count):
+            expected = [
+                [pattern for regex, pattern in compiled if regex.match(name)]
+                for name in names
+            ]
+        sequential = timer() - start
+        start = timer()
+        for _ in range(count):
+            matched = [index.match(name) for name in names]
+        indexed = timer() - start
+        runtime += indexed
+
+        assert matched == expected
+        print(
+            f"{len(patterns)} {name} patterns: {len(names) * count} names"
+            f" matched in {sequential:.3f}s sequentially,"
+            f" {indexed:.3f}s indexed"
+        )
+    return runtime
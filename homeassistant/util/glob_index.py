@@ -0,0 +1,70 @@
+"""Index of glob patterns for matching names against many patterns."""
+
+from __future__ import annotations
+
+from fnmatch import translate
+import re
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+def literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before the first wildcard."""
+    if match := _WILDCARDS.search(pattern):
+        return pattern[: match.start()]
+    return pattern
+
+
+class GlobIndex[_T]:
+    """Match a name against many glob patterns.
+
+    The patterns are indexed by their literal prefix, so only the
+    patterns whose prefix is a prefix of the name are matched, which
+    is one dict lookup for each distinct length of the prefixes
+    instead of matching every pattern.
+    """
+
+    __slots__ = ("_count", "_prefixes", "_prefix_lengths")
+
+    def __init__(self) -> None:
+        """Init the index."""
+        self._count = 0
+        self._prefixes: dict[str, list[tuple[int, re.Pattern[str], _T]]] = {}
+        self._prefix_lengths: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of patterns."""
+        return self._count
+
+    def add(self, pattern: str, value: _T) -> None:
+        """Add a pattern and the value returned when it matches."""
+        prefix = literal_prefix(pattern)
+        if prefix not in self._prefixes:
+            self._prefixes[prefix] = []
+            if len(prefix) not in self._prefix_lengths:
+                self._prefix_lengths.append(len(prefix))
+                self._prefix_lengths.sort()
+        self._prefixes[prefix].append(
+            (self._count, re.compile(translate(pattern)), value)
+        )
+        self._count += 1
+
+    def match(self, name: str) -> list[_T]:
+        """Return the values of the patterns matching a name.
+
+        The values are returned in the order the patterns were added.
+        """
+        candidates: list[tuple[int, re.Pattern[str], _T]] = []
+        for length in self._prefix_lengths:
+            if length > len(name):
+                break
+            if bucket := self._prefixes.get(name[:length]):
+                candidates.extend(bucket)
+        if len(candidates) > 1:
+            candidates.sort(key=_order)
+        return [value for _, pattern, value in candidates if pattern.match(name)]
+
+
+def _order(candidate: tuple[int, re.Pattern[str], object]) -> int:
+    """Return the order a pattern was added in."""
+    return candidate[0]
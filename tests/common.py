@@ -12,6 +12,7 @@ from functools import lru_cache
 from io import StringIO
 import json
 import logging
+import math
 import os
 import pathlib
 import threading
@@ -515,26 +516,40 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = dt_util.utc_to_timestamp(utc_datetime)
-    for task in list(hass.loop._scheduled):
-        if not isinstance(task, asyncio.TimerHandle):
-            continue
-        if task.cancelled():
-            continue
-
-        mock_seconds_into_future = timestamp - time.time()
-        future_seconds = task.when() - (hass.loop.time() + _MONOTONIC_RESOLUTION)
-
-        if fire_all or mock_seconds_into_future >= future_seconds:
-            with (
-                patch(
-                    "homeassistant.helpers.event.time_tracker_utcnow",
-                    return_value=utc_datetime,
-                ),
-                patch(
-                    "homeassistant.helpers.event.time_tracker_timestamp",
-                    return_value=timestamp,
-                ),
-            ):
+    mock_seconds_into_future = timestamp - time.time()
+    # The handles scheduled by the callbacks that are called are not run
+    tasks = list(hass.loop._scheduled)
+    with (
+        patch(
+            "homeassistant.helpers.event.time_tracker_utcnow",
+            return_value=utc_datetime,
+        ),
+        patch(
+            "homeassistant.helpers.event.time_tracker_timestamp",
+            return_value=timestamp,
+        ),
+    ):
+        # The timer wheel schedules a handle for its earliest callback only,
+        # the handle may already be due and not be called until after the
+        # simulated time, so the wheel is asked to call the due callbacks
+        if (wheel := hass.data.get(event._TIMER_WHEEL)) is not None:
+            wheel.async_run_due(
+                math.inf
+                if fire_all
+                else hass.loop.time() + _MONOTONIC_RESOLUTION + mock_seconds_into_future
+            )
+
+        for task in tasks:
+            if not isinstance(task, asyncio.TimerHandle):
+                continue
+            if task.cancelled():
+                continue
+            if isinstance(getattr(task._callback, "__self__", None), event._TimerWheel):
+                continue
+
+            future_seconds = task.when() - (hass.loop.time() + _MONOTONIC_RESOLUTION)
+
+            if fire_all or mock_seconds_into_future >= future_seconds:
                 task._run()
                 task.cancel()
 
@@ -163,6 +163,18 @@ async def test_diagnostics(
                     "sources": {},
                     "timings": {},
                 },
+                "dispatch_filter": {
+                    "addresses": 0,
+                    "received": 0,
+                    "dispatched": 0,
+                    "duplicates": 0,
+                    "deferred": 0,
+                    "superseded": 0,
+                },
+                "matcher_cache": {
+                    "callbacks": {"hits": 0, "misses": 0, "signatures": 0},
+                    "integrations": {"hits": 0, "misses": 0, "signatures": 0},
+                },
                 "all_history": [],
                 "connectable_history": [],
                 "scanners": [
@@ -308,6 +320,18 @@ async def test_diagnostics_macos(
                     "sources": {"44:44:33:11:23:45": "local"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "dispatch_filter": {
+                    "addresses": 1,
+                    "received": 1,
+                    "dispatched": 1,
+                    "duplicates": 0,
+                    "deferred": 0,
+                    "superseded": 0,
+                },
+                "matcher_cache": {
+                    "callbacks": {"hits": 0, "misses": 0, "signatures": 0},
+                    "integrations": {"hits": 0, "misses": 1, "signatures": 1},
+                },
                 "all_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -502,6 +526,18 @@ async def test_diagnostics_remote_adapter(
                     "sources": {"44:44:33:11:23:45": "esp32"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "dispatch_filter": {
+                    "addresses": 1,
+                    "received": 1,
+                    "dispatched": 1,
+                    "duplicates": 0,
+                    "deferred": 0,
+                    "superseded": 0,
+                },
+                "matcher_cache": {
+                    "callbacks": {"hits": 0, "misses": 0, "signatures": 0},
+                    "integrations": {"hits": 0, "misses": 1, "signatures": 1},
+                },
                 "all_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -0,0 +1,128 @@
+"""Tests for the Bluetooth advertisement dispatch filter."""
+
+from datetime import timedelta
+
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+from homeassistant.components.bluetooth.dispatch import (
+    DEDUP_WINDOW,
+    RATE_LIMIT_DISPATCHES,
+    RATE_LIMIT_WINDOW,
+    AdvertisementDispatchFilter,
+)
+from homeassistant.components.bluetooth.match import IntegrationMatcher
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from . import generate_advertisement_data, generate_ble_device
+
+from tests.common import async_fire_time_changed
+
+ADDRESS = "44:44:33:11:23:45"
+
+
+def _service_info(
+    time: float,
+    manufacturer_data: dict[int, bytes],
+    source: str = "hci0",
+    address: str = ADDRESS,
+) -> BluetoothServiceInfoBleak:
+    """Return a service info with manufacturer data."""
+    adv = generate_advertisement_data(manufacturer_data=manufacturer_data)
+    return BluetoothServiceInfoBleak(
+        name=address,
+        address=address,
+        rssi=-60,
+        manufacturer_data=manufacturer_data,
+        service_data={},
+        service_uuids=[],
+        source=source,
+        device=generate_ble_device(address, None),
+        advertisement=adv,
+        connectable=True,
+        time=time,
+        tx_power=None,
+    )
+
+
+async def test_echoes_from_other_scanners_are_dropped(hass: HomeAssistant) -> None:
+    """Test the same payload reported by another scanner is dispatched once."""
+    dispatched: list[BluetoothServiceInfoBleak] = []
+    dispatch_filter = AdvertisementDispatchFilter(hass.loop, dispatched.append)
+
+    frame_a = {1: b"\x01"}
+    frame_b = {2: b"\x02"}
+    dispatch_filter.async_process(_service_info(0, frame_a))
+    dispatch_filter.async_process(_service_info(0.1, frame_b))
+    # The frames are reported again by a remote scanner
+    dispatch_filter.async_process(_service_info(0.2, frame_a, "remote"))
+    dispatch_filter.async_process(_service_info(0.3, frame_b, "remote"))
+    assert [info.time for info in dispatched] == [0, 0.1]
+
+    # A frame is dispatched again when it comes back on the same scanner,
+    # when the payload changed or after the window
+    dispatch_filter.async_process(_service_info(0.4, frame_a))
+    dispatch_filter.async_process(_service_info(0.5, {2: b"\x03"}, "remote"))
+    dispatch_filter.async_process(_service_info(DEDUP_WINDOW + 0.4, frame_a, "remote"))
+    assert [info.time for info in dispatched] == [
+        0,
+        0.1,
+        0.4,
+        0.5,
+        DEDUP_WINDOW + 0.4,
+    ]
+    assert dispatch_filter.async_diagnostics() == {
+        "addresses": 1,
+        "received": 7,
+        "dispatched": 5,
+        "duplicates": 2,
+        "deferred": 0,
+        "superseded": 0,
+    }
+
+    dispatch_filter.async_clear_address(ADDRESS)
+    assert dispatch_filter.async_diagnostics()["addresses"] == 0
+
+
+async def test_dispatches_are_rate_limited(hass: HomeAssistant) -> None:
+    """Test the dispatches above the rate limit are deferred to the end of the window."""
+    dispatched: list[BluetoothServiceInfoBleak] = []
+    dispatch_filter = AdvertisementDispatchFilter(hass.loop, dispatched.append)
+
+    for i in range(RATE_LIMIT_DISPATCHES + 5):
+        dispatch_filter.async_process(_service_info(i / 100, {1: bytes([i])}))
+    dispatch_filter.async_process(_service_info(0.2, {2: b"\x02"}))
+    # Other addresses are not limited
+    dispatch_filter.async_process(_service_info(0.2, {1: b"\x01"}, address="other"))
+    assert len(dispatched) == RATE_LIMIT_DISPATCHES + 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=RATE_LIMIT_WINDOW)
+    )
+    await hass.async_block_till_done()
+    # Only the last deferred advertisement of each signature is dispatched
+    assert [info.manufacturer_data for info in dispatched[-2:]] == [
+        {1: bytes([RATE_LIMIT_DISPATCHES + 4])},
+        {2: b"\x02"},
+    ]
+    assert dispatch_filter.async_diagnostics() == {
+        "addresses": 2,
+        "received": RATE_LIMIT_DISPATCHES + 7,
+        "dispatched": RATE_LIMIT_DISPATCHES + 3,
+        "duplicates": 0,
+        "deferred": 6,
+        "superseded": 4,
+    }
+    dispatch_filter.async_stop()
+
+
+def test_matcher_cache() -> None:
+    """Test the matchers of an advertisement signature are cached."""
+    matcher = IntegrationMatcher([{"domain": "test", "manufacturer_id": 1}])
+    matcher.async_setup()
+
+    assert matcher.match_domains(_service_info(0, {1: b"\x01"})) == {"test"}
+    assert matcher.match_domains(_service_info(0, {1: b"\x02"}, address="other")) == {
+        "test"
+    }
+    assert matcher.match_domains(_service_info(0, {2: b"\x01"}, address="new")) == set()
+    assert matcher.async_diagnostics() == {"signatures": 2, "hits": 1, "misses": 2}
@@ -5,11 +5,14 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.tasks import DownsampleTask
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -402,6 +405,250 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+@pytest.mark.freeze_time("2024-01-01 00:01:00+00:00")
+async def test_history_during_period_downsampled(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period reads the downsampled states."""
+    start = dt_util.utcnow().replace(minute=0)
+
+    await async_setup_component(hass, "history", {})
+    for state in ("2", "8", "4"):
+        hass.states.async_set("sensor.test", state)
+        await async_recorder_block_till_done(hass)
+        freezer.tick(timedelta(minutes=1))
+    freezer.move_to(start + timedelta(minutes=10))
+    recorder_mock.queue_task(DownsampleTask(dt_util.utcnow()))
+    await async_wait_recording_done(hass)
+
+    # The recorded states are returned when they fit in max_points
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": (start - timedelta(days=2)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "2",
+        "8",
+        "4",
+    ]
+    assert "first" not in response["result"]["sensor.test"][0]
+
+    # The states recorded after the last compiled bucket follow the buckets
+    hass.states.async_set("sensor.test", "6")
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {"s": "4", "lu": start.timestamp(), "first": "2", "min": 2, "max": 8},
+            {"s": "6", "lu": dt_util.utcnow().timestamp()},
+        ]
+    }
+
+    # The day has not ended yet
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": (start - timedelta(days=30)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {"s": "2", "lu": (start + timedelta(minutes=1)).timestamp()},
+            {"s": "8", "lu": (start + timedelta(minutes=2)).timestamp()},
+            {"s": "4", "lu": (start + timedelta(minutes=3)).timestamp()},
+            {"s": "6", "lu": dt_util.utcnow().timestamp()},
+        ]
+    }
+
+    # The state at the start time is returned before the buckets
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": (start + timedelta(minutes=5)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "resolution": "5minute",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {"s": "4", "lu": (start + timedelta(minutes=5)).timestamp()},
+            {"s": "6", "lu": dt_util.utcnow().timestamp()},
+        ]
+    }
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "resolution": "hour",
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("max_chunks_per_page", [1, 4])
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+    max_chunks_per_page: int,
+) -> None:
+    """Test history_during_period streams the states in chunks read in pages."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    # The repeated state of sensor.one is recorded at the end of the first chunk
+    for idx, state in enumerate(("1", "2", "3", "3", "1")):
+        hass.states.async_set("sensor.one", state, attributes={"any": idx})
+        hass.states.async_set("sensor.two", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two", "sensor.missing"],
+        "significant_changes_only": False,
+        "minimal_response": minimal_response,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == (4 if minimal_response else 5)
+    assert len(expected["sensor.two"]) == 4
+
+    with (
+        patch.object(websocket_api, "MAX_STATES_PER_CHUNK", 3),
+        patch.object(websocket_api, "MAX_CHUNKS_PER_PAGE", max_chunks_per_page),
+    ):
+        await client.send_json_auto_id({**request, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        states: dict[str, list[dict]] = {}
+        chunks = 0
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            chunks += 1
+            for entity_id, entity_states in response["event"]["states"].items():
+                states.setdefault(entity_id, []).extend(entity_states)
+            if not response["event"].get("partial"):
+                break
+    assert chunks == 3
+    assert states == expected
+
+    # An empty response is sent as a single event
+    await client.send_json_auto_id(
+        {
+            **request,
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}}
+
+
+async def test_history_during_period_chunked_client_not_reading(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period stops streaming when a chunk is not read in time."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    for state in ("1", "2", "3", "4", "5"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    sent: list[int] = []
+    cancelled = asyncio.Event()
+
+    async def _async_send_stream_message(
+        self: ActiveConnection, msg_id: int, message: bytes
+    ) -> bool:
+        """Send the message and wait as if the client does not read it."""
+        self.send_message(message)
+        sent.append(msg_id)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return True
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "MAX_STATES_PER_CHUNK", 2),
+        patch.object(websocket_api, "CHUNK_SEND_TIMEOUT", 0.1),
+        patch.object(
+            ActiveConnection, "async_send_stream_message", _async_send_stream_message
+        ),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["partial"]
+        async with asyncio.timeout(5):
+            await cancelled.wait()
+
+    # The stream stopped with an error after the chunk that was not read
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "timeout"
+    await client.send_json_auto_id({"type": "ping"})
+    response = await client.receive_json()
+    assert response["type"] == "pong"
+    assert len(sent) == 1
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -915,6 +1162,76 @@ async def test_history_stream_live_no_attributes_minimal_response(
     }
 
 
+async def test_history_stream_live_shared(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical history streams share the live stream."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "off")
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/stream",
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "start_time": now.isoformat(),
+        "no_attributes": True,
+        "minimal_response": True,
+    }
+    clients = [await hass_ws_client(), await hass_ws_client()]
+    for client, entity_ids in zip(
+        clients,
+        (["sensor.one", "sensor.two"], ["sensor.two", "sensor.one"]),
+        strict=True,
+    ):
+        await client.send_json({"id": 1, **request, "entity_ids": entity_ids})
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "on"
+    live_streams = hass.data[websocket_api.HISTORY_LIVE_STREAMS]
+    assert len(live_streams) == 1
+
+    with patch.object(
+        websocket_api,
+        "_events_to_compressed_states",
+        wraps=websocket_api._events_to_compressed_states,
+    ) as compressed_states_mock:
+        hass.states.async_set("sensor.one", "off")
+        hass.states.async_set("sensor.two", "on")
+        responses = [await client.receive_json() for client in clients]
+    assert compressed_states_mock.call_count == 1
+    assert responses[0] == responses[1]
+    assert responses[0]["id"] == 1
+    assert responses[0]["event"]["states"]["sensor.two"][0]["s"] == "on"
+
+    # Streams with other options do not share the live stream
+    await clients[0].send_json({"id": 2, **request, "no_attributes": False})
+    response = await clients[0].receive_json()
+    assert response["success"]
+    await clients[0].receive_json()
+    assert len(live_streams) == 2
+
+    await clients[0].send_json(
+        {"id": 3, "type": "unsubscribe_events", "subscription": 1}
+    )
+    response = await clients[0].receive_json()
+    assert response["success"]
+    assert len(live_streams) == 2
+
+    hass.states.async_set("sensor.two", "off")
+    response = await clients[1].receive_json()
+    assert response["event"]["states"]["sensor.two"][0]["s"] == "off"
+
+    await clients[1].send_json(
+        {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+    )
+    response = await clients[1].receive_json()
+    assert response["success"]
+    assert len(live_streams) == 1
+
+
 async def test_history_stream_live(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
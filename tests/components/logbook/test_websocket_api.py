@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -12,10 +13,12 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.index import LogbookIndex
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api import TYPE_RESULT
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -457,6 +460,296 @@ async def test_get_events_invalid_filters(
     assert response["error"]["code"] == "invalid_format"
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"exclude": {"entities": ["switch.fan"], "event_types": ["logbook_entry"]}}],
+)
+async def test_get_events_from_index_recorder_excluded(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the events the recorder excludes are not returned from the index."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("switch.fan", STATE_OFF)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("switch.fan", STATE_ON)
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "light", "light.kitchen")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "id": 1,
+        "type": "logbook/get_events",
+        "start_time": start.isoformat(),
+    }
+    with patch.object(
+        websocket_api,
+        "_ws_formatted_get_events",
+        side_effect=AssertionError("database queried"),
+    ):
+        await client.send_json(request)
+        response = await client.receive_json()
+    assert response["success"]
+    events = response["result"]
+    assert [event["entity_id"] for event in events] == ["light.kitchen"]
+
+    with patch.object(LogbookIndex, "async_get_rows", return_value=None):
+        await client.send_json({**request, "id": 2})
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == events
+
+
+async def test_get_events_from_index(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test recent events are returned from the index like from the database."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+
+    @core.callback
+    def _turn_on(call: core.ServiceCall) -> None:
+        hass.states.async_set("light.kitchen", STATE_ON, context=call.context)
+
+    hass.services.async_register("test", "turn_on", _turn_on)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("switch.fan", STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.services.async_call("test", "turn_on", blocking=True)
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch", "switch.fan")
+    hass.states.async_set("switch.fan", STATE_ON)
+    hass.states.async_set("sensor.power", "5", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "6", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    await async_wait_recording_done(hass)
+    context_id = hass.states.get("light.kitchen").context.id
+
+    client = await hass_ws_client()
+    msg_id = 0
+
+    async def _get_events(**request: Any) -> list[dict[str, Any]]:
+        nonlocal msg_id
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": start.isoformat(),
+                **request,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    for request in (
+        {},
+        {"entity_ids": ["light.kitchen"]},
+        {"entity_ids": ["switch.fan", "sensor.power"]},
+        {"context_id": context_id},
+    ):
+        with patch.object(
+            websocket_api,
+            "_ws_formatted_get_events",
+            side_effect=AssertionError("database queried"),
+        ):
+            events = await _get_events(**request)
+        assert events
+        with patch.object(LogbookIndex, "async_get_rows", return_value=None):
+            assert await _get_events(**request) == events
+
+    events = await _get_events()
+    assert [event.get("entity_id") for event in events] == [
+        "light.kitchen",
+        "switch.fan",
+        "switch.fan",
+    ]
+    assert events[0]["context_domain"] == "test"
+    assert events[0]["context_service"] == "turn_on"
+
+    # The events before the index are returned from the database
+    with patch.object(
+        websocket_api,
+        "_ws_formatted_get_events",
+        wraps=websocket_api._ws_formatted_get_events,
+    ) as get_events_mock:
+        await _get_events(start_time=(start - timedelta(hours=1)).isoformat())
+    assert get_events_mock.called
+
+    # The historical events of a live stream are returned from the index
+    with patch.object(
+        websocket_api,
+        "_ws_stream_get_events",
+        side_effect=AssertionError("database queried"),
+    ):
+        await client.send_json(
+            {
+                "id": msg_id + 1,
+                "type": "logbook/event_stream",
+                "start_time": start.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["events"] == events
+        assert response["event"]["partial"]
+        response = await client.receive_json()
+        assert response["event"]["events"] == []
+        assert "partial" not in response["event"]
+
+
+@pytest.mark.parametrize("max_chunks_per_page", [1, 4])
+async def test_get_events_chunked(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    max_chunks_per_page: int,
+) -> None:
+    """Test logbook get_events streams the events in chunks read in pages."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow() - timedelta(hours=1)
+
+    @core.callback
+    def _turn_on(call: core.ServiceCall) -> None:
+        hass.states.async_set("light.kitchen", STATE_ON, context=call.context)
+
+    hass.services.async_register("test", "turn_on", _turn_on)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    # The pages continue between the events fired at the same time
+    with freeze_time(dt_util.utcnow()):
+        for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+            hass.states.async_set("switch.fan", state, force_update=True)
+    await hass.async_block_till_done()
+    await hass.services.async_call("test", "turn_on", blocking=True)
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch", "switch.fan")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {"type": "logbook/get_events", "start_time": start.isoformat()}
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected) == 5
+    assert expected[3]["context_service"] == "turn_on"
+
+    with (
+        patch.object(websocket_api, "MAX_ROWS_PER_CHUNK", 2),
+        patch.object(websocket_api, "MAX_CHUNKS_PER_PAGE", max_chunks_per_page),
+    ):
+        await client.send_json_auto_id({**request, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        events: list[dict[str, Any]] = []
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            events.extend(response["event"]["events"])
+            if not response["event"].get("partial"):
+                break
+    assert events == expected
+
+    # An empty response is sent as a single event
+    await client.send_json_auto_id(
+        {
+            **request,
+            "start_time": (start + timedelta(days=1)).isoformat(),
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"events": []}
+
+
+async def test_get_events_chunked_client_not_reading(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events stops streaming when a chunk is not read in time."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow() - timedelta(hours=1)
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("switch.fan", state)
+    await async_wait_recording_done(hass)
+
+    sent: list[int] = []
+    cancelled = asyncio.Event()
+
+    async def _async_send_stream_message(
+        self: ActiveConnection, msg_id: int, message: bytes
+    ) -> bool:
+        """Send the message and wait as if the client does not read it."""
+        self.send_message(message)
+        sent.append(msg_id)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return True
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "MAX_ROWS_PER_CHUNK", 1),
+        patch.object(websocket_api, "CHUNK_SEND_TIMEOUT", 0.1),
+        patch.object(
+            ActiveConnection, "async_send_stream_message", _async_send_stream_message
+        ),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "logbook/get_events",
+                "start_time": start.isoformat(),
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["partial"]
+        async with asyncio.timeout(5):
+            await cancelled.wait()
+
+    # The stream stopped with an error after the chunk that was not read
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "timeout"
+    await client.send_json_auto_id({"type": "ping"})
+    response = await client.receive_json()
+    assert response["type"] == "pong"
+    assert len(sent) == 1
+
+
 async def test_get_events_with_device_ids(
     recorder_mock: Recorder,
     hass: HomeAssistant,
@@ -2,9 +2,12 @@
 
 import asyncio
 import copy
+from datetime import timedelta
+import hashlib
 import json
 from pathlib import Path
 import re
+from typing import Any
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
@@ -16,6 +19,8 @@ from homeassistant.components.mqtt.abbreviations import (
     DEVICE_ABBREVIATIONS,
 )
 from homeassistant.components.mqtt.discovery import (
+    DISCOVERY_CACHE_SAVE_DELAY,
+    DISCOVERY_CACHE_STORAGE_KEY,
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
     MQTT_DISCOVERY_UPDATED,
@@ -28,6 +33,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     Platform,
+    __version__,
 )
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
@@ -38,6 +44,7 @@ from homeassistant.helpers.dispatcher import (
 )
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.signal_type import SignalTypeFormat
 
 from .test_common import help_all_subscribe_calls, help_test_unload_config_entry
@@ -46,6 +53,7 @@ from tests.common import (
     MockConfigEntry,
     async_capture_events,
     async_fire_mqtt_message,
+    async_fire_time_changed,
     mock_config_flow,
     mock_platform,
 )
@@ -221,6 +229,129 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+CACHED_SENSOR_TOPIC = "homeassistant/sensor/bla/config"
+CACHED_SENSOR_PAYLOAD = json.dumps(
+    {
+        "name": "Beer",
+        "state_topic": "test-topic",
+        "value_template": "{{ value_json.temperature }}",
+        "device_class": "temperature",
+        "unit_of_measurement": "°C",
+    }
+)
+
+
+async def test_discovery_cache_stores_config(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the validated config of a discovered entity is stored."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(hass, CACHED_SENSOR_TOPIC, CACHED_SENSOR_PAYLOAD)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.beer") is not None
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DISCOVERY_CACHE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[DISCOVERY_CACHE_STORAGE_KEY]["data"]
+    assert data["version"] == __version__
+    entry = data["entries"][CACHED_SENSOR_TOPIC]
+    assert entry["domain"] == "sensor"
+    assert entry["hash"] == (hashlib.sha256(CACHED_SENSOR_PAYLOAD.encode()).hexdigest())
+    assert entry["config"]["name"] == "Beer"
+    assert entry["config"]["value_template"] == {
+        "__mqtt_template__": "{{ value_json.temperature }}"
+    }
+    assert entry["config"]["device_class"] == {
+        "__mqtt_enum__": "homeassistant.components.sensor.const:SensorDeviceClass",
+        "value": "temperature",
+    }
+
+    # The cached config is removed with the entity
+    async_fire_mqtt_message(hass, CACHED_SENSOR_TOPIC, "")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.beer") is None
+    await hass.config_entries.async_unload(
+        hass.config_entries.async_entries(mqtt.DOMAIN)[0].entry_id
+    )
+    assert hass_storage[DISCOVERY_CACHE_STORAGE_KEY]["data"]["entries"] == {}
+
+
+@pytest.mark.parametrize(
+    ("version", "payload_hash", "name"),
+    [
+        (
+            __version__,
+            hashlib.sha256(CACHED_SENSOR_PAYLOAD.encode()).hexdigest(),
+            "Cached",
+        ),
+        (__version__, "changed", "Beer"),
+        (
+            "2000.1.0",
+            hashlib.sha256(CACHED_SENSOR_PAYLOAD.encode()).hexdigest(),
+            "Beer",
+        ),
+    ],
+)
+async def test_discovery_cache_restores_config(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    hass_storage: dict[str, Any],
+    version: str,
+    payload_hash: str,
+    name: str,
+) -> None:
+    """Test the cached config is used for an unchanged payload."""
+    hass_storage[DISCOVERY_CACHE_STORAGE_KEY] = {
+        "version": 1,
+        "key": DISCOVERY_CACHE_STORAGE_KEY,
+        "data": {
+            "version": version,
+            "entries": {
+                CACHED_SENSOR_TOPIC: {
+                    "domain": "sensor",
+                    "hash": payload_hash,
+                    "config": {
+                        "name": "Cached",
+                        "state_topic": "test-topic",
+                        "value_template": {
+                            "__mqtt_template__": "{{ value_json.temperature }}"
+                        },
+                        "device_class": {
+                            "__mqtt_enum__": (
+                                "homeassistant.components.sensor.const:SensorDeviceClass"
+                            ),
+                            "value": "temperature",
+                        },
+                        "unit_of_measurement": "°C",
+                        "platform": "mqtt",
+                        "qos": 0,
+                        "encoding": "utf-8",
+                        "availability_mode": "latest",
+                        "enabled_by_default": True,
+                        "force_update": False,
+                        "payload_available": "online",
+                        "payload_not_available": "offline",
+                    },
+                }
+            },
+        },
+    }
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(hass, CACHED_SENSOR_TOPIC, CACHED_SENSOR_PAYLOAD)
+    await hass.async_block_till_done()
+    state = hass.states.get(f"sensor.{name.lower()}")
+    assert state is not None
+    assert state.attributes["device_class"] == "temperature"
+
+    async_fire_mqtt_message(hass, "test-topic", '{"temperature": 21.5}')
+    await hass.async_block_till_done()
+    assert hass.states.get(f"sensor.{name.lower()}").state == "21.5"
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
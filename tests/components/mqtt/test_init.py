@@ -25,6 +25,8 @@ from homeassistant.components.mqtt.client import (
     _LOGGER as CLIENT_LOGGER,
     RECONNECT_INTERVAL_SECONDS,
     EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
 )
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -1419,6 +1421,56 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic", "matching_filters"),
+    [
+        ("a", {"#", "+", "a/#"}),
+        ("a/b", {"#", "+/b", "a/+", "a/#", "a/b/#", "+/+"}),
+        ("a/b/c", {"#", "a/#", "a/b/#", "a/+/c", "+/+/c"}),
+        ("a//c", {"#", "a/#", "a/+/c", "+/+/c"}),
+        ("$SYS/b", {"$SYS/#", "$SYS/+"}),
+        ("b/a", {"#", "+/+"}),
+    ],
+)
+def test_subscription_trie(topic: str, matching_filters: set[str]) -> None:
+    """Test the subscription trie matches the topic filters."""
+    job = ha.HassJob(lambda msg: None)
+    filters = (
+        "#",
+        "+",
+        "+/b",
+        "+/+",
+        "+/+/c",
+        "a/#",
+        "a/+",
+        "a/+/c",
+        "a/b/#",
+        "$SYS/#",
+        "$SYS/+",
+    )
+    subscriptions = {
+        topic_filter: Subscription(topic_filter, False, job) for topic_filter in filters
+    }
+    trie = SubscriptionTrie()
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    matches = trie.match(topic)
+    assert len(matches) == len(matching_filters)
+    assert {subscription.topic for subscription in matches} == matching_filters
+    assert trie.has_topic("a/+/c")
+    assert not trie.has_topic("a/+/d")
+    assert set(trie) == set(subscriptions.values())
+
+    # The levels are removed with the last subscription using them
+    for subscription in subscriptions.values():
+        trie.remove(subscription)
+    assert trie.match(topic) == []
+    assert not trie._root.children
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["a/+/c"])
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -3543,6 +3595,81 @@ async def test_debug_info_wildcard(
     } in debug_info_data["entities"][0]["subscriptions"]
 
 
+async def test_debug_info_coalesced(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test debug info of a coalesced subscription."""
+    await mqtt_mock_entry()
+    config = {
+        "device": {"identifiers": ["helloworld"]},
+        "name": "test",
+        "state_topic": "sensor/status",
+        "unique_id": "veryunique",
+        "coal_win": 0,
+    }
+
+    data = json.dumps(config)
+    async_fire_mqtt_message(hass, "homeassistant/sensor/bla/config", data)
+    await hass.async_block_till_done()
+
+    # Only the last of the messages received together is dispatched
+    for payload in ("1", "2", "3"):
+        async_fire_mqtt_message(hass, "sensor/status", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.none_test").state == "3"
+
+    device = device_registry.async_get_device(identifiers={("mqtt", "helloworld")})
+    assert device is not None
+    debug_info_data = debug_info.info_for_device(hass, device.id)
+    subscriptions = debug_info_data["entities"][0]["subscriptions"]
+    assert len(subscriptions) == 1
+    assert [msg["payload"] for msg in subscriptions[0]["messages"]] == ["3"]
+    assert subscriptions[0]["coalescing"] == {
+        "window": 0,
+        "received": 3,
+        "dispatched": 1,
+        "mean_delay": ANY,
+        "max_delay": ANY,
+    }
+
+
+async def test_subscribe_coalesce_window(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the last message of each topic in the coalesce window is dispatched."""
+    await mqtt_mock_entry()
+    unsub = mqtt.async_subscribe_internal(
+        hass, "test-topic/#", record_calls, coalesce_window=1
+    )
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    for topic, payload in (("a", "1"), ("b", "2"), ("a", "3")):
+        async_fire_mqtt_message(hass, f"test-topic/{topic}", payload)
+        await hass.async_block_till_done()
+    # The subscription that is not coalesced receives every message
+    assert [msg.payload for msg in recorded_calls] == ["1", "2", "3"]
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    # The wildcard subscription gets the last message of each topic
+    assert [(msg.topic, msg.payload) for msg in recorded_calls[3:]] == [
+        ("test-topic/a", "3"),
+        ("test-topic/b", "2"),
+    ]
+
+    # The pending messages are dropped when unsubscribing
+    async_fire_mqtt_message(hass, "test-topic/c", "4")
+    unsub()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert [msg.payload for msg in recorded_calls] == ["1", "2", "3", "3", "2", "4"]
+
+
 async def test_debug_info_same_topic(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
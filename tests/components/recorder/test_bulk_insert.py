@@ -0,0 +1,116 @@
+"""Test the recorder bulk insert write path."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import CONF_BULK_INSERT, CONF_COMMIT_INTERVAL
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def test_bulk_insert_states_and_events(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test states and events written in bulk are linked together."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_BULK_INSERT: True, CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_insert_buffer is not None
+
+    attributes = {"friendly_name": "Bulk"}
+    # Change each entity several times in the same commit so
+    # the old state of a state is inserted in the same flush
+    for state in ("one", "two", "three"):
+        hass.states.async_set("test.bulk_1", state, attributes)
+        hass.states.async_set("test.bulk_2", state, attributes)
+    hass.bus.async_fire("test_bulk_event", {"bulk": True})
+    hass.bus.async_fire("test_bulk_event", {"bulk": True})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    assert len(instance._bulk_insert_buffer) == 0
+
+    hass.states.async_set("test.bulk_1", "four", attributes)
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        assert set(metadata_ids) == {"test.bulk_1", "test.bulk_2"}
+        assert session.query(StateAttributes).count() == 1
+        shared_attrs = session.query(StateAttributes).one()
+        for entity_id, states in (
+            ("test.bulk_1", ["one", "two", "three", "four"]),
+            ("test.bulk_2", ["one", "two", "three"]),
+        ):
+            db_states = list(
+                session.query(States)
+                .filter(States.metadata_id == metadata_ids[entity_id])
+                .order_by(States.last_updated_ts)
+            )
+            assert [db_state.state for db_state in db_states] == states
+            assert db_states[0].old_state_id is None
+            for old_db_state, db_state in zip(db_states, db_states[1:], strict=False):
+                assert db_state.old_state_id == old_db_state.state_id
+            for db_state in db_states:
+                assert db_state.attributes_id == shared_attrs.attributes_id
+
+        event_type = (
+            session.query(EventTypes)
+            .filter(EventTypes.event_type == "test_bulk_event")
+            .one()
+        )
+        db_events = list(
+            session.query(Events).filter(
+                Events.event_type_id == event_type.event_type_id
+            )
+        )
+        assert len(db_events) == 2
+        assert db_events[0].data_id is not None
+        assert db_events[0].data_id == db_events[1].data_id
+        event_data = session.get(EventData, db_events[0].data_id)
+        assert event_data.shared_data == '{"bulk":true}'
+
+
+async def test_bulk_insert_not_supported(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test bulk insert is disabled when the database does not support it."""
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_insert",
+        return_value=False,
+    ):
+        instance = await async_setup_recorder_instance(hass, {CONF_BULK_INSERT: True})
+    assert instance._bulk_insert_buffer is None
+    assert "bulk inserts are disabled" in caplog.text
+
+    hass.states.async_set("test.bulk", "on")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 1
@@ -0,0 +1,277 @@
+"""Test the downsampled states."""
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StatesDownsampled
+from homeassistant.components.recorder.downsample import (
+    get_downsampled_states,
+    resolution_for_max_points,
+    states_fit_in_max_points,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.tasks import DownsampleTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+START = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Record states during the first 10 minutes after START."""
+    for minute, temperature, switch in (
+        (1, "1", "on"),
+        (2, "5", "off"),
+        (3, "3", "on"),
+        (7, "unavailable", "off"),
+    ):
+        freezer.move_to(START + timedelta(minutes=minute))
+        hass.states.async_set("sensor.temperature", temperature)
+        hass.states.async_set("switch.test", switch)
+        await async_wait_recording_done(hass)
+
+
+async def _async_compile(
+    hass: HomeAssistant, instance: Recorder, end: datetime
+) -> None:
+    """Compile the downsampled states of the periods that ended before end."""
+    instance.queue_task(DownsampleTask(end))
+    await async_wait_recording_done(hass)
+
+
+def test_resolution_for_max_points() -> None:
+    """Test the finest resolution with at most max_points is selected."""
+    assert resolution_for_max_points(START, START + timedelta(days=1), 300) == (
+        "5minute"
+    )
+    assert resolution_for_max_points(START, START + timedelta(days=1), 200) == "hour"
+    assert resolution_for_max_points(START, START + timedelta(days=30), 1000) == "hour"
+    assert resolution_for_max_points(START, START + timedelta(days=30), 500) == "day"
+    assert resolution_for_max_points(START, START + timedelta(days=365), 10) == "day"
+
+
+@pytest.mark.freeze_time(START)
+async def test_compile_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the states are summarized at each resolution."""
+    instance = recorder_mock
+    await _async_record_states(hass, freezer)
+    freezer.move_to(START + timedelta(days=1, minutes=1))
+    await _async_compile(hass, instance, dt_util.utcnow())
+
+    entity_ids = ["sensor.temperature", "switch.test"]
+    states = await instance.async_add_executor_job(
+        get_downsampled_states,
+        hass,
+        START,
+        START + timedelta(hours=1),
+        entity_ids,
+        "5minute",
+    )
+    assert states == {
+        "sensor.temperature": [
+            {"s": "3", "lu": START.timestamp(), "first": "1", "min": 1, "max": 5},
+            {
+                "s": "unavailable",
+                "lu": (START + timedelta(minutes=5)).timestamp(),
+                "first": "unavailable",
+            },
+        ],
+        "switch.test": [
+            {"s": "on", "lu": START.timestamp(), "first": "on"},
+            {
+                "s": "off",
+                "lu": (START + timedelta(minutes=5)).timestamp(),
+                "first": "off",
+            },
+        ],
+    }
+
+    for resolution in ("hour", "day"):
+        states = await instance.async_add_executor_job(
+            get_downsampled_states,
+            hass,
+            START,
+            START + timedelta(days=1),
+            entity_ids,
+            resolution,
+        )
+        assert states == {
+            "sensor.temperature": [
+                {
+                    "s": "unavailable",
+                    "lu": START.timestamp(),
+                    "first": "1",
+                    "min": 1,
+                    "max": 5,
+                },
+            ],
+            "switch.test": [{"s": "off", "lu": START.timestamp(), "first": "on"}],
+        }
+
+    # The state at the start time is returned before the buckets
+    start_time = START + timedelta(minutes=5)
+    states = await instance.async_add_executor_job(
+        get_downsampled_states,
+        hass,
+        start_time,
+        None,
+        ["sensor.temperature"],
+        "5minute",
+    )
+    assert states == {
+        "sensor.temperature": [
+            {"s": "3", "lu": start_time.timestamp()},
+            {"s": "unavailable", "lu": start_time.timestamp(), "first": "unavailable"},
+        ],
+    }
+
+
+@pytest.mark.freeze_time(START)
+async def test_compile_downsampled_states_incrementally(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only the periods that ended since the last compile are compiled."""
+    instance = recorder_mock
+    await _async_record_states(hass, freezer)
+
+    freezer.move_to(START + timedelta(minutes=8))
+    await _async_compile(hass, instance, dt_util.utcnow())
+    assert instance.downsampled_until == (START + timedelta(minutes=5)).timestamp()
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesDownsampled).count() == 2
+
+    hass.states.async_set("sensor.temperature", "10")
+    await async_wait_recording_done(hass)
+    freezer.move_to(START + timedelta(minutes=11))
+    await _async_compile(hass, instance, dt_util.utcnow())
+    assert instance.downsampled_until == (START + timedelta(minutes=10)).timestamp()
+
+    states = await instance.async_add_executor_job(
+        get_downsampled_states,
+        hass,
+        START,
+        None,
+        ["sensor.temperature"],
+        "5minute",
+    )
+    assert [(state["first"], state["s"]) for state in states["sensor.temperature"]] == [
+        ("1", "3"),
+        ("unavailable", "10"),
+    ]
+
+
+@pytest.mark.freeze_time(START)
+async def test_states_after_compiled_buckets(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the states after the last compiled bucket are returned as recorded."""
+    instance = recorder_mock
+    await _async_record_states(hass, freezer)
+    freezer.move_to(START + timedelta(minutes=8))
+    await _async_compile(hass, instance, dt_util.utcnow())
+
+    states = await instance.async_add_executor_job(
+        get_downsampled_states,
+        hass,
+        START,
+        None,
+        ["sensor.temperature"],
+        "5minute",
+    )
+    assert states == {
+        "sensor.temperature": [
+            {"s": "3", "lu": START.timestamp(), "first": "1", "min": 1, "max": 5},
+            {"s": "unavailable", "lu": (START + timedelta(minutes=7)).timestamp()},
+        ],
+    }
+
+    # The hour has not ended yet
+    states = await instance.async_add_executor_job(
+        get_downsampled_states,
+        hass,
+        START,
+        START + timedelta(minutes=3),
+        ["sensor.temperature"],
+        "hour",
+    )
+    assert states == {
+        "sensor.temperature": [
+            {"s": "1", "lu": (START + timedelta(minutes=1)).timestamp()},
+            {"s": "5", "lu": (START + timedelta(minutes=2)).timestamp()},
+        ],
+    }
+
+
+@pytest.mark.freeze_time(START)
+async def test_states_fit_in_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the number of recorded states is compared with max_points."""
+    instance = recorder_mock
+    await _async_record_states(hass, freezer)
+
+    entity_ids = ["sensor.temperature", "switch.test", "sensor.missing"]
+    for start_time, end_time, max_points, fit in (
+        (START, None, 4, True),
+        (START, None, 3, False),
+        (START, START + timedelta(minutes=7), 3, True),
+        (START + timedelta(minutes=2), None, 3, True),
+    ):
+        assert (
+            await instance.async_add_executor_job(
+                states_fit_in_max_points,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                max_points,
+            )
+            is fit
+        )
+
+
+@pytest.mark.freeze_time(START)
+async def test_purge_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the downsampled states are purged with the states."""
+    instance = recorder_mock
+    await _async_record_states(hass, freezer)
+    freezer.move_to(START + timedelta(hours=1, minutes=1))
+    await _async_compile(hass, instance, dt_util.utcnow())
+
+    with session_scope(hass=hass) as session:
+        assert {
+            (row.resolution, row.start_ts) for row in session.query(StatesDownsampled)
+        } == {
+            (300, START.timestamp()),
+            (300, (START + timedelta(minutes=5)).timestamp()),
+            (3600, START.timestamp()),
+        }
+
+        purges = 0
+        while not purge_old_data(instance, START + timedelta(minutes=5), repack=False):
+            purges += 1
+            assert purges < 10
+        assert {
+            (row.resolution, row.start_ts) for row in session.query(StatesDownsampled)
+        } == {(300, (START + timedelta(minutes=5)).timestamp())}
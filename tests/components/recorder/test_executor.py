@@ -0,0 +1,62 @@
+"""Test the database executor."""
+
+import threading
+
+from homeassistant.components.recorder.const import QueryPriority
+from homeassistant.components.recorder.executor import DBInterruptibleThreadPoolExecutor
+
+
+def test_executor_runs_jobs_by_priority() -> None:
+    """Test queued jobs with a higher priority run first."""
+    recorder_and_worker_thread_ids: set[int] = set()
+    shutdown_hook_calls = 0
+
+    def _shutdown_hook() -> None:
+        nonlocal shutdown_hook_calls
+        shutdown_hook_calls += 1
+
+    executor = DBInterruptibleThreadPoolExecutor(
+        recorder_and_worker_thread_ids,
+        max_workers=1,
+        shutdown_hook=_shutdown_hook,
+    )
+    assert executor.size == 1
+
+    blocked = threading.Event()
+    unblock = threading.Event()
+
+    def _block() -> None:
+        blocked.set()
+        unblock.wait()
+
+    order: list[str] = []
+    executor.submit_with_priority(QueryPriority.NORMAL, _block)
+    assert blocked.wait(5)
+
+    futures = [
+        executor.submit_with_priority(QueryPriority.LOW, order.append, "low"),
+        executor.submit(order.append, "normal"),
+        executor.submit_with_priority(QueryPriority.HIGH, order.append, "high 1"),
+        executor.submit_with_priority(QueryPriority.HIGH, order.append, "high 2"),
+    ]
+    latency = executor.latency()
+    assert latency["high"]["queued"] == 2
+    assert latency["normal"]["queued"] == 1
+    assert latency["low"]["queued"] == 1
+
+    unblock.set()
+    for future in futures:
+        future.result(5)
+    assert order == ["high 1", "high 2", "normal", "low"]
+
+    latency = executor.latency()
+    assert latency["high"]["jobs"] == 2
+    assert latency["high"]["queued"] == 0
+    assert latency["high"]["max_wait"] > 0
+    # The job submitted without a priority is not counted
+    assert latency["normal"]["jobs"] == 1
+    assert latency["low"]["jobs"] == 1
+
+    executor.shutdown()
+    assert shutdown_hook_calls == 1
+    assert len(recorder_and_worker_thread_ids) == 1
@@ -717,6 +717,61 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+@pytest.mark.parametrize(("chunk_size", "max_chunks"), [(1, 1), (2, 1), (1, 3)])
+async def test_get_significant_states_page(
+    hass: HomeAssistant, chunk_size: int, max_chunks: int
+) -> None:
+    """Test reading the significant states in pages of chunks.
+
+    The states recorded at the same time by an entity continue in the
+    next page when the page ends between them.
+    """
+    zero, four, _states = record_states(hass)
+    with freeze_time(zero + timedelta(seconds=2)):
+        for state in ("1", "2", "3"):
+            hass.states.async_set("sensor.same_time", state)
+    await async_wait_recording_done(hass)
+
+    one_and_half = zero + timedelta(seconds=1.5)
+    entity_ids = ["media_player.test", "sensor.same_time", "thermostat.test"]
+    expected = history.get_significant_states(
+        hass,
+        one_and_half,
+        four,
+        entity_ids,
+        include_start_time_state=True,
+        compressed_state_format=True,
+    )
+    assert len(expected["sensor.same_time"]) == 3
+
+    states: dict[str, list[dict]] = {}
+    position: history.SignificantStatesPosition | None = None
+    pages = 0
+    while True:
+        chunks, position = history.get_significant_states_page(
+            hass,
+            one_and_half,
+            four,
+            entity_ids,
+            True,
+            True,
+            False,
+            False,
+            chunk_size,
+            max_chunks,
+            position,
+        )
+        pages += 1
+        assert len(chunks) <= max_chunks
+        for chunk in chunks:
+            for entity_id, entity_states in chunk.items():
+                states.setdefault(entity_id, []).extend(entity_states)
+        if position is None:
+            break
+    assert pages > 1
+    assert states == expected
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -25,7 +26,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -34,7 +35,7 @@ from homeassistant.components.recorder.services import (
 from homeassistant.components.recorder.tasks import PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -1996,3 +1997,156 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_slices_defer_unused_attributes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge stops after its time budget and checks unused ids once."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, repack=False, apply_filter=False)
+
+    with (
+        patch("homeassistant.components.recorder.purge.PURGE_SLICE_TIME_BUDGET", 0),
+        patch.object(instance, "max_bind_vars", 1),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+
+        # Each slice purges a single state
+        assert not purge_old_data(
+            instance, purge_before, repack=False, progress=progress
+        )
+        assert progress.slices == 1
+        assert progress.states == 1
+        assert states.count() == 5
+        # The attributes are only checked once all the states are purged
+        assert state_attributes.count() == 3
+        assert progress.attributes_ids
+
+        slices = 1
+        while not purge_old_data(
+            instance, purge_before, repack=False, progress=progress
+        ):
+            slices += 1
+            assert slices < 10
+
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert progress.states == 4
+        assert progress.attributes == 2
+        assert not progress.attributes_ids
+
+
+async def test_purge_with_other_parameters_keeps_unused_attributes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge started with other parameters checks the ids of the previous one."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=8)
+    progress = PurgeProgress(purge_before, repack=False, apply_filter=False)
+
+    with (
+        patch("homeassistant.components.recorder.purge.PURGE_SLICE_TIME_BUDGET", 0),
+        patch.object(instance, "max_bind_vars", 1),
+    ):
+        # Purge the states older than eight days, but stop
+        # before their attributes are checked
+        slices = 0
+        while progress.states < 2:
+            assert not purge_old_data(
+                instance, purge_before, repack=False, progress=progress
+            )
+            slices += 1
+            assert slices < 10
+        assert progress.attributes_ids
+        instance.purge_progress = progress
+
+        # A purge with other parameters replaces the progress
+        instance.queue_task(
+            PurgeTask(
+                dt_util.utcnow() - timedelta(days=4), repack=False, apply_filter=False
+            )
+        )
+        await async_wait_purge_done(hass, 10)
+
+    assert instance.purge_progress is None
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        # The attributes of the states purged by the previous purge are removed
+        assert session.query(StateAttributes).count() == 1
+
+
+async def test_purge_progress_is_saved(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the progress of a purge is saved and cleared once it finishes."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    saved: list[dict[str, Any] | None] = []
+    save_purge_progress = instance.async_save_purge_progress
+
+    @callback
+    def _save_purge_progress(stored: dict[str, Any] | None) -> None:
+        saved.append(stored)
+        save_purge_progress(stored)
+
+    with (
+        patch("homeassistant.components.recorder.purge.PURGE_SLICE_TIME_BUDGET", 0),
+        patch.object(instance, "max_bind_vars", 1),
+        patch.object(instance, "async_save_purge_progress", _save_purge_progress),
+        patch("homeassistant.components.recorder.core.PURGE_PROGRESS_SAVE_DELAY", 0),
+    ):
+        instance.queue_task(PurgeTask(purge_before, repack=False, apply_filter=False))
+        await async_wait_purge_done(hass, 10)
+        await hass.async_block_till_done()
+
+    assert instance.purge_progress is None
+    # A slice for each state, and one to purge the unused attributes
+    assert len(saved) == 5
+    assert [stored["states"] for stored in saved[:-1]] == [1, 2, 3, 4]
+    assert [stored["slices"] for stored in saved[:-1]] == [1, 2, 3, 4]
+    progress = PurgeProgress.from_stored_dict(saved[3])
+    assert progress.purge_before == purge_before
+    assert progress.attributes_ids == {1, 2}
+    assert saved[-1] is None
+    assert hass_storage["recorder.purge_progress"]["data"] == {"purge": None}
+
+
+async def test_purge_resumes_after_restart(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a purge that did not finish is resumed at startup."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, repack=True, apply_filter=False)
+    progress.slices = 3
+    progress.states = 1000
+    progress.attributes_ids = {1, 2}
+    hass_storage["recorder.purge_progress"] = {
+        "version": 1,
+        "key": "recorder.purge_progress",
+        "data": {"purge": progress.as_stored_dict()},
+    }
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as mock_purge:
+        instance = await async_setup_recorder_instance(hass)
+        await async_wait_purge_done(hass)
+
+    assert len(mock_purge.mock_calls) == 1
+    args, kwargs = mock_purge.call_args
+    assert args == (instance, purge_before, True, False)
+    assert kwargs["progress"].as_stored_dict() == progress.as_stored_dict()
+    assert instance.purge_progress is None
@@ -0,0 +1,246 @@
+"""Test the recorder spool."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import CONF_SPOOL
+from homeassistant.components.recorder.core import SPOOL_FLUSH_INTERVAL
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spool import EventSpool
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.common import async_fire_time_changed
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _state_changed_event(old_state: State | None, new_state: State) -> Event:
+    """Return a state changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": new_state.entity_id,
+            "old_state": old_state,
+            "new_state": new_state,
+        },
+        context=new_state.context,
+    )
+
+
+def test_spool_round_trip(tmp_path: Path) -> None:
+    """Test events read from the spool match the events appended."""
+    spool = EventSpool(str(tmp_path / "spool"))
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State("test.spool", "off", {"friendly_name": "Spool"})
+    new_state = State(
+        "test.spool", "on", {"friendly_name": "Spool", "count": 5}, context=context
+    )
+    events = [
+        _state_changed_event(old_state, new_state),
+        Event("test_event", {"value": [1, 2]}, EventOrigin.remote, context=context),
+    ]
+
+    assert spool.append(events) == 2
+    assert spool.pending == 2
+
+    read_events = spool.read(10)
+    assert spool.pending == 0
+    state_changed, event = read_events
+    assert event.as_dict() == events[1].as_dict()
+    assert state_changed.time_fired == events[0].time_fired
+    assert state_changed.context.as_dict() == context.as_dict()
+    assert state_changed.data["old_state"].as_dict() == old_state.as_dict()
+    assert state_changed.data["new_state"].as_dict() == new_state.as_dict()
+    assert spool.read(10) == []
+    assert list((tmp_path / "spool").iterdir()) == []
+
+
+def test_spool_segments(tmp_path: Path) -> None:
+    """Test events are read in order across segments."""
+    spool = EventSpool(str(tmp_path))
+    with patch("homeassistant.components.recorder.spool.SPOOL_SEGMENT_MAX_SIZE", 1):
+        for index in range(5):
+            spool.append([Event("test_event", {"index": index})])
+    assert len(list(tmp_path.iterdir())) == 5
+
+    assert [event.data["index"] for event in spool.read(3)] == [0, 1, 2]
+    assert len(list(tmp_path.iterdir())) == 3
+    assert spool.pending == 2
+    assert [event.data["index"] for event in spool.read(3)] == [3, 4]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_recovers_previous_run(tmp_path: Path) -> None:
+    """Test events spooled by a previous run are read first."""
+    spool = EventSpool(str(tmp_path))
+    spool.append([Event("test_event", {"index": 0}), Event("test_event", {"index": 1})])
+    segment = next(tmp_path.iterdir())
+    # Simulate a record that was partly written when Home Assistant stopped
+    with segment.open("ab") as segment_file:
+        segment_file.write(b"\xff\x00\x00\x00{")
+
+    spool = EventSpool(str(tmp_path))
+    spool.append([Event("test_event", {"index": 2})])
+    assert spool.pending == 3
+    assert [event.data["index"] for event in spool.read(10)] == [0, 1, 2]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_drops_events_that_cannot_be_serialized(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events that are not JSON serializable are not spooled."""
+    spool = EventSpool(str(tmp_path))
+    assert spool.append([Event("test_event", {"value": object()})]) == 0
+    assert spool.pending == 0
+    assert "Event is not JSON serializable, not spooled" in caplog.text
+
+
+async def test_recorder_spools_backlog_overflow(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spooled instead of dropped when the backlog overflows."""
+    hass.config.config_dir = str(tmp_path)
+    instance = await async_setup_recorder_instance(hass, {CONF_SPOOL: True})
+
+    with patch.object(instance, "_reached_max_backlog_percentage", return_value=True):
+        instance._async_check_queue()
+        assert instance.recording
+        assert "new events will be written to" in caplog.text
+
+        hass.states.async_set("test.spool", "one")
+        hass.states.async_set("test.spool", "two")
+        await hass.async_block_till_done()
+        assert instance.backlog == 0
+
+        freezer.tick(SPOOL_FLUSH_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+        assert instance._spool.pending == 0
+
+        # Spooling does not stop while the backlog is too large
+        freezer.tick(SPOOL_FLUSH_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert instance._spool_buffer is not None
+
+    freezer.tick(SPOOL_FLUSH_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert instance._spool_buffer is None
+    assert "events are no longer spooled" in caplog.text
+
+    hass.states.async_set("test.spool", "three")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.spool")
+            .order_by(States.last_updated_ts)
+        )
+        assert [db_state.state for db_state in db_states] == ["one", "two", "three"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[2].old_state_id == db_states[1].state_id
+
+
+async def test_recorder_spool_write_error(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the events that could not be written to the spool are written again."""
+    hass.config.config_dir = str(tmp_path)
+    instance = await async_setup_recorder_instance(hass, {CONF_SPOOL: True})
+
+    with patch.object(instance, "_reached_max_backlog_percentage", return_value=True):
+        instance._async_check_queue()
+        hass.states.async_set("test.spool", "one")
+        await hass.async_block_till_done()
+
+        with patch.object(
+            EventSpool, "append", side_effect=OSError("No space left on device")
+        ):
+            freezer.tick(SPOOL_FLUSH_INTERVAL)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            # The events are put back when the failed write is done
+            await hass.async_block_till_done()
+        assert (
+            "Error writing 1 events to the spool: No space left on device"
+            in caplog.text
+        )
+
+        hass.states.async_set("test.spool", "two")
+        await hass.async_block_till_done()
+        assert [event.data["new_state"].state for event in instance._spool_buffer] == [
+            "one",
+            "two",
+        ]
+
+        freezer.tick(SPOOL_FLUSH_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+        assert instance._spool_buffer == []
+        assert instance._spool.pending == 0
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.spool")
+            .order_by(States.last_updated_ts)
+        )
+        assert [db_state.state for db_state in db_states] == ["one", "two"]
+
+
+async def test_recorder_records_spool_of_previous_run(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test events spooled by a previous run are recorded at startup."""
+    hass.config.config_dir = str(tmp_path)
+    spool = EventSpool(hass.config.path(".recorder_spool"))
+    new_state = State("test.spool", "on", {"friendly_name": "Spool"})
+    await hass.async_add_executor_job(
+        spool.append, [_state_changed_event(None, new_state)]
+    )
+
+    await async_setup_recorder_instance(hass, {CONF_SPOOL: True})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_state = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.spool")
+            .one()
+        )
+        assert db_state.state == "on"
+        assert db_state.last_updated_ts == new_state.last_updated_timestamp
+    assert not any((tmp_path / ".recorder_spool").iterdir())
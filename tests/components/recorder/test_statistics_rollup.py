@@ -0,0 +1,194 @@
+"""Test the day, week and month rollups of the statistics."""
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance, migration
+from homeassistant.components.recorder.db_schema import (
+    StatisticsMeta,
+    StatisticsRollup,
+    StatisticsShortTerm,
+)
+from homeassistant.components.recorder.statistics import (
+    STATISTICS_ROLLUP_PERIODS,
+    _compile_hourly_statistics,
+    async_add_external_statistics,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done, statistics_during_period
+
+from tests.typing import RecorderInstanceGenerator
+
+START = datetime(2022, 10, 20, tzinfo=dt_util.UTC)
+STATISTIC_ID = "test:total_energy_import"
+METADATA = {
+    "has_mean": True,
+    "has_sum": True,
+    "name": "Total imported energy",
+    "source": "test",
+    "statistic_id": STATISTIC_ID,
+    "unit_of_measurement": "kWh",
+}
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _hourly_statistics(start: datetime, hours: int) -> list[dict[str, Any]]:
+    """Return hourly statistics with a mean and a sum."""
+    return [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "mean": hour % 7 + 0.1,
+            "min": hour % 5 - 3.3,
+            "max": hour % 11 + 2.2,
+            "state": hour % 13,
+            "sum": hour * 1.5,
+        }
+        for hour in range(hours)
+    ]
+
+
+def _statistics_during_period(
+    hass: HomeAssistant, period: str, use_rollup: bool, **kwargs: Any
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the statistics from the rollups or reduced from the hourly statistics."""
+    with patch.object(get_instance(hass), "statistics_rollup_ready", use_rollup):
+        return statistics_during_period(
+            hass, START - timedelta(days=1), period=period, **kwargs
+        )
+
+
+def _assert_rollup_matches_hourly(hass: HomeAssistant, **kwargs: Any) -> None:
+    """Assert the statistics from the rollups match the reduced hourly statistics."""
+    for period in STATISTICS_ROLLUP_PERIODS:
+        hourly = _statistics_during_period(hass, period, False, **kwargs)
+        assert hourly
+        assert _statistics_during_period(hass, period, True, **kwargs) == hourly
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+async def test_statistics_rollup(
+    hass: HomeAssistant, recorder_mock: Recorder, timezone: str
+) -> None:
+    """Test the rollups match the statistics reduced from the hourly statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    # Import the statistics in two parts, across a DST change
+    # and the end of the month
+    hourly = _hourly_statistics(START, 24 * 14)
+    async_add_external_statistics(hass, METADATA, hourly[100:])
+    await async_wait_recording_done(hass)
+    async_add_external_statistics(hass, METADATA, hourly[:100])
+    await async_wait_recording_done(hass)
+    assert get_instance(hass).statistics_rollup_ready
+
+    _assert_rollup_matches_hourly(hass)
+    _assert_rollup_matches_hourly(hass, types={"max", "sum"})
+    _assert_rollup_matches_hourly(hass, units={"energy": "Wh"}, types={"max", "sum"})
+    _assert_rollup_matches_hourly(hass, units={"energy": "Wh"})
+    _assert_rollup_matches_hourly(
+        hass, end_time=START + timedelta(days=5), statistic_ids={STATISTIC_ID}
+    )
+
+    days = _statistics_during_period(hass, "day", False)[STATISTIC_ID]
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsRollup).filter(
+            StatisticsRollup.period == STATISTICS_ROLLUP_PERIODS["day"]
+        ).count() == len(days)
+
+    recorder_mock.async_adjust_statistics(
+        STATISTIC_ID, START + timedelta(days=3), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollup_matches_hourly(hass)
+
+
+async def test_compile_hourly_statistics_rollup(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test compiled hourly statistics are added to the rollups."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    async_add_external_statistics(hass, METADATA, _hourly_statistics(START, 30))
+    await async_wait_recording_done(hass)
+
+    compile_start = START + timedelta(hours=30)
+    with session_scope(hass=hass) as session:
+        metadata_id = session.query(StatisticsMeta.id).scalar()
+        session.add_all(
+            StatisticsShortTerm.from_stats(metadata_id, stat)
+            for stat in _hourly_statistics(compile_start, 48)
+        )
+    # The hour that is compiled last is added before the
+    # last hour of its periods, so they are compiled again
+    for hour in [*range(5), *range(6, 48), 5]:
+        with session_scope(hass=hass) as session:
+            _compile_hourly_statistics(session, compile_start + timedelta(hours=hour))
+    _assert_rollup_matches_hourly(hass)
+
+
+async def test_statistics_rollup_time_zone_change(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the rollups are compiled again when the time zone changes."""
+    async_add_external_statistics(hass, METADATA, _hourly_statistics(START, 24 * 3))
+    await async_wait_recording_done(hass)
+
+    await hass.config.async_update(time_zone="Europe/Vienna")
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+    assert get_instance(hass).statistics_rollup_ready
+
+    _assert_rollup_matches_hourly(hass)
+    day_start = dt_util.start_of_local_day(START).timestamp()
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            session.query(StatisticsRollup)
+            .filter(StatisticsRollup.period == STATISTICS_ROLLUP_PERIODS["day"])
+            .order_by(StatisticsRollup.start_ts)
+            .first()
+            .start_ts
+            == day_start
+        )
+
+
+async def test_statistics_rollup_migration_batches(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the rollups are compiled in batches of statistics."""
+    statistic_ids = [f"test:total_energy_import_{i}" for i in range(5)]
+    for statistic_id in statistic_ids:
+        async_add_external_statistics(
+            hass,
+            {**METADATA, "statistic_id": statistic_id},
+            _hourly_statistics(START, 24 * 3),
+        )
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(migration, "STATISTICS_ROLLUP_BATCH_SIZE", 2),
+        patch.object(
+            migration,
+            "migrate_statistics_rollup",
+            wraps=migration.migrate_statistics_rollup,
+        ) as migrate_mock,
+    ):
+        await hass.config.async_update(time_zone="Europe/Vienna")
+        # Each batch queues the task of the next batch
+        for _ in range(5):
+            await async_wait_recording_done(hass)
+    assert get_instance(hass).statistics_rollup_ready
+
+    # Three batches of statistics, and one to find there are no more
+    assert [call.args[1] for call in migrate_mock.call_args_list] == [0, 2, 4, 5]
+    _assert_rollup_matches_hourly(hass, statistic_ids=set(statistic_ids))
@@ -16,7 +16,11 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, util
-from homeassistant.components.recorder.const import DOMAIN, SQLITE_URL_PREFIX
+from homeassistant.components.recorder.const import (
+    DOMAIN,
+    SQLITE_URL_PREFIX,
+    QueryPriority,
+)
 from homeassistant.components.recorder.db_schema import RecorderRuns
 from homeassistant.components.recorder.history.modern import (
     _get_single_entity_start_time_stmt,
@@ -28,6 +32,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.util import (
     end_incomplete_runs,
     is_second_sunday,
+    query_priority,
     resolve_period,
     session_scope,
 )
@@ -1048,3 +1053,15 @@ async def test_resolve_period(hass: HomeAssistant) -> None:
             }
         }
     ) == (now - timedelta(hours=1, minutes=25), now - timedelta(minutes=25))
+
+
+@pytest.mark.freeze_time(datetime(2022, 10, 21, 7, 25, tzinfo=UTC))
+def test_query_priority() -> None:
+    """Test the priority of queries depends on the period they span."""
+    now = dt_util.utcnow()
+    assert query_priority(now - timedelta(minutes=5), None) is QueryPriority.HIGH
+    assert query_priority(now - timedelta(hours=1), now) is QueryPriority.HIGH
+    assert query_priority(now - timedelta(hours=2), now) is QueryPriority.NORMAL
+    assert query_priority(now - timedelta(days=1), None) is QueryPriority.NORMAL
+    assert query_priority(now - timedelta(days=30), now) is QueryPriority.LOW
+    assert query_priority(None, now) is QueryPriority.LOW
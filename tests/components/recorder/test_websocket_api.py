@@ -13,6 +13,7 @@ import pytest
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     get_last_statistics,
@@ -2432,11 +2433,46 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge": None,
+        "read_pool": {
+            "size": 4,
+            "latency": {
+                "high": ANY,
+                "normal": ANY,
+                "low": ANY,
+            },
+        },
         "recording": True,
         "thread_running": True,
     }
 
 
+async def test_recorder_info_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of a running purge."""
+    client = await hass_ws_client()
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    progress = PurgeProgress(purge_before, repack=False, apply_filter=False)
+    progress.slices = 2
+    progress.states = 1000
+    progress.attributes = 10
+
+    with patch.object(recorder_mock, "purge_progress", progress):
+        await client.send_json_auto_id({"type": "recorder/info"})
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["purge"] == {
+        "purge_before": purge_before.isoformat(),
+        "started": progress.started.isoformat(),
+        "slices": 2,
+        "states": 1000,
+        "events": 0,
+        "state_attributes": 10,
+        "event_data": 0,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 import math
+import random
 from statistics import mean
 from typing import Literal
 from unittest.mock import patch
@@ -35,6 +36,10 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import (
+    _compile_vectorized_statistics,
+    _time_weighted_average,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -5265,3 +5270,113 @@ async def test_exclude_attributes(hass: HomeAssistant) -> None:
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def test_vectorized_statistics_match_time_weighted_average() -> None:
+    """Test the vectorized mean, min and max match the state by state results."""
+    rand = random.Random(42)
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    to_process = []
+    for index in range(50):
+        entity_id = f"sensor.test_{index}"
+        # Some entities only have a state from before the period
+        # and some only have a state at the end of the period
+        times = sorted(
+            start + timedelta(microseconds=rand.randint(-(10**8), 3 * 10**8))
+            for _ in range(rand.randint(1, 20))
+        )
+        if index % 10 == 0:
+            times = [end]
+        float_states = []
+        for time in times:
+            value = rand.uniform(-1000, 1000)
+            state = State(entity_id, str(value), last_updated=time)
+            if index % 7 == 0:
+                # States read from the database have the datetime of a
+                # timestamp that may be half a microsecond off
+                timestamp = time.timestamp() + 0.5e-6
+                state = State(
+                    entity_id,
+                    str(value),
+                    last_updated=dt_util.utc_from_timestamp(timestamp),
+                    last_updated_timestamp=timestamp,
+                )
+            float_states.append((value, state))
+        to_process.append((entity_id, "W", "measurement", float_states))
+
+    stats = _compile_vectorized_statistics(
+        to_process,
+        {entity_id: {"mean", "min", "max"} for entity_id, *_ in to_process},
+        {},
+        start,
+        end,
+    )
+
+    for entity_id, _, _, float_states in to_process:
+        assert stats[entity_id] == {
+            "start": start,
+            "mean": _time_weighted_average(float_states, start, end),
+            "min": min(value for value, _ in float_states),
+            "max": max(value for value, _ in float_states),
+        }
+
+
+def test_vectorized_statistics_total_increasing_sum() -> None:
+    """Test the sum is only compiled for sensors that keep increasing."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    last_reset = dt_util.utc_from_timestamp(0)
+
+    def _float_states(entity_id: str, values: list[float]) -> list:
+        return [
+            (value, State(entity_id, str(value), last_updated=start))
+            for value in values
+        ]
+
+    to_process = [
+        (entity_id, "kWh", state_class, _float_states(entity_id, values))
+        for entity_id, state_class, values in (
+            ("sensor.increasing", "total_increasing", [10, 12, 12, 15]),
+            ("sensor.dip", "total_increasing", [10, 9, 15]),
+            ("sensor.below_last_state", "total_increasing", [4, 5]),
+            ("sensor.negative", "total_increasing", [-1, 12]),
+            ("sensor.first_compile", "total_increasing", [10, 12]),
+            ("sensor.total", "total", [10, 12]),
+        )
+    ]
+    last_stats = {
+        entity_id: [
+            {
+                "start": start.timestamp(),
+                "end": end.timestamp(),
+                "last_reset": last_reset.timestamp(),
+                "state": 5.0,
+                "sum": 100.0,
+            }
+        ]
+        for entity_id, *_ in to_process
+        if entity_id != "sensor.first_compile"
+    }
+
+    stats = _compile_vectorized_statistics(
+        to_process,
+        {entity_id: {"sum"} for entity_id, *_ in to_process},
+        last_stats,
+        start,
+        end,
+    )
+
+    assert stats == {
+        "sensor.increasing": {
+            "start": start,
+            "last_reset": last_reset,
+            "state": 15.0,
+            "sum": 110.0,
+        },
+        "sensor.dip": {"start": start},
+        "sensor.below_last_state": {"start": start},
+        "sensor.negative": {"start": start},
+        "sensor.first_compile": {"start": start},
+        "sensor.total": {"start": start},
+    }
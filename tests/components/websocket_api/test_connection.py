@@ -131,3 +131,31 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_send_stream_message() -> None:
+    """Test the messages of a streamed response wait until they are written."""
+    send_messages: list[bytes] = []
+    wait_for_written = AsyncMock()
+    connection = websocket_api.ActiveConnection(
+        None,
+        Mock(data={websocket_api.DOMAIN: None}),
+        send_messages.append,
+        None,
+        Mock(),
+        wait_for_written,
+    )
+
+    # The response is not streamed
+    assert not await connection.async_send_stream_message(5, b"chunk")
+    assert send_messages == []
+
+    connection.subscriptions[5] = Mock()
+    assert await connection.async_send_stream_message(5, b"chunk")
+    assert send_messages == [b"chunk"]
+    assert wait_for_written.await_count == 1
+
+    # The client unsubscribes while the message is written
+    wait_for_written.side_effect = lambda: connection.subscriptions.pop(5)
+    assert not await connection.async_send_stream_message(5, b"chunk")
+    assert send_messages == [b"chunk", b"chunk"]
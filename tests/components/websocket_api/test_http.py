@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -252,6 +254,7 @@ async def test_pending_msg_peak(
     assert msg.type is WSMsgType.CLOSE
     assert "Client unable to keep up with pending messages" in caplog.text
     assert "Stayed over 5 for 5 seconds" in caplog.text
+    assert "queue peak of 10" in caplog.text
     assert "overload" in caplog.text
 
 
@@ -433,6 +436,150 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compress(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test enabling compressed messages."""
+    for idx in range(50):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"any": "attr" * 10})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESS_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    # Small messages are not compressed
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 2, "type": "pong"}
+
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    message = zlib.decompress(msg.data)
+    assert len(msg.data) < len(message) / 4
+    result = json_loads(message)
+    assert result["id"] == 3
+    assert len(result["result"]) == 50
+
+    # Large messages are compressed in the executor
+    with patch.object(http, "COMPRESS_MSG_EXECUTOR_SIZE", 0):
+        await websocket_client.send_json({"id": 4, "type": "get_states"})
+        msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    assert json_loads(zlib.decompress(msg.data))["result"] == result["result"]
+
+
+async def test_coalesce_window(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test messages are coalesced until the coalesce window ends."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_WINDOW: 50,
+                const.FEATURE_COALESCE_MAX_BYTES: 100,
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    for idx in range(3):
+        instance._send_message({"id": idx + 2, "type": "event"})
+        await asyncio.sleep(0)
+    msg = json_loads(await websocket_client.receive_str())
+    assert [message["id"] for message in msg] == [2, 3, 4]
+
+    # The messages are written before the end of the coalesce
+    # window once they are over the max bytes
+    with patch.object(instance._connection, "coalesce_window", 60):
+        for idx in range(3):
+            instance._send_message({"id": idx + 5, "type": "event", "data": "x" * 30})
+            await asyncio.sleep(0)
+        async with asyncio.timeout(5):
+            msg = json_loads(await websocket_client.receive_str())
+    assert [message["id"] for message in msg] == [5, 6]
+
+    metrics = instance.write_metrics
+    assert metrics.frames == 3
+    assert metrics.messages == 6
+    assert metrics.queue_peak == 3
+    assert metrics.messages_per_frame == 2
+
+
+async def test_wait_for_written(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting until the messages queued before the wait are written."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    # Nothing is waited for once the messages are written
+    await instance._async_wait_for_written()
+
+    instance._send_message({"id": 1, "type": "event"})
+    wait_task = hass.async_create_task(instance._async_wait_for_written())
+    instance._send_message({"id": 2, "type": "event"})
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+    assert instance._write_waiters[0][0] == instance._queued_count - 1
+
+    async with asyncio.timeout(5):
+        await wait_task
+    assert instance._written_count >= instance._queued_count - 1
+    assert (await websocket_client.receive_json())["id"] == 1
+    assert (await websocket_client.receive_json())["id"] == 2
+
+    # The waiters are released when the connection closes
+    instance._send_message({"id": 3, "type": "event"})
+    wait_task = hass.async_create_task(instance._async_wait_for_written())
+    await websocket_client.close()
+    async with asyncio.timeout(5):
+        await wait_task
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -67,6 +67,7 @@ from homeassistant.helpers import (
     config_entry_oauth2_flow,
     device_registry as dr,
     entity_registry as er,
+    event,
     floor_registry as fr,
     issue_registry as ir,
     label_registry as lr,
@@ -367,7 +368,25 @@ def verify_cleanup(
     if tasks:
         event_loop.run_until_complete(asyncio.wait(tasks))
 
-    for handle in event_loop._scheduled:  # type: ignore[attr-defined]
+    for handle in list(event_loop._scheduled):  # type: ignore[attr-defined]
+        if handle.cancelled():
+            continue
+        # The timer wheel schedules a handle for its earliest callback only
+        if isinstance(
+            wheel := getattr(handle._callback, "__self__", None), event._TimerWheel
+        ):
+            for entry in wheel.async_scheduled_entries():
+                with long_repr_strings():
+                    if expected_lingering_timers:
+                        _LOGGER.warning("Lingering timer after test %r", entry)
+                    elif entry.cancel_on_shutdown:
+                        continue
+                    elif entry.args and isinstance(job := entry.args[-1], HassJob):
+                        pytest.fail(f"Lingering timer after job {job!r}")
+                    else:
+                        pytest.fail(f"Lingering timer after test {entry!r}")
+                    entry.cancel()
+            continue
         if not handle.cancelled():
             with long_repr_strings():
                 if expected_lingering_timers:
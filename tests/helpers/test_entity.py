@@ -20,6 +20,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -41,6 +42,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -1707,6 +1709,54 @@ async def test_invalid_state(
     assert hass.states.get("test.test").state == "x" * 255
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the state of multiple entities in one pass."""
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.entity_id = f"test.test_{idx}"
+        ent.hass = hass
+        ent._attr_state = f"state_{idx}"
+        entities.append(ent)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    entity.async_write_ha_states(hass, entities)
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "test.test_0",
+        "test.test_1",
+        "test.test_2",
+    ]
+    states = [hass.states.get(f"test.test_{idx}") for idx in range(3)]
+    assert [state.state for state in states] == ["state_0", "state_1", "state_2"]
+    assert len({state.last_updated_timestamp for state in states}) == 1
+
+
+async def test_async_write_ha_states_invalid_state(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing multiple states falls back to unknown for invalid states."""
+    valid = entity.Entity()
+    valid.entity_id = "test.valid"
+    valid.hass = hass
+    valid._attr_state = "on"
+    invalid = entity.Entity()
+    invalid.entity_id = "test.invalid"
+    invalid.hass = hass
+    invalid._attr_state = "x" * 256
+
+    entity.async_write_ha_states(hass, [valid, invalid])
+
+    assert hass.states.get("test.valid").state == "on"
+    assert hass.states.get("test.invalid").state == STATE_UNKNOWN
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state for test.invalid, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+
+
 async def test_suggest_report_issue_built_in(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
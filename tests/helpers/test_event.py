@@ -3,7 +3,9 @@
 import asyncio
 from collections.abc import Callable
 import contextlib
+import contextvars
 from datetime import date, datetime, timedelta
+from functools import partial
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -15,14 +17,22 @@ import pytest
 
 from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TIME_PATTERN_SCHEDULES,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _TimerWheel,
     async_call_later,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -1136,6 +1146,72 @@ async def test_track_template_result_none(hass: HomeAssistant) -> None:
     assert wildercard_runs == [(None, 5), (5, 10)]
 
 
+async def test_track_template_result_shared_renders(hass: HomeAssistant) -> None:
+    """Test identical templates are rendered once for a state change."""
+    renders: list[str] = []
+    original_render_to_info = Template.async_render_to_info
+
+    def _render_to_info(self: Template, *args, **kwargs):
+        renders.append(self.template)
+        return original_render_to_info(self, *args, **kwargs)
+
+    results: dict[str, list[str]] = {}
+
+    def _async_track(name: str, template_str: str, variables=None) -> None:
+        results[name] = []
+
+        @ha.callback
+        def _run_callback(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            results[name].append(updates.pop().result)
+            if name == "first":
+                # Change a state used by the templates of the next trackers
+                hass.states.async_set("sensor.other", event.data["new_state"].state)
+
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), variables)],
+            _run_callback,
+        )
+
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.other", "0")
+    for name in ("one", "two", "three"):
+        _async_track(name, "{{ states('sensor.test') | int + 1 }}")
+    _async_track("five", "{{ states('sensor.test') | int + add }}", {"add": 5})
+    _async_track("six", "{{ states('sensor.test') | int + add }}", {"add": 6})
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template, "async_render_to_info", autospec=True, side_effect=_render_to_info
+    ):
+        hass.states.async_set("sensor.test", "2")
+        await hass.async_block_till_done()
+
+    assert results == {"one": [3], "two": [3], "three": [3], "five": [7], "six": [8]}
+    assert renders == [
+        "{{ states('sensor.test') | int + 1 }}",
+        "{{ states('sensor.test') | int + add }}",
+        "{{ states('sensor.test') | int + add }}",
+    ]
+
+    # A tracker that changes a state used by a shared render
+    # makes the trackers after it render the template again
+    template_str = "{{ states('sensor.test') }}-{{ states('sensor.other') }}"
+    for name in ("first", "second", "third"):
+        _async_track(name, template_str)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "3")
+    await hass.async_block_till_done()
+
+    assert results["first"] == ["3-0", "3-3"]
+    assert results["second"][-1] == "3-3"
+    assert results["third"][-1] == "3-3"
+
+
 async def test_track_template_result_super_template(hass: HomeAssistant) -> None:
     """Test tracking template with super template listening to same entity."""
     specific_runs = []
@@ -3928,6 +4004,46 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_schedule(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks with the same pattern share the next times it matches."""
+    runs: set[tuple[int, int]] = set()
+
+    @callback
+    def action(idx: int, now: datetime) -> None:
+        runs.add((idx, now.minute))
+
+    now = dt_util.utcnow()
+    start = datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC)
+    freezer.move_to(start)
+
+    with patch(
+        "homeassistant.util.dt.find_next_time_expression_time",
+        wraps=dt_util.find_next_time_expression_time,
+    ) as find_next_time_mock:
+        unsubs = [
+            async_track_utc_time_change(
+                hass, partial(action, idx), minute="/5", second=0
+            )
+            for idx in range(10)
+        ]
+        for minutes in (0, 5, 10):
+            async_fire_time_changed(
+                hass, start + timedelta(seconds=5, minutes=minutes, microseconds=999999)
+            )
+            await hass.async_block_till_done()
+        assert find_next_time_mock.call_count == 32
+
+    assert runs == {(idx, minute) for minute in (0, 5, 10) for idx in range(10)}
+
+    for unsub in unsubs:
+        unsub()
+    unsubs[0]()
+    assert not hass.data[_TIME_PATTERN_SCHEDULES]
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -4460,6 +4576,111 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_later_many(hass: HomeAssistant) -> None:
+    """Test many actions are called in order with one event loop callback."""
+    calls: list[int] = []
+
+    @callback
+    def action(idx: int, _: datetime) -> None:
+        calls.append(idx)
+
+    def wheel_handles() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in hass.loop._scheduled
+            if not handle.cancelled()
+            and isinstance(getattr(handle._callback, "__self__", None), _TimerWheel)
+        ]
+
+    cancels = [
+        async_call_later(hass, 1 + idx % 10 / 10, partial(action, idx))
+        for idx in range(100)
+    ]
+    assert len(handles := wheel_handles()) == 1
+    assert handles[0].when() == pytest.approx(hass.loop.time() + 1, abs=0.1)
+
+    # Cancel the earliest action and an action that is due later
+    cancels[0]()
+    cancels[55]()
+    cancels[0]()
+    assert len(handles := wheel_handles()) == 1
+    assert handles[0].when() == pytest.approx(hass.loop.time() + 1, abs=0.1)
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=1.45))
+    await hass.async_block_till_done()
+    assert calls == [
+        idx for delay in range(5) for idx in range(delay, 100, 10) if idx != 0
+    ]
+
+    calls.clear()
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert calls == [
+        idx for delay in range(5, 10) for idx in range(delay, 100, 10) if idx != 55
+    ]
+    assert all(handle.when() > hass.loop.time() + 10 for handle in wheel_handles())
+
+
+async def test_async_call_later_cancel_on_shutdown(hass: HomeAssistant) -> None:
+    """Test the actions cancelled on shutdown are cancelled when integrations stop."""
+    calls: list[str] = []
+    calls_during_shutdown_job: list[str] = []
+
+    @callback
+    def action(name: str, _: datetime) -> None:
+        calls.append(name)
+
+    @callback
+    def shutdown_job() -> None:
+        # The actions are still scheduled while the shutdown jobs run
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        calls_during_shutdown_job.extend(calls)
+
+    async_call_later(
+        hass,
+        5,
+        HassJob(partial(action, "early"), cancel_on_shutdown=True),
+    )
+    async_call_later(
+        hass,
+        10,
+        HassJob(partial(action, "cancelled"), cancel_on_shutdown=True),
+    )
+    async_call_later(hass, 20, partial(action, "kept"))
+    hass.async_add_shutdown_job(HassJob(shutdown_job))
+
+    await hass.async_stop()
+    assert calls_during_shutdown_job == ["early"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert calls == ["early", "kept"]
+
+
+async def test_async_call_later_context_and_fire_all(hass: HomeAssistant) -> None:
+    """Test actions are called in the context they were scheduled from."""
+    var: contextvars.ContextVar[int] = contextvars.ContextVar("var", default=0)
+    calls: list[tuple[int, int]] = []
+
+    @callback
+    def action(idx: int, _: datetime) -> None:
+        calls.append((idx, var.get()))
+
+    async def schedule(idx: int) -> None:
+        var.set(idx)
+        async_call_later(hass, 10 + idx, partial(action, idx))
+
+    for idx in range(1, 4):
+        await hass.async_create_task(schedule(idx))
+
+    # Every action is called, even the actions that are not due yet
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=1), fire_all=True
+    )
+    await hass.async_block_till_done()
+    assert calls == [(1, 1), (2, 2), (3, 3)]
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
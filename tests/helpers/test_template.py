@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -21,6 +22,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -5127,6 +5129,109 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_templates_kept_across_restarts(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test templates compiled by the previous run are not compiled again."""
+    template_string = "{{ '23' | float * 2 }}"
+    await template.async_load_compiled_templates(hass)
+    assert template.Template(template_string, hass).async_render() == 46
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow()
+        + timedelta(seconds=template.COMPILED_TEMPLATES_SAVE_DELAY + 1),
+        fire_all=True,
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.COMPILED_TEMPLATES_STORAGE_KEY]["data"]
+    assert len(data["templates"]) == 1
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_compiled_templates(hass)
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as compile_mock:
+        assert template.Template(template_string, hass).async_render() == 46
+        assert compile_mock.call_count == 0
+
+        # The templates are compiled again in another time zone
+        hass.data.pop(template._ENVIRONMENT)
+        await hass.config.async_set_time_zone("America/New_York")
+        assert template.Template(template_string, hass).async_render() == 46
+        assert compile_mock.call_count == 1
+
+        # The compiled templates are discarded after an upgrade
+        hass.data.pop(template._ENVIRONMENT)
+        data["versions"] = "old"
+        await template.async_load_compiled_templates(hass)
+        assert template.Template(template_string, hass).async_render() == 46
+        assert compile_mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("template_string", "fast_render"),
+    [
+        ("{{ states('sensor.power') | float * 2 }}", True),
+        ("{{ states('sensor.power', with_unit=True) }}", True),
+        ("{{ states('sensor.missing') | float }}", True),
+        ("{{ states('sensor.missing') | float(-1) | round(1) }}", True),
+        ("{{ is_state('binary_sensor.motion', 'on') }}", True),
+        ("{{ not is_state('binary_sensor.motion', ['on', 'off']) }}", True),
+        ("{{ state_attr('sensor.power', 'friendly_name') }}", True),
+        ("{{ is_state_attr('sensor.power', 'friendly_name', 'Power') }}", True),
+        ("{{ has_value('sensor.power') and has_value('sensor.missing') }}", True),
+        ("{{ 0 < states('sensor.power') | float < 10 }}", True),
+        ("{{ 'on' if states('sensor.power') | int(0) // 3 == 4 else 'off' }}", True),
+        ("Power: {{ states('sensor.power') }} {{ -1.5 }}", True),
+        ("{{ states('sensor.power') | float / 0 }}", True),
+        ("{{ states.sensor.power.state }}", False),
+        ("{{ states('sensor.power') | float * factor }}", False),
+        ("{% if is_state('binary_sensor.motion', 'on') %}on{% endif %}", False),
+    ],
+)
+async def test_fast_render(
+    hass: HomeAssistant, template_string: str, fast_render: bool
+) -> None:
+    """Test simple templates render the same with and without Jinja."""
+    hass.states.async_set(
+        "sensor.power",
+        "12.34",
+        {"friendly_name": "Power", "unit_of_measurement": "W"},
+    )
+    hass.states.async_set("binary_sensor.motion", "on")
+    variables = {"factor": 2}
+
+    jinja_template = template.Template(template_string, hass)
+    jinja_template.ensure_valid()
+    with patch(
+        "homeassistant.helpers.template._compile_fast_render", return_value=None
+    ):
+        jinja_info = jinja_template.async_render_to_info(variables)
+    fast_template = template.Template(template_string, hass)
+    fast_info = fast_template.async_render_to_info(variables)
+
+    assert (fast_template._fast_render is not None) is fast_render
+    assert str(fast_info.exception) == str(jinja_info.exception)
+    for attr in ("_result", "entities", "domains", "all_states", "rate_limit"):
+        assert getattr(fast_info, attr) == getattr(jinja_info, attr)
+
+
+async def test_fast_render_variables_replace_functions(hass: HomeAssistant) -> None:
+    """Test variables named like the functions used by the fast path are used."""
+    hass.states.async_set("sensor.power", "2")
+    tpl = template.Template("{{ states('sensor.power') | float * 2 }}", hass)
+    assert tpl.async_render() == 4
+    assert tpl._fast_render is not None
+    assert tpl.async_render({"states": lambda entity_id: "5"}) == 10
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
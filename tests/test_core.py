@@ -14,7 +14,7 @@ from tempfile import TemporaryDirectory
 import threading
 import time
 from typing import Any
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1160,6 +1160,98 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners are routed by event data key."""
+    calls = []
+    filtered_calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filtered_listener(event):
+        """Mock filtered listener."""
+        filtered_calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.bedroom"], listener
+    )
+    unsub_filtered = hass.bus.async_listen_keyed(
+        "test", "entity_id", "light.kitchen", filtered_listener, mock_filter
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom", "filtered": False})
+    hass.bus.async_fire("test", {"entity_id": "light.other", "filtered": False})
+    hass.bus.async_fire("test", {"entity_id": ["unhashable"], "filtered": False})
+    hass.bus.async_fire("test", {"filtered": False})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert filtered_calls == []
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert len(filtered_calls) == 1
+
+    unsub()
+    unsub_filtered()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert len(filtered_calls) == 1
+
+
+async def test_eventbus_keyed_listener_state_reported(hass: HomeAssistant) -> None:
+    """Test keyed listeners for state reported also get state changed events."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        EVENT_STATE_REPORTED, "entity_id", "light.kitchen", listener
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in calls] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_REPORTED,
+    ]
+
+    unsub()
+    assert EVENT_STATE_REPORTED not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test keyed listeners can not listen to all events."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", "light.kitchen", Mock())
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1555,6 +1647,158 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.reported", "on")
+    old_bowl = hass.states.get("light.bowl")
+    old_reported = hass.states.get("light.reported")
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    state_reported_events = []
+
+    @callback
+    def listener(event: ha.Event) -> None:
+        state_reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, event_filter=callback(lambda _: True)
+    )
+
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.bowl", "off", {"brightness": 100}),
+            ha.StateWrite("Light.New", "on"),
+            ha.StateWrite("light.reported", "on"),
+            ha.StateWrite("light.new", "off"),
+        ],
+        timestamp=1700000000.0,
+    )
+    await hass.async_block_till_done()
+
+    bowl = hass.states.get("light.bowl")
+    new = hass.states.get("light.new")
+    assert bowl.state == "off"
+    assert bowl.attributes is old_bowl.attributes
+    assert new.state == "off"
+    assert bowl.last_updated_timestamp == 1700000000.0
+    assert new.last_updated_timestamp == 1700000000.0
+    assert bowl.context is new.context
+    assert hass.states.get("light.reported").last_reported_timestamp == 1700000000.0
+
+    assert [
+        (event.data["entity_id"], event.data["old_state"], event.data["new_state"])
+        for event in state_changed_events
+    ] == [
+        ("light.bowl", old_bowl, bowl),
+        ("light.new", None, ANY),
+        ("light.new", state_changed_events[1].data["new_state"], new),
+    ]
+    assert state_changed_events[1].data["new_state"].state == "on"
+    assert [event.event_type for event in state_reported_events] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_REPORTED,
+        EVENT_STATE_CHANGED,
+    ]
+    assert state_reported_events[2].data["new_state"] is old_reported
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test no states are written if a state in the batch is invalid."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ha.StateWrite("light.bowl", "off"),
+                ha.StateWrite("light.invalid", "x" * 256),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.invalid") is None
+    assert len(events) == 0
+
+
+async def test_statemachine_compact_storage(hass: HomeAssistant) -> None:
+    """Test compact storage shares identical attributes between states."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    assert (
+        hass.states.get("sensor.one").attributes
+        is not hass.states.get("sensor.two").attributes
+    )
+
+    hass.states.async_set_compact_storage(True)
+    assert (
+        hass.states.get("sensor.one").attributes
+        is hass.states.get("sensor.two").attributes
+    )
+
+    hass.states.async_set("sensor.three", "3", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.four", "4", {"unit_of_measurement": "kW"})
+    hass.states.async_set("sensor.five", "5", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.six", "6", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.seven", "7", {"value": 1})
+    hass.states.async_set("sensor.eight", "8", {"value": True})
+
+    one = hass.states.get("sensor.one")
+    assert hass.states.get("sensor.three").attributes is one.attributes
+    assert hass.states.get("sensor.four").attributes == {"unit_of_measurement": "kW"}
+    assert hass.states.get("sensor.five").attributes == {"options": ["a", "b"]}
+    assert hass.states.get("sensor.six").attributes == {"options": ["a", "b"]}
+    assert hass.states.get("sensor.seven").attributes["value"] is not True
+    assert hass.states.get("sensor.eight").attributes["value"] is True
+    assert isinstance(one.attributes, ReadOnlyDict)
+
+    hass.states.async_set_compact_storage(False)
+    hass.states.async_set("sensor.nine", "9", {"unit_of_measurement": "W"})
+    assert hass.states.get("sensor.nine").attributes is not one.attributes
+
+
+async def test_statemachine_release_encodings(hass: HomeAssistant) -> None:
+    """Test releasing the cached encodings of states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    as_dict_json = state.as_dict_json
+    as_compressed_state_json = state.as_compressed_state_json
+
+    assert hass.states.async_release_encodings() == len(as_dict_json) + len(
+        as_compressed_state_json
+    )
+    assert hass.states.async_release_encodings() == 0
+
+    assert state.as_dict_json == as_dict_json
+    assert state.as_dict_json is not as_dict_json
+    assert state.as_compressed_state_json == as_compressed_state_json
+
+
+async def test_statemachine_memory_usage(hass: HomeAssistant) -> None:
+    """Test estimating the memory used by the states."""
+    assert hass.states.async_memory_usage() == {
+        "entities": 0,
+        "unique_attributes": 0,
+        "state_bytes": 0,
+        "attributes_bytes": 0,
+        "encoded_bytes": 0,
+        "bytes_per_entity": 0,
+    }
+
+    hass.states.async_set_compact_storage(True)
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    usage = hass.states.async_memory_usage()
+    assert usage["entities"] == 2
+    assert usage["unique_attributes"] == 1
+    assert usage["encoded_bytes"] == 0
+    assert usage["bytes_per_entity"] > 0
+
+    hass.states.get("sensor.one").as_dict_json  # noqa: B018
+    assert hass.states.async_memory_usage()["encoded_bytes"] > 0
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -0,0 +1,45 @@
+"""Test the glob pattern index."""
+
+from fnmatch import fnmatchcase
+
+import pytest
+
+from homeassistant.util.glob_index import GlobIndex, literal_prefix
+
+
+@pytest.mark.parametrize(
+    ("pattern", "prefix"),
+    [
+        ("flume-gw-*", "flume-gw-"),
+        ("esp_??????", "esp_"),
+        ("[ba][lk]*", ""),
+        ("*", ""),
+        ("exact", "exact"),
+    ],
+)
+def test_literal_prefix(pattern: str, prefix: str) -> None:
+    """Test the literal prefix of a pattern is the part before the first wildcard."""
+    assert literal_prefix(pattern) == prefix
+
+
+def test_glob_index() -> None:
+    """Test the index matches the same patterns as fnmatch in the order they were added."""
+    patterns = [
+        "lutron-*",
+        "*",
+        "lut*",
+        "[ba][lk]*",
+        "esp_??????",
+        "exact",
+        "lutron-0012*",
+        "LUT*",
+    ]
+    index: GlobIndex[str] = GlobIndex()
+    for pattern in patterns:
+        index.add(pattern, pattern)
+    assert len(index) == len(patterns)
+
+    for name in ("lutron-001234", "blink", "esp_ab12cd", "exact", "exactly", "", "LUT"):
+        assert index.match(name) == [
+            pattern for pattern in patterns if fnmatchcase(name, pattern)
+        ]